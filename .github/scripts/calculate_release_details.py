@@ -2,10 +2,27 @@
 import os
 import re
 import subprocess
+import sys
 import json
 import glob
 from datetime import datetime
 
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, os.path.join(os.getcwd(), "scripts"))
+
+import version_manager
+
+try:
+    import generate_changelog
+except ImportError:
+    generate_changelog = None
+
+# Commits listed in the changelog of a first release without any tag
+FIRST_RELEASE_MAX_COMMITS = 2000
+
+BREAKING_RE = re.compile(r"\bBREAKING CHANGE\b|\bBREAKING:\b|^[a-zA-Z]+!:")
+
 
 def run_git(args):
     try:
@@ -18,6 +35,47 @@ def run_git(args):
         return ""
 
 
+def read_commits(rev_range):
+    """Return (hash, short hash, author, subject, body) of every commit in range.
+
+    One git log call with NUL-terminated records serves the commit count,
+    the breaking change scan and the changelog.
+    """
+    try:
+        out = subprocess.check_output(
+            [
+                "git",
+                "log",
+                "-z",
+                "--pretty=format:%H%x1f%h%x1f%an%x1f%s%x1f%B",
+                rev_range,
+            ],
+            stderr=subprocess.DEVNULL,
+        ).decode("utf-8", errors="ignore")
+    except subprocess.CalledProcessError:
+        return []
+    commits = []
+    for record in out.split("\0"):
+        if not record:
+            continue
+        fields = record.split("\x1f", 4)
+        fields += [""] * (5 - len(fields))
+        full_hash, short_hash, author, subject, body = fields
+        commits.append(
+            (full_hash.strip(), short_hash, author.strip(), subject.strip(), body)
+        )
+    return commits
+
+
+def list_tags():
+    """Return all tags of the repository, newest version first."""
+    return [
+        t.strip()
+        for t in run_git(["tag", "-l", "--sort=-v:refname"]).splitlines()
+        if t.strip()
+    ]
+
+
 def main():
     rtype = os.environ.get("RELEASE_TYPE", "beta")
     bump_level = os.environ.get("BUMP_LEVEL", "patch")
@@ -55,23 +113,16 @@ def main():
                 else f"https://github.com/faserf/{repo_name}"
             )
 
-    # Calculate version via version_manager
-    bump_args = [
-        "python",
-        ".github/scripts/version_manager.py",
-        "bump",
-        "--type",
+    # One tag listing serves the version bump and the changelog range
+    all_tags = list_tags()
+
+    # Calculate the version in-process; the manifest is written by sync-version
+    version = version_manager.calculate_version(
         rtype,
-        "--level",
         bump_level,
-    ]
-    if version_override and version_override.strip():
-        bump_args += ["--override", version_override.strip()]
-
-    version = subprocess.check_output(bump_args).decode("utf-8").strip()
-
-    # Revert version bump change in manifest file (since versioning job only calculates it, sync-version actually writes it)
-    run_git(["checkout", "--", manifest_path])
+        curr=version_manager.get_current_version(manifest_path, tags=all_tags),
+        override=version_override.strip() or None,
+    )
 
     print(f"Calculated Version: {version}")
     tag = f"v{version}"
@@ -86,9 +137,8 @@ def main():
     changelog_from = ""
     changelog_label = "initial release — full history"
 
-    # Get sorted list of tags
-    tags_raw = run_git(["tag", "-l", "[0-9]*", "v[0-9]*", "--sort=-v:refname"])
-    tags = [t.strip() for t in tags_raw.splitlines() if t.strip()]
+    # Release tags (matching [0-9]* or v[0-9]*), newest version first
+    tags = [t for t in all_tags if re.match(r"^v?\d", t)]
     latest_tag = ""
     for t in tags:
         if re.match(r"^v?\d+\.\d+\.\d+(?:(?:b|-dev|-nightly)\d+)?$", t):
@@ -121,34 +171,27 @@ def main():
 
     print(f"Changelog range start tag: '{changelog_from}' ({changelog_label})")
 
-    # Count commits
-    total_commit_count = 0
-    count_range = f"{changelog_from}..HEAD" if changelog_from else "HEAD"
-
-    commit_count_raw = run_git(["rev-list", "--count", count_range])
-    if commit_count_raw.isdigit():
-        total_commit_count = int(commit_count_raw)
+    # The commits of the release range, read once
+    diff_range = f"{changelog_from}..HEAD" if changelog_from else "HEAD"
+    commits = read_commits(diff_range)
+    total_commit_count = len(commits)
 
     # Generate Changelog
     changelog_md = ""
-    if os.path.exists("scripts/generate_changelog.py"):
+    if generate_changelog is not None:
         try:
-            changelog_md = (
-                subprocess.check_output(
-                    [
-                        "python",
-                        "scripts/generate_changelog.py",
-                        "--from-tag",
-                        changelog_from,
-                        "--total-commits",
-                        str(total_commit_count),
-                        "--repo",
-                        repo,
-                    ]
-                )
-                .decode("utf-8")
-                .strip()
-            )
+            records = [commit[:4] for commit in commits]
+            if not changelog_from:
+                records = records[:FIRST_RELEASE_MAX_COMMITS]
+            changelog_md = generate_changelog.generate_changelog(
+                records,
+                changelog_from,
+                total_commit_count,
+                repo,
+                generate_changelog.ClassificationCache(
+                    os.environ.get("CHANGELOG_CACHE", generate_changelog.DEFAULT_CACHE)
+                ),
+            ).strip()
         except Exception:
             changelog_md = (
                 "_Changelog could not be generated automatically. See commit history._"
@@ -169,7 +212,6 @@ def main():
     )
 
     # Analyze diff impact
-    diff_range = f"{changelog_from}..HEAD" if changelog_from else "HEAD"
     changed_files_raw = run_git(["diff", "--name-only", diff_range])
     changed_files = [f.strip() for f in changed_files_raw.splitlines() if f.strip()]
 
@@ -192,11 +234,12 @@ def main():
         elif f.startswith("docs/") or f.endswith(".md"):
             docs_count += 1
 
-    breaking_count = 0
-    log_msgs = run_git(["log", diff_range, "--format=%B"])
-    for msg in log_msgs.split("\n"):
-        if re.search(r"\bBREAKING CHANGE\b|\bBREAKING:\b|^[a-zA-Z]+!:", msg):
-            breaking_count += 1
+    breaking_count = sum(
+        1
+        for commit in commits
+        for line in commit[4].split("\n")
+        if BREAKING_RE.search(line)
+    )
 
     # Determine Risk Severity
     severity = "Low"
@@ -2,67 +2,213 @@
 import os
 import re
 import sys
+import threading
+import time
+import urllib.error
 import urllib.request
 import json
+from concurrent.futures import Future, wait
+from typing import NamedTuple
 
+HEADERS = {"User-Agent": "Mozilla/5.0"}
 
-def get_latest_ha_version():
-    try:
-        url = "https://pypi.org/pypi/homeassistant/json"
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=5) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            return data["info"]["version"]
-    except Exception as e:
-        print(f"Error fetching HA version: {e}")
-        return "2026.6.2"
+# Overall time for all version lookups together
+FETCH_DEADLINE = 10.0
+# Answers younger than this are used without asking the server again
+CACHE_TTL = 6 * 3600
+CACHE_FILE = os.path.join(".cache", "upstream_versions.json")
 
 
-def get_service_version(repo_name):
-    headers = {"User-Agent": "Mozilla/5.0"}
+class VersionSource(NamedTuple):
+    label: str
+    url: str
+    extract: object
+    fallback: str
 
-    if repo_name == "ha-openwrt":
-        try:
-            req = urllib.request.Request(
-                "https://sysupgrade.openwrt.org/api/v1/latest", headers=headers
+
+HA_SOURCE = VersionSource(
+    "HA",
+    "https://pypi.org/pypi/homeassistant/json",
+    lambda data: data["info"]["version"],
+    "2026.6.2",
+)
+
+SERVICE_SOURCES = {
+    "ha-openwrt": VersionSource(
+        "OpenWrt",
+        "https://sysupgrade.openwrt.org/api/v1/latest",
+        lambda data: data["latest"][0],
+        "25.12.4",
+    ),
+    "hass-valetudo": VersionSource(
+        "Valetudo",
+        "https://api.github.com/repos/Hypfer/Valetudo/releases/latest",
+        lambda data: data["tag_name"].lstrip("v"),
+        "2026.6.0",
+    ),
+    "ha-NintendoSwitchCFW": VersionSource(
+        "Atmosphere",
+        "https://api.github.com/repos/Atmosphere-NX/Atmosphere/releases/latest",
+        lambda data: data["tag_name"].lstrip("v"),
+        "1.8.0",
+    ),
+}
+
+
+class FetchResult(NamedTuple):
+    status: int
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+
+
+def urllib_fetch(url, headers, timeout):
+    """Fetch a URL; a 304 Not Modified answer is returned, not raised."""
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return FetchResult(
+                response.status,
+                response.read(),
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
             )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                return data["latest"][0]
-        except Exception as e:
-            print(f"Error fetching OpenWrt version: {e}")
-            return "25.12.4"
-
-    elif repo_name == "hass-valetudo":
-        try:
-            req = urllib.request.Request(
-                "https://api.github.com/repos/Hypfer/Valetudo/releases/latest",
-                headers=headers,
+    except urllib.error.HTTPError as err:
+        if err.code == 304:
+            return FetchResult(
+                304, b"", err.headers.get("ETag"), err.headers.get("Last-Modified")
             )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                return data["tag_name"].lstrip("v")
-        except Exception as e:
-            print(f"Error fetching Valetudo version: {e}")
-            return "2026.6.0"
-
-    elif repo_name == "ha-NintendoSwitchCFW":
+        raise
+
+
+class VersionCache:
+    """Version answers on disk, keyed by URL, with their validators."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.entries = {}
+        if not path:
+            return
         try:
-            req = urllib.request.Request(
-                "https://api.github.com/repos/Atmosphere-NX/Atmosphere/releases/latest",
-                headers=headers,
-            )
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode("utf-8"))
-                return data["tag_name"].lstrip("v")
-        except Exception as e:
-            print(f"Error fetching Atmosphere version: {e}")
-            return "1.8.0"
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+
+
+def _lookup(fetch, source, entry, timeout):
+    headers = dict(HEADERS)
+    if entry:
+        # Conditional request: the server answers 304 if nothing changed
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    result = fetch(source.url, headers, timeout)
+    if result.status == 304 and entry:
+        value = entry["value"]
+    else:
+        value = source.extract(json.loads(result.body.decode("utf-8")))
+    return {
+        "value": value,
+        "etag": result.etag or (entry or {}).get("etag"),
+        "last_modified": result.last_modified or (entry or {}).get("last_modified"),
+        "fetched": time.time(),
+    }
+
+
+def _start_lookup(fetch, source, entry, deadline_at):
+    """Run a lookup in a daemon thread that gets the time left until deadline_at.
+
+    A daemon thread never keeps the script alive after the deadline, and the
+    request itself times out once the deadline has passed.
+    """
+    future = Future()
+
+    def _run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            timeout = deadline_at - time.monotonic()
+            if timeout <= 0:
+                raise TimeoutError("deadline passed before the request")
+            future.set_result(_lookup(fetch, source, entry, timeout))
+        except Exception as err:  # re-raised by future.result()
+            future.set_exception(err)
+
+    threading.Thread(target=_run, name=f"lookup {source.label}", daemon=True).start()
+    return future
+
+
+def fetch_versions(
+    sources, fetch=urllib_fetch, cache=None, deadline=FETCH_DEADLINE, ttl=CACHE_TTL
+):
+    """Return the version of every source, looked up concurrently.
+
+    Fresh cached answers are used as they are; the others are fetched in
+    parallel, conditionally if a cached answer exists. Whatever is not
+    answered within the deadline falls back to the cached (even stale)
+    answer or to the source's fallback version.
+    """
+    cache = cache if cache is not None else VersionCache(None)
+    versions = {}
+    pending = {}
+    now = time.time()
+    deadline_at = time.monotonic() + deadline
+    for name, source in sources.items():
+        entry = cache.entries.get(source.url)
+        if entry and now - entry.get("fetched", 0) < ttl:
+            versions[name] = entry["value"]
+            continue
+        pending[name] = _start_lookup(fetch, source, entry, deadline_at)
+
+    done, _not_done = wait(
+        pending.values(), timeout=max(deadline_at - time.monotonic(), 0)
+    )
+
+    for name, future in pending.items():
+        source = sources[name]
+        entry = cache.entries.get(source.url)
+        error = None
+        if future not in done:
+            error = f"no answer within {deadline:g} s"
+        elif future.exception() is not None:
+            error = future.exception()
+        if error is None:
+            cache.entries[source.url] = future.result()
+            versions[name] = future.result()["value"]
+            continue
+        print(f"Error fetching {source.label} version: {error}")
+        versions[name] = entry["value"] if entry else source.fallback
+
+    cache.save()
+    return versions
+
+
+def get_latest_ha_version(fetch=urllib_fetch, cache=None):
+    return fetch_versions({"ha": HA_SOURCE}, fetch, cache)["ha"]
+
 
-    return None
+def get_service_version(repo_name, fetch=urllib_fetch, cache=None):
+    if repo_name not in SERVICE_SOURCES:
+        return None
+    return fetch_versions({"service": SERVICE_SOURCES[repo_name]}, fetch, cache)[
+        "service"
+    ]
 
 
-def clean_and_update_template(file_path, integration_version, ha_version, repo_name):
+def clean_and_update_template(
+    file_path, integration_version, ha_version, repo_name, service_version=None
+):
     if not os.path.exists(file_path):
         return False
 
@@ -91,7 +237,6 @@ def clean_and_update_template(file_path, integration_version, ha_version, repo_n
     )
 
     # 3. Update Service/Firmware Version placeholders dynamically if relevant
-    service_version = get_service_version(repo_name)
     if service_version:
         if repo_name == "ha-openwrt":
             content = re.sub(
@@ -201,10 +346,16 @@ if __name__ == "__main__":
     if not version.startswith("v") and "." in version:
         version = "v" + version
 
-    ha_version = get_latest_ha_version()
     repo_name = os.path.basename(
         os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     )
+    # All upstream versions are looked up once, concurrently
+    sources = {"ha": HA_SOURCE}
+    if repo_name in SERVICE_SOURCES:
+        sources["service"] = SERVICE_SOURCES[repo_name]
+    versions = fetch_versions(sources, cache=VersionCache())
+    ha_version = versions["ha"]
+    service_version = versions.get("service")
     print(
         f"Updating templates for {repo_name} with Integration Version: {version}, HA Version: {ha_version}"
     )
@@ -215,7 +366,7 @@ if __name__ == "__main__":
             if filename.endswith(".yml") or filename.endswith(".yaml"):
                 path = os.path.join(template_dir, filename)
                 changed = clean_and_update_template(
-                    path, version, ha_version, repo_name
+                    path, version, ha_version, repo_name, service_version
                 )
                 if changed:
                     print(f"Updated: {path}")
@@ -15,15 +15,16 @@ def find_manifest():
 MANIFEST_FILE = find_manifest()
 
 
-def get_current_version(manifest_path=None):
+def get_current_version(manifest_path=None, tags=None):
     if manifest_path is None:
         manifest_path = MANIFEST_FILE
     try:
-        tags = (
-            subprocess.check_output(["git", "tag"], stderr=subprocess.DEVNULL)
-            .decode()
-            .splitlines()
-        )
+        if tags is None:
+            tags = (
+                subprocess.check_output(["git", "tag"], stderr=subprocess.DEVNULL)
+                .decode()
+                .splitlines()
+            )
         v_tags = []
         for tag in tags:
             tag = tag.strip()
@@ -0,0 +1,75 @@
+"""Measure config entry setup time with and without fast start.
+
+Every request takes ``LATENCY`` seconds. Run with
+``python -m pytest benchmarks/bench_startup.py -s -p no:cacheprovider``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.const import DOMAIN
+
+from .league_xml import schedule_xml, scoreboard_xml
+
+LATENCY = 0.2
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations."""
+    yield
+
+
+@pytest.mark.parametrize("entries", [1, 50, 200])
+@pytest.mark.parametrize("fast_start", [False, True])
+async def test_startup(hass: HomeAssistant, entries: int, fast_start: bool):
+    """Set up many entries and report how long HA waited for them."""
+    client = DieligaApiClient(None, "https://example.com")  # type: ignore[arg-type]
+    scoreboard = client._parse_scoreboard_xml(scoreboard_xml())
+    schedule = client._parse_schedule_xml(schedule_xml())
+
+    async def _async_get_scoreboard(self, liga_id):
+        await asyncio.sleep(LATENCY)
+        return scoreboard
+
+    async def _async_get_schedule(self, liga_id):
+        await asyncio.sleep(LATENCY)
+        return schedule
+
+    for liga_id in range(entries):
+        MockConfigEntry(
+            domain=DOMAIN,
+            version=2,
+            unique_id=str(liga_id),
+            data={"base_url": "https://example.com", "liga_id": liga_id},
+            options={"fast_start": fast_start},
+        ).add_to_hass(hass)
+
+    with (
+        patch.object(DieligaApiClient, "async_get_scoreboard", _async_get_scoreboard),
+        patch.object(DieligaApiClient, "async_get_schedule", _async_get_schedule),
+    ):
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                hass.config_entries.async_setup(entry.entry_id)
+                for entry in hass.config_entries.async_entries(DOMAIN)
+            )
+        )
+        setup = time.perf_counter() - start
+        await hass.async_block_till_done()
+        settled = time.perf_counter() - start
+
+    mode = "fast start" if fast_start else "default"
+    print(
+        f"\n{entries:4} entries, {mode:10}: setup {setup * 1000:8.1f} ms, "
+        f"data loaded {settled * 1000:8.1f} ms"
+    )
@@ -0,0 +1,106 @@
+"""Measure the changelog generator on a synthetic repository.
+
+A repository with ``--commits`` empty commits is built with ``git
+fast-import``; the generator then runs over the whole history without a
+cache, again with the cache filled, and after ``--new`` more commits.
+Run with ``python -m benchmarks.changelog``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from generate_changelog import (
+    ClassificationCache,
+    generate_changelog,
+    iter_commits,
+)
+
+SUBJECTS = [
+    "feat(sensor): add {word} attribute",
+    "fix: handle missing {word} in schedule",
+    "fix(calendar)!: rename {word} events",
+    "docs: explain {word} option",
+    "chore(deps): update dependency {word} to v{n}",
+    "refactor: simplify {word} parsing",
+    "perf: cache {word} lookups",
+    "Update {word}.py",
+    "Merge pull request #{n} from fork/{word}",
+    "Improve {word} handling",
+    "Fixed {word} for league {n}",
+    "{word} tweaks",
+]
+WORDS = ["table", "schedule", "team", "league", "calendar", "options", "archive"]
+AUTHORS = ["FaserF", "dependabot[bot]", "contributor", "github-actions"]
+
+
+def build_repository(path: Path, commits: int, start: int = 0) -> None:
+    """Append synthetic commits to the repository at path."""
+    rng = random.Random(start)
+    lines = []
+    for number in range(start, start + commits):
+        subject = rng.choice(SUBJECTS).format(
+            word=rng.choice(WORDS), n=rng.randrange(1000)
+        )
+        message = f"{subject}\n".encode()
+        author = rng.choice(AUTHORS)
+        lines.append(
+            "commit refs/heads/main\n"
+            f"mark :{number + 1}\n"
+            f"committer {author} <{author}@example.com> {1_600_000_000 + number} +0000\n"
+            f"data {len(message)}\n{message.decode()}\n"
+        )
+        if number == start and start:
+            lines.append("from refs/heads/main^0\n")
+    subprocess.run(
+        ["git", "fast-import", "--quiet"],
+        input="".join(lines).encode(),
+        cwd=path,
+        check=True,
+    )
+    subprocess.run(["git", "checkout", "-q", "main"], cwd=path, check=True)
+
+
+def run(path: Path, cache: ClassificationCache) -> tuple[float, int]:
+    """Generate the changelog of the whole history, return seconds and size."""
+    start = time.perf_counter()
+    changelog = generate_changelog(iter_commits(cwd=str(path)), cache=cache)
+    return time.perf_counter() - start, len(changelog)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commits", type=int, default=50_000)
+    parser.add_argument("--new", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "repo"
+        path.mkdir()
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+        build_repository(path, args.commits)
+        cache_path = str(Path(tmp) / "changelog.jsonl")
+
+        seconds, size = run(path, ClassificationCache(None))
+        print(f"{args.commits} commits, no cache:     {seconds:7.3f} s ({size} bytes)")
+        seconds, _size = run(path, ClassificationCache(cache_path))
+        print(f"{args.commits} commits, filling cache: {seconds:7.3f} s")
+        seconds, _size = run(path, ClassificationCache(cache_path))
+        print(f"{args.commits} commits, cached:       {seconds:7.3f} s")
+
+        build_repository(path, args.new, start=args.commits)
+        seconds, _size = run(path, ClassificationCache(cache_path))
+        print(f"+{args.new} new commits, cached:  {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Synthetic dieLiga XML payloads for benchmarks."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+
+def team_names(teams: int) -> list[str]:
+    """Return the names of a synthetic league."""
+    return [f"Volleyball Club {index:02d} e.V." for index in range(1, teams + 1)]
+
+
+def schedule_xml(
+    teams: int = 16, start: date = date(2025, 9, 6), played_days: int | None = None
+) -> str:
+    """Build a double round-robin schedule with one day of play per week."""
+    names = team_names(teams)
+    rotation = names[1:]
+    days = []
+    gamenr = 1
+    for day_index in range(2 * (teams - 1)):
+        day = start + timedelta(weeks=day_index)
+        completed = played_days is None or day_index < played_days
+        lineup = [names[0], *rotation]
+        games = []
+        for pair in range(teams // 2):
+            team_a, team_b = lineup[pair], lineup[-pair - 1]
+            if day_index >= teams - 1:
+                team_a, team_b = team_b, team_a
+            if completed:
+                won = (gamenr + day_index) % 3 != 0
+                result_a = (
+                    f'points="{2 if won else 0}" sets="{3 if won else 1}" '
+                    f'balls="{75 if won else 60}"'
+                )
+                result_b = (
+                    f'points="{0 if won else 2}" sets="{1 if won else 3}" '
+                    f'balls="{60 if won else 75}"'
+                )
+                state = "Completed"
+            else:
+                result_a = result_b = 'points="0" sets="0" balls="0"'
+                state = "Scheduled"
+            games.append(
+                "<game>"
+                f"<gamenr>{gamenr}</gamenr>"
+                f"<date>{day.isoformat()}</date>"
+                "<new_date>-</new_date>"
+                "<time>19:30</time>"
+                f'<team_a name="{team_a}" {result_a} />'
+                f'<team_b name="{team_b}" {result_b} />'
+                f"<state>{state}</state>"
+                "</game>"
+            )
+            gamenr += 1
+        days.append(f"<day_of_play>{''.join(games)}</day_of_play>")
+        rotation = rotation[-1:] + rotation[:-1]
+    return (
+        "<results><group>Group A</group><region>Region 1</region>"
+        f"{''.join(days)}</results>"
+    )
+
+
+def scoreboard_xml(teams: int = 16) -> str:
+    """Build a scoreboard with the given number of teams."""
+    rows = "".join(
+        "<team>"
+        f"<name>{name}</name>"
+        f'<points positive="{2 * (teams - index)}" negative="{2 * index}" />'
+        f'<sets positive="{3 * (teams - index)}" negative="{3 * index}" />'
+        f'<balls positive="{75 * (teams - index)}" negative="{75 * index}" />'
+        f"<games>{teams - 1}</games>"
+        f"<games_won>{teams - index - 1}</games_won>"
+        "</team>"
+        for index, name in enumerate(team_names(teams))
+    )
+    return (
+        "<results><group>Group A</group><region>Region 1</region>"
+        "<last_change>2026-01-31 12:00:00</last_change>"
+        f"<league>Test League</league><table>{rows}</table></results>"
+    )
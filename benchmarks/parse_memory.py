@@ -0,0 +1,60 @@
+"""Measure the memory retained by parsed schedules with and without interning.
+
+Run with ``python -m benchmarks.parse_memory``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+
+from custom_components.dieliga.api import DieligaApiClient, StringPool
+
+from .league_xml import schedule_xml
+
+
+def _retained_bytes(client: DieligaApiClient, payloads: list[str]) -> int:
+    """Parse every payload and return the memory held by all results."""
+    tracemalloc.start()
+    results = [client._parse_schedule_xml(payload) for payload in payloads]
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--leagues", type=int, default=5)
+    parser.add_argument("--teams", type=int, default=16)
+    parser.add_argument(
+        "--refreshes",
+        type=int,
+        default=2,
+        help="Snapshots kept alive per league (old and new data during a refresh).",
+    )
+    args = parser.parse_args()
+
+    payloads = [
+        schedule_xml(args.teams)
+        for _league in range(args.leagues)
+        for _refresh in range(args.refreshes)
+    ]
+
+    plain = DieligaApiClient(None, "https://plain.example")  # type: ignore[arg-type]
+    plain._intern = str
+    pooled = DieligaApiClient(None, "https://pooled.example")  # type: ignore[arg-type]
+    pooled._intern = StringPool()
+
+    plain_size = _retained_bytes(plain, payloads)
+    pooled_size = _retained_bytes(pooled, payloads)
+
+    print(f"{len(payloads)} schedules with {args.teams} teams each")
+    print(f"without interning: {plain_size / 1024:10.1f} KiB")
+    print(f"with interning:    {pooled_size / 1024:10.1f} KiB")
+    print(f"reduction:         {(1 - pooled_size / plain_size) * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compare the parse time of the XML parser backends.
+
+Run with ``python -m benchmarks.parse_speed``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.xml_backend import available_backends
+
+from .league_xml import schedule_xml, scoreboard_xml
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--teams", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--backend",
+        choices=available_backends(),
+        action="append",
+        help="Backend to measure (default: all available).",
+    )
+    args = parser.parse_args()
+
+    schedule = schedule_xml(args.teams)
+    scoreboard = scoreboard_xml(args.teams)
+    print(
+        f"schedule: {len(schedule) / 1024:.1f} KiB, "
+        f"scoreboard: {len(scoreboard) / 1024:.1f} KiB, {args.repeat} runs"
+    )
+    for backend in args.backend or available_backends():
+        client = DieligaApiClient(None, "https://example.com", backend)  # type: ignore[arg-type]
+
+        def _refresh(client: DieligaApiClient = client) -> None:
+            client._parse_schedule_xml(schedule)
+            client._parse_scoreboard_xml(scoreboard)
+
+        seconds = timeit.timeit(_refresh, number=args.repeat)
+        print(f"{backend:12} {seconds / args.repeat * 1000:8.2f} ms per refresh")
+
+
+if __name__ == "__main__":
+    main()
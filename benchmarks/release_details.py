@@ -0,0 +1,75 @@
+"""Measure the release detail calculation as the history grows.
+
+Synthetic repositories are built with ``git fast-import``; the release
+script then runs for a beta with the last ``--since`` commits after a
+stable tag, and for a first release without tags. Run with
+``python -m benchmarks.release_details``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .changelog import build_repository
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / ".github" / "scripts" / "calculate_release_details.py"
+
+
+def run(path: Path, release_type: str) -> float:
+    """Run the release script in a repository, return the seconds it took."""
+    env = {
+        **os.environ,
+        "RELEASE_TYPE": release_type,
+        "REPO": "example/repo",
+        "PYTHONPATH": str(ROOT / "scripts"),
+        "CHANGELOG_CACHE": "",
+        "GITHUB_OUTPUT": "",
+    }
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(SCRIPT)],
+        cwd=path,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--commits", type=int, nargs="+", default=[1_000, 10_000, 50_000]
+    )
+    parser.add_argument("--since", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'commits':>8} {'beta':>8} {'first release':>14}")
+    for commits in args.commits:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            subprocess.run(["git", "init", "-q", "-b", "main"], cwd=path, check=True)
+            build_repository(path, commits)
+            manifest = path / "custom_components" / "example" / "manifest.json"
+            manifest.parent.mkdir(parents=True)
+            manifest.write_text(json.dumps({"name": "Example", "version": "1.0.0"}))
+
+            first_release = run(path, "beta")
+            subprocess.run(
+                ["git", "tag", "v1.0.0", f"HEAD~{args.since}"], cwd=path, check=True
+            )
+            beta = run(path, "beta")
+        print(f"{commits:>8} {beta:>7.2f}s {first_release:>13.2f}s")
+
+
+if __name__ == "__main__":
+    main()
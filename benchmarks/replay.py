@@ -0,0 +1,55 @@
+"""Replay a capture of real dieLiga responses through the API client.
+
+Captures are written by the ``dieliga.capture`` service. Every league in
+the capture is fetched and parsed from the recorded responses, with the
+recorded timing multiplied by ``--time-scale`` (``0`` measures the client
+alone). Run with ``python -m benchmarks.replay dieliga_capture.<ts>.jsonl.gz``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import time
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.capture import ReplaySession, load_capture
+
+URL_RE = re.compile(r"^(?P<base>.+)/schedule/(?P<kind>summary|schedule)/(?P<liga>\d+)")
+
+
+async def replay(path: str, time_scale: float, repeat: int) -> None:
+    """Fetch every captured league repeat times and print the timings."""
+    responses = load_capture(path)
+    leagues: dict[tuple[str, str], set[str]] = {}
+    for response in responses:
+        if match := URL_RE.match(response.url):
+            leagues.setdefault((match["base"], match["liga"]), set()).add(match["kind"])
+    size = sum(len(response.body) for response in responses)
+    print(f"{len(responses)} responses, {size / 1024:.1f} KiB, {len(leagues)} leagues")
+    for (base_url, liga_id), kinds in leagues.items():
+        session = ReplaySession(responses, time_scale)
+        client = DieligaApiClient(session, base_url)  # type: ignore[arg-type]
+        start = time.perf_counter()
+        for _run in range(repeat):
+            if "summary" in kinds:
+                await client.async_get_scoreboard(liga_id)
+            if "schedule" in kinds:
+                await client.async_get_schedule(liga_id)
+        seconds = (time.perf_counter() - start) / repeat
+        print(f"{base_url} {liga_id:>6} {seconds * 1000:8.2f} ms per refresh")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("capture")
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(replay(args.capture, args.time_scale, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
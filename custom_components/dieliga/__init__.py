@@ -3,17 +3,62 @@ import importlib
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .api import DieligaApiClient
-from .coordinator import DieligaDataUpdateCoordinator
-from .const import DOMAIN, CONF_URL, CONF_LIGA_ID, CONF_REFRESH_TIME
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
+
+from .api import DieligaApiClient, XmlLimits
+from .coordinator import (
+    DieligaDataUpdateCoordinator,
+    async_pop_handoff,
+    entry_teams,
+    snapshot_store,
+)
+from .const import (
+    DOMAIN,
+    CONF_URL,
+    CONF_LIGA_ID,
+    CONF_REFRESH_TIME,
+    CONF_TEAM_NAME,
+    CONF_TEAMS,
+    SIGNAL_LEAGUE_ADDED,
+    SIGNAL_TEAMS_UPDATED,
+    CONF_CLUB,
+    CONF_FAST_START,
+    CONF_ARCHIVE,
+    CONF_VERIFY_STANDINGS,
+    CONF_PROBE_CHANGES,
+    CONF_MAX_RESPONSE_SIZE,
+    DEFAULT_MAX_RESPONSE_SIZE,
+)
+from .archive import async_close_archive, async_get_archive
+from .live import LiveMode
+from .long_term_statistics import StandingsStatistics
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "binary_sensor", "calendar"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the dieLiga services and websocket commands."""
+    async_setup_services(hass)
+    async_setup_websocket(hass)
+
+    async def _async_close_archive(_event: Event) -> None:
+        await async_close_archive(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_archive)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up dieLiga from a config entry."""
@@ -26,27 +71,76 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     refresh_time = entry.options.get(CONF_REFRESH_TIME, 12)
 
     session = async_get_clientsession(hass)
-    client = DieligaApiClient(session, base_url)
+    client = DieligaApiClient(session, base_url, limits=_xml_limits(entry))
+
+    fast_start = entry.options.get(CONF_FAST_START, False)
+    initial_data = async_pop_handoff(hass, base_url, liga_id)
+    scheduler = async_get_scheduler(hass)
 
     coordinator = DieligaDataUpdateCoordinator(
-        hass, client, liga_id, update_interval=timedelta(hours=refresh_time)
+        hass,
+        client,
+        liga_id,
+        update_interval=timedelta(hours=refresh_time),
+        initial_data=initial_data,
+        snapshot=snapshot_store(hass, entry.entry_id) if fast_start else None,
+        scheduler=scheduler,
+        schedule_key=entry.entry_id,
+        archive=async_get_archive(hass)
+        if entry.options.get(CONF_ARCHIVE, False)
+        else None,
+        verify_standings=entry.options.get(CONF_VERIFY_STANDINGS, False),
+        probe_changes=entry.options.get(CONF_PROBE_CHANGES, False),
+        teams=entry_teams(entry),
+        primary_team=entry.data.get(CONF_TEAM_NAME),
     )
-
-    await coordinator.async_config_entry_first_refresh()
+    coordinator.options = dict(entry.options)
+
+    if fast_start and initial_data is None:
+        # Serve the last known data (or a loading state) right away and let
+        # the first network refresh run in the background.
+        if not await coordinator.async_load_snapshot():
+            _LOGGER.debug("No snapshot for %s, entities start as loading", liga_id)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {liga_id}"
+        )
+        entry.async_create_background_task(
+            hass, _async_import_diagnostics(hass), f"{DOMAIN} import diagnostics"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+        await _async_import_diagnostics(hass)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Pre-import diagnostics to avoid blocking call warning during discovery
-    # This is done in the executor to avoid blocking the event loop
-    try:
-        await hass.async_add_import_executor_job(
-            importlib.import_module, f"custom_components.{DOMAIN}.diagnostics"
-        )
-    except Exception:  # pylint: disable=broad-except
-        _LOGGER.debug("Diagnostics platform not found or failed to import")
+    scheduler.async_schedule(coordinator)
+    entry.async_on_unload(lambda: scheduler.async_unschedule(coordinator))
+
+    @callback
+    def _async_cancel_profiler() -> None:
+        """End a profiling session of the league with the entry."""
+        if coordinator.profiler is not None:
+            coordinator.profiler.async_cancel(coordinator)
+
+    entry.async_on_unload(_async_cancel_profiler)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Club calendars of other entries merge this league's games, too
+    async_dispatcher_send(hass, SIGNAL_LEAGUE_ADDED, coordinator)
+
+    # Import the table history once (backfill), then after each refresh
+    standings_statistics = StandingsStatistics(hass, coordinator)
+    standings_statistics.async_update()
+    entry.async_on_unload(
+        coordinator.async_add_listener(standings_statistics.async_update)
+    )
+
+    # Poll every minute while a tracked team plays, re-checked after refreshes
+    live = LiveMode(hass, coordinator, scheduler)
+    live.async_update()
+    entry.async_on_unload(coordinator.async_add_listener(live.async_update))
+    entry.async_on_unload(live.async_stop)
 
     # Add listener to handle options updates
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -54,13 +148,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _xml_limits(entry: ConfigEntry) -> XmlLimits:
+    """Return the response limits of an entry; the size option is in MB."""
+    size = entry.options.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE)
+    return XmlLimits(max_bytes=size * 1_000_000)
+
+
+async def _async_import_diagnostics(hass: HomeAssistant) -> None:
+    """Pre-import diagnostics to avoid blocking call warning during discovery."""
+    # This is done in the executor to avoid blocking the event loop
+    try:
+        await hass.async_add_import_executor_job(
+            importlib.import_module, f"custom_components.{DOMAIN}.diagnostics"
+        )
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Diagnostics platform not found or failed to import")
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update options."""
     coordinator: DieligaDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    previous, coordinator.options = coordinator.options, dict(entry.options)
+    if previous.get(CONF_CLUB) != coordinator.options.get(CONF_CLUB):
+        # The club calendar is added or removed with the entry's entities
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    teams = entry_teams(entry)
+    if teams != coordinator.teams:
+        # The platforms add and remove the entities of the changed teams
+        coordinator.teams = teams
+        async_dispatcher_send(hass, SIGNAL_TEAMS_UPDATED.format(entry.entry_id), teams)
+
     refresh_time = entry.options.get(CONF_REFRESH_TIME, 12)
     _LOGGER.debug("Updating refresh interval to %s hours", refresh_time)
-    coordinator.update_interval = timedelta(hours=refresh_time)
-    await coordinator.async_request_refresh()
+    coordinator.set_refresh_interval(timedelta(hours=refresh_time))
+    coordinator.client.limits = _xml_limits(entry)
+    coordinator.archive = (
+        async_get_archive(hass) if entry.options.get(CONF_ARCHIVE, False) else None
+    )
+    coordinator.local_standings.always_verify = entry.options.get(
+        CONF_VERIFY_STANDINGS, False
+    )
+    coordinator.probe_changes = entry.options.get(CONF_PROBE_CHANGES, False)
+    coordinator.snapshot = (
+        snapshot_store(hass, entry.entry_id)
+        if entry.options.get(CONF_FAST_START, False)
+        else None
+    )
+    # Changed teams are served from the data at hand
+    if _without_teams(previous) != _without_teams(coordinator.options):
+        await coordinator.async_request_refresh()
+
+
+def _without_teams(options: dict) -> dict:
+    """Return the options that are unrelated to the tracked teams."""
+    return {
+        key: value
+        for key, value in options.items()
+        if key not in (CONF_TEAMS, CONF_TEAM_NAME)
+    }
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -86,5 +233,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            await async_close_archive(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored snapshot of a deleted entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -1,31 +1,187 @@
 """API Client for dieLiga."""
 
 import logging
-from typing import Any
-import xml.etree.ElementTree as ET
+import re
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+from typing import Any, NamedTuple
 from datetime import datetime
+from time import monotonic
 
 import aiohttp
 
+from .capture import HttpCapture
+from .const import XML_MAX_BYTES, XML_MAX_GAMES, XML_MAX_TEAMS
+from .xml_backend import get_backend
+
 _LOGGER = logging.getLogger(__name__)
 
+STRING_POOL_MAX_SIZE = 50_000
+
+LEAGUE_LINK_RE = re.compile(r"/schedule/(?:overview|summary|schedule)/(\d+)")
+
+# Markup the parsers never need and that can expand beyond the body size
+DECLARATION_RE = re.compile(rb"<!(?:DOCTYPE|ENTITY)", re.IGNORECASE)
+GAME_RE = re.compile(rb"<game[\s/>]")
+TEAM_RE = re.compile(rb"<team[\s/>]")
+# Bytes kept from the previous chunk so that no tag is split between chunks
+CHUNK_OVERLAP = 16
+CHUNK_SIZE = 65_536
+# Response headers that validate a download, and the request headers to send
+VALIDATORS = (
+    (aiohttp.hdrs.ETAG, aiohttp.hdrs.IF_NONE_MATCH),
+    (aiohttp.hdrs.LAST_MODIFIED, aiohttp.hdrs.IF_MODIFIED_SINCE),
+)
+
+
+class XmlLimits(NamedTuple):
+    """Limits of an XML response, checked while it is read."""
+
+    max_bytes: int = XML_MAX_BYTES
+    max_games: int = XML_MAX_GAMES
+    max_teams: int = XML_MAX_TEAMS
+
+
+class DieligaResponseRejected(Exception):
+    """A response exceeded a limit or contained a DTD or entity declaration."""
+
+
+async def _async_iter_bounded(
+    response: aiohttp.ClientResponse, max_bytes: int
+) -> AsyncIterator[bytes]:
+    """Yield the chunks of a response, aborting once it exceeds max_bytes."""
+    length = int(response.headers.get(aiohttp.hdrs.CONTENT_LENGTH) or 0)
+    if length > max_bytes:
+        raise DieligaResponseRejected(
+            f"Response of {length} bytes exceeds the limit of {max_bytes}"
+        )
+    size = 0
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            raise DieligaResponseRejected(
+                f"Response exceeds the limit of {max_bytes} bytes"
+            )
+        yield chunk
+
+
+async def async_read_bounded(response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+    """Read a response body of at most max_bytes bytes."""
+    return b"".join([chunk async for chunk in _async_iter_bounded(response, max_bytes)])
+
+
+async def async_read_xml(response: aiohttp.ClientResponse, limits: XmlLimits) -> bytes:
+    """Read the raw bytes of an XML response, aborting once it breaks a limit.
+
+    The bytes are decoded by the caller, so captures keep the body as sent.
+    Games and teams are counted by their start tags, so the limits hold
+    before anything is parsed and the rest of an oversized body is never
+    read.
+    """
+    chunks: list[bytes] = []
+    games = teams = 0
+    tail = b""
+    async for chunk in _async_iter_bounded(response, limits.max_bytes):
+        # Only tags that start in this chunk are counted
+        window = tail + chunk
+        offset = len(tail)
+        if DECLARATION_RE.search(window):
+            raise DieligaResponseRejected("Response contains a DTD or entity")
+        games += sum(1 for m in GAME_RE.finditer(window) if m.end() > offset)
+        teams += sum(1 for m in TEAM_RE.finditer(window) if m.end() > offset)
+        if games > limits.max_games:
+            raise DieligaResponseRejected(
+                f"Response has more than {limits.max_games} games"
+            )
+        if teams > limits.max_teams:
+            raise DieligaResponseRejected(
+                f"Response has more than {limits.max_teams} teams"
+            )
+        tail = window[-CHUNK_OVERLAP:]
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+class StringPool:
+    """Pool of canonical string objects shared across parsed snapshots.
+
+    Team names and enumerated fields repeat in almost every game, so the
+    parsers route them through the pool and every occurrence (across
+    refreshes, too) references the same object.
+    """
+
+    def __init__(self, max_size: int = STRING_POOL_MAX_SIZE) -> None:
+        """Initialize the pool."""
+        self._strings: dict[str, str] = {}
+        self._max_size = max_size
+
+    def __call__(self, value: str) -> str:
+        """Return the pooled instance of value."""
+        try:
+            return self._strings[value]
+        except KeyError:
+            if len(self._strings) >= self._max_size:
+                # Leagues roll over every season; start over instead of growing.
+                self._strings.clear()
+            self._strings[value] = value
+            return value
+
+    def __len__(self) -> int:
+        """Return the number of pooled strings."""
+        return len(self._strings)
+
+
+_HOST_POOLS: dict[str, StringPool] = {}
+
+
+def get_string_pool(base_url: str) -> StringPool:
+    """Return the string pool shared by all clients of a host."""
+    return _HOST_POOLS.setdefault(base_url.rstrip("/"), StringPool())
+
 
 class DieligaApiClient:
     """API Client for dieLiga."""
 
-    def __init__(self, session: aiohttp.ClientSession, base_url: str):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str,
+        parser_backend: str | None = None,
+        limits: XmlLimits | None = None,
+        capture: HttpCapture | None = None,
+    ):
         """Initialize the API client."""
         self._session = session
         self._base_url = base_url.rstrip("/")
+        self._intern = get_string_pool(self._base_url)
+        self._xml = get_backend(parser_backend)
+        self.limits = limits or XmlLimits()
+        # Records the raw responses of the selected leagues while set
+        self.capture = capture
+        # URL -> conditional request headers of its last download
+        self._validators: dict[str, dict[str, str]] = {}
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the dieLiga instance."""
+        return self._base_url
+
+    @property
+    def parser_backend(self) -> str:
+        """Return the name of the XML parser backend in use."""
+        return self._xml.name
+
+    @property
+    def string_pool_size(self) -> int:
+        """Return the number of strings pooled for this client's host."""
+        return len(self._intern)
 
     async def async_get_scoreboard(self, liga_id: str) -> dict:
         """Fetch the scoreboard for a given liga_id."""
         url = f"{self._base_url}/schedule/summary/{liga_id}?output=xml"
         try:
-            async with self._session.get(url) as response:
-                response.raise_for_status()
-                text = await response.text()
-                return self._parse_scoreboard_xml(text)
+            _status, text = await self._async_get_xml(url, liga_id)
+            return self._parse_scoreboard_xml(text)
         except Exception as e:
             _LOGGER.error("Error fetching scoreboard: %s", e)
             raise
@@ -33,24 +189,87 @@ class DieligaApiClient:
     async def async_get_schedule(self, liga_id: str) -> dict:
         """Fetch the schedule for a given liga_id."""
         url = f"{self._base_url}/schedule/schedule/{liga_id}?output=xml"
+        try:
+            _status, text = await self._async_get_xml(url, liga_id)
+            return self._parse_schedule_xml(text)
+        except Exception as e:
+            _LOGGER.error("Error fetching schedule: %s", e)
+            raise
+
+    async def async_get_schedule_if_changed(self, liga_id: str) -> dict | None:
+        """Fetch the schedule unless it is unchanged since its last download.
+
+        The request is conditional on the validators of the last download, and
+        None is returned when the host answers 304 Not Modified.
+        """
+        url = f"{self._base_url}/schedule/schedule/{liga_id}?output=xml"
+        try:
+            status, text = await self._async_get_xml(
+                url, liga_id, self._validators.get(url, {})
+            )
+            if status == HTTPStatus.NOT_MODIFIED:
+                return None
+            return self._parse_schedule_xml(text)
+        except Exception as e:
+            _LOGGER.error("Error fetching schedule: %s", e)
+            raise
+
+    async def _async_get_xml(
+        self, url: str, liga_id: str, headers: dict[str, str] | None = None
+    ) -> tuple[int, str]:
+        """Download an XML document within the limits, recording it if captured.
+
+        Return the status and the text, which is empty for a 304 Not Modified
+        answer. The validators of every download are kept for conditional
+        requests.
+        """
+        capture = self.capture
+        started = monotonic()
+        async with self._session.get(url, headers=headers or {}) as response:
+            body = b""
+            if response.status < 300:
+                body = await async_read_xml(response, self.limits)
+            if capture is not None and capture.wants(liga_id):
+                capture.record(
+                    url, response.status, response.headers.items(), body, started
+                )
+            if response.status == HTTPStatus.NOT_MODIFIED:
+                return response.status, ""
+            response.raise_for_status()
+            validators = {
+                str(request_header): value
+                for response_header, request_header in VALIDATORS
+                if (value := response.headers.get(response_header))
+            }
+            if validators:
+                self._validators[url] = validators
+            text = body.decode(response.charset or "utf-8", errors="replace")
+            return response.status, text
+
+    async def async_get_league_ids(self) -> list[str]:
+        """Fetch the IDs of all leagues linked from the host's league overview."""
+        url = f"{self._base_url}/schedule/overview"
         try:
             async with self._session.get(url) as response:
                 response.raise_for_status()
-                text = await response.text()
-                return self._parse_schedule_xml(text)
+                # An HTML page, so only its size is bounded
+                body = await async_read_bounded(response, self.limits.max_bytes)
+                text = body.decode(response.charset or "utf-8", errors="replace")
         except Exception as e:
-            _LOGGER.error("Error fetching schedule: %s", e)
+            _LOGGER.error("Error fetching league overview: %s", e)
             raise
+        return list(dict.fromkeys(LEAGUE_LINK_RE.findall(text)))
 
     def _parse_scoreboard_xml(self, xml_data: str) -> dict[str, Any]:
         """Parse the scoreboard XML."""
-        root = ET.fromstring(xml_data)
+        root = self._xml.fromstring(xml_data)
+        intern = self._intern
 
         data: dict[str, Any] = {
-            "group": root.findtext("group", "Unknown"),
-            "region": root.findtext("region", "Unknown"),
+            "group": intern(root.findtext("group", "Unknown")),
+            "region": intern(root.findtext("region", "Unknown")),
             "last_change": root.findtext("last_change", "Unknown"),
-            "league": root.findtext("league", "Unknown"),
+            "league": intern(root.findtext("league", "Unknown")),
             "teams": [],
         }
 
@@ -61,27 +280,27 @@ class DieligaApiClient:
 
             data["teams"].append(
                 {
-                    "name": team.findtext("name", "Unknown"),
-                    "points_positive": points_el.get("positive", "0")
+                    "name": intern(team.findtext("name", "Unknown")),
+                    "points_positive": intern(points_el.get("positive", "0"))
                     if points_el is not None
                     else "0",
-                    "points_negative": points_el.get("negative", "0")
+                    "points_negative": intern(points_el.get("negative", "0"))
                     if points_el is not None
                     else "0",
-                    "sets_positive": sets_el.get("positive", "0")
+                    "sets_positive": intern(sets_el.get("positive", "0"))
                     if sets_el is not None
                     else "0",
-                    "sets_negative": sets_el.get("negative", "0")
+                    "sets_negative": intern(sets_el.get("negative", "0"))
                     if sets_el is not None
                     else "0",
-                    "balls_positive": balls_el.get("positive", "0")
+                    "balls_positive": intern(balls_el.get("positive", "0"))
                     if balls_el is not None
                     else "0",
-                    "balls_negative": balls_el.get("negative", "0")
+                    "balls_negative": intern(balls_el.get("negative", "0"))
                     if balls_el is not None
                     else "0",
-                    "games": team.findtext("games", "0"),
-                    "games_won": team.findtext("games_won", "0"),
+                    "games": intern(team.findtext("games", "0")),
+                    "games_won": intern(team.findtext("games_won", "0")),
                 }
             )
 
@@ -89,11 +308,12 @@ class DieligaApiClient:
 
     def _parse_schedule_xml(self, xml_data: str) -> dict[str, Any]:
         """Parse the schedule XML."""
-        root = ET.fromstring(xml_data)
+        root = self._xml.fromstring(xml_data)
+        intern = self._intern
 
         data: dict[str, Any] = {
-            "group": root.findtext("group", "Unknown"),
-            "region": root.findtext("region", "Unknown"),
+            "group": intern(root.findtext("group", "Unknown")),
+            "region": intern(root.findtext("region", "Unknown")),
             "games": [],
             "total_games": 0,
             "completed_games": 0,
@@ -101,41 +321,42 @@ class DieligaApiClient:
 
         now = datetime.now()
 
-        for day in root.findall(".//day_of_play"):
+        for day_index, day in enumerate(root.findall(".//day_of_play"), start=1):
             for game in day.findall("game"):
                 team_a = game.find("team_a")
                 team_b = game.find("team_b")
 
                 game_info = {
                     "game_number": game.findtext("gamenr", "Unknown"),
-                    "date": game.findtext("date", "Unknown"),
-                    "new_date": game.findtext("new_date", "Unknown"),
-                    "time": game.findtext("time", "Unknown"),
-                    "team_a_name": team_a.get("name", "Unknown")
+                    "day_of_play": day_index,
+                    "date": intern(game.findtext("date", "Unknown")),
+                    "new_date": intern(game.findtext("new_date", "Unknown")),
+                    "time": intern(game.findtext("time", "Unknown")),
+                    "team_a_name": intern(team_a.get("name", "Unknown"))
                     if team_a is not None
                     else "Unknown",
-                    "team_b_name": team_b.get("name", "Unknown")
+                    "team_b_name": intern(team_b.get("name", "Unknown"))
                     if team_b is not None
                     else "Unknown",
-                    "team_a_points": team_a.get("points", "0")
+                    "team_a_points": intern(team_a.get("points", "0"))
                     if team_a is not None
                     else "0",
-                    "team_b_points": team_b.get("points", "0")
+                    "team_b_points": intern(team_b.get("points", "0"))
                     if team_b is not None
                     else "0",
-                    "team_a_sets": team_a.get("sets", "0")
+                    "team_a_sets": intern(team_a.get("sets", "0"))
                     if team_a is not None
                     else "0",
-                    "team_b_sets": team_b.get("sets", "0")
+                    "team_b_sets": intern(team_b.get("sets", "0"))
                     if team_b is not None
                     else "0",
-                    "team_a_balls": team_a.get("balls", "0")
+                    "team_a_balls": intern(team_a.get("balls", "0"))
                     if team_a is not None
                     else "0",
-                    "team_b_balls": team_b.get("balls", "0")
+                    "team_b_balls": intern(team_b.get("balls", "0"))
                     if team_b is not None
                     else "0",
-                    "state": game.findtext("state", "Unknown"),
+                    "state": intern(game.findtext("state", "Unknown")),
                 }
 
                 data["games"].append(game_info)
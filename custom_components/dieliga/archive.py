@@ -0,0 +1,314 @@
+"""Local SQLite archive of completed dieLiga games and league tables."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ARCHIVE = f"{DOMAIN}_archive"
+ARCHIVE_FILENAME = f"{DOMAIN}_archive.db"
+
+INVALID_DATES = ("-", "", "Unknown", "?")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leagues (
+    liga_id TEXT PRIMARY KEY,
+    season TEXT NOT NULL,
+    league TEXT,
+    grp TEXT,
+    region TEXT,
+    last_change TEXT
+);
+CREATE TABLE IF NOT EXISTS games (
+    liga_id TEXT NOT NULL,
+    game_number TEXT NOT NULL,
+    season TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT,
+    team_a_name TEXT NOT NULL,
+    team_b_name TEXT NOT NULL,
+    team_a_points TEXT,
+    team_b_points TEXT,
+    team_a_sets TEXT,
+    team_b_sets TEXT,
+    team_a_balls TEXT,
+    team_b_balls TEXT,
+    state TEXT,
+    PRIMARY KEY (liga_id, game_number)
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (date);
+CREATE INDEX IF NOT EXISTS games_team_a ON games (team_a_name, date);
+CREATE INDEX IF NOT EXISTS games_team_b ON games (team_b_name, date);
+CREATE TABLE IF NOT EXISTS standings (
+    liga_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    points_positive TEXT,
+    points_negative TEXT,
+    sets_positive TEXT,
+    sets_negative TEXT,
+    balls_positive TEXT,
+    balls_negative TEXT,
+    games TEXT,
+    games_won TEXT,
+    PRIMARY KEY (liga_id, position)
+);
+"""
+
+GAME_COLUMNS = (
+    "game_number",
+    "date",
+    "time",
+    "team_a_name",
+    "team_b_name",
+    "team_a_points",
+    "team_b_points",
+    "team_a_sets",
+    "team_b_sets",
+    "team_a_balls",
+    "team_b_balls",
+    "state",
+)
+TEAM_COLUMNS = (
+    "name",
+    "points_positive",
+    "points_negative",
+    "sets_positive",
+    "sets_negative",
+    "balls_positive",
+    "balls_negative",
+    "games",
+    "games_won",
+)
+
+
+def game_date(game: dict[str, Any]) -> str | None:
+    """Return the effective (possibly rescheduled) date of a game."""
+    if game["new_date"] not in INVALID_DATES:
+        return game["new_date"]
+    if game["date"] not in INVALID_DATES:
+        return game["date"]
+    return None
+
+
+def season_of(day: str) -> str:
+    """Return the season (e.g. 2025/2026) a YYYY-MM-DD date belongs to."""
+    parsed = datetime.strptime(day, "%Y-%m-%d")
+    start = parsed.year if parsed.month >= 7 else parsed.year - 1
+    return f"{start}/{start + 1}"
+
+
+def finished_games(schedule: dict[str, Any], today: date) -> list[dict[str, Any]]:
+    """Return the games played before today that have a result."""
+    today_str = today.isoformat()
+    finished = []
+    for game in schedule.get("games", []):
+        day = game_date(game)
+        if day is None or day >= today_str:
+            continue
+        if game["team_a_sets"] == "0" and game["team_b_sets"] == "0":
+            continue
+        finished.append({**game, "date": day})
+    return finished
+
+
+class SeasonArchive:
+    """SQLite archive of finished games and tables per league and season.
+
+    All database access happens in the executor; the connection is shared
+    between executor threads and guarded by a lock. Once closed, the archive
+    ignores further stores instead of opening the database again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the archive."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._closed = False
+        # Store jobs in flight, awaited before the archive is closed
+        self.pending: set[asyncio.Future[int]] = set()
+        # Game numbers already archived per league, to skip unchanged games
+        self._archived: dict[str, set[str]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._closed = True
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def store(self, liga_id: str, data: dict[str, Any], today: date) -> int:
+        """Archive the finished games and the table of a league snapshot."""
+        scoreboard = data.get("scoreboard") or {}
+        schedule = data.get("schedule") or {}
+        games = finished_games(schedule, today)
+        if not games:
+            return 0
+        season = season_of(min(game["date"] for game in games))
+
+        with self._lock:
+            if self._closed:
+                return 0
+            connection = self._connect()
+            archived = self._archived.get(liga_id)
+            if archived is None:
+                archived = self._archived[liga_id] = {
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT game_number FROM games WHERE liga_id = ?", (liga_id,)
+                    )
+                }
+            new_games = [g for g in games if g["game_number"] not in archived]
+
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO leagues VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        liga_id,
+                        season,
+                        scoreboard.get("league"),
+                        scoreboard.get("group"),
+                        scoreboard.get("region"),
+                        scoreboard.get("last_change"),
+                    ),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO games VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (liga_id, game["game_number"], season)
+                        + tuple(game[column] for column in GAME_COLUMNS[1:])
+                        for game in new_games
+                    ],
+                )
+                if scoreboard.get("teams"):
+                    connection.execute(
+                        "DELETE FROM standings WHERE liga_id = ?", (liga_id,)
+                    )
+                    connection.executemany(
+                        "INSERT INTO standings VALUES "
+                        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (liga_id, position)
+                            + tuple(team.get(column) for column in TEAM_COLUMNS)
+                            for position, team in enumerate(
+                                scoreboard["teams"], start=1
+                            )
+                        ],
+                    )
+            archived.update(game["game_number"] for game in new_games)
+
+        if new_games:
+            _LOGGER.debug("Archived %s games of league %s", len(new_games), liga_id)
+        return len(new_games)
+
+    def query_games(
+        self,
+        liga_id: str | None = None,
+        season: str | None = None,
+        team: str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Return archived games matching all given filters, newest first."""
+        clauses = []
+        params: list[Any] = []
+        if liga_id is not None:
+            clauses.append("liga_id = ?")
+            params.append(liga_id)
+        if season is not None:
+            clauses.append("season = ?")
+            params.append(season)
+        if team is not None:
+            # Two indexed lookups instead of a scan over an OR
+            clauses.append(
+                "rowid IN (SELECT rowid FROM games WHERE team_a_name = ? "
+                "UNION SELECT rowid FROM games WHERE team_b_name = ?)"
+            )
+            params.extend((team, team))
+        if start_date is not None:
+            clauses.append("date >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            clauses.append("date <= ?")
+            params.append(end_date)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT * FROM games {where} ORDER BY date DESC, game_number LIMIT ?",
+                (*params, limit),
+            )
+            return [dict(row) for row in rows]
+
+    def query_table(self, liga_id: str) -> dict[str, Any] | None:
+        """Return the last archived table of a league."""
+        with self._lock:
+            connection = self._connect()
+            league = connection.execute(
+                "SELECT * FROM leagues WHERE liga_id = ?", (liga_id,)
+            ).fetchone()
+            if league is None:
+                return None
+            teams = connection.execute(
+                "SELECT * FROM standings WHERE liga_id = ? ORDER BY position",
+                (liga_id,),
+            )
+            result = dict(league)
+            result["group"] = result.pop("grp")
+            result["teams"] = [dict(team) for team in teams]
+            return result
+
+
+@callback
+def async_get_archive(hass: HomeAssistant) -> SeasonArchive:
+    """Return the shared archive."""
+    if (archive := hass.data.get(DATA_ARCHIVE)) is None:
+        archive = hass.data[DATA_ARCHIVE] = SeasonArchive(
+            hass.config.path(ARCHIVE_FILENAME)
+        )
+    return archive
+
+
+@callback
+def async_store(
+    hass: HomeAssistant, archive: SeasonArchive, liga_id: str, data: dict[str, Any]
+) -> asyncio.Future[int]:
+    """Archive a league snapshot in the executor, tracked until it is written."""
+    job = hass.async_add_executor_job(
+        archive.store, liga_id, data, dt_util.now().date()
+    )
+    archive.pending.add(job)
+    job.add_done_callback(archive.pending.discard)
+    return job
+
+
+async def async_close_archive(hass: HomeAssistant) -> None:
+    """Close the shared archive once its pending stores are written."""
+    if (archive := hass.data.pop(DATA_ARCHIVE, None)) is None:
+        return
+    if archive.pending:
+        await asyncio.wait(archive.pending)
+    await hass.async_add_executor_job(archive.close)
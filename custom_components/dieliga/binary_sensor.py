@@ -11,9 +11,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_TEAM_NAME
+from homeassistant.helpers.entity import Entity
+
+from .const import DOMAIN
 from .coordinator import DieligaDataUpdateCoordinator
-from .sensor import DieligaCoordinatorEntity
+from .sensor import DieligaCoordinatorEntity, async_setup_team_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,10 +27,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     coordinator: DieligaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    team_name = config_entry.data.get(CONF_TEAM_NAME)
 
-    if team_name:
-        async_add_entities([DieligaMatchTodayBinarySensor(coordinator, team_name)])
+    def _create(team_name: str | None, primary: bool) -> list[Entity]:
+        if not team_name:
+            return []
+        return [DieligaMatchTodayBinarySensor(coordinator, team_name)]
+
+    await async_setup_team_entities(
+        hass, config_entry, coordinator, async_add_entities, _create
+    )
 
 
 class DieligaMatchTodayBinarySensor(DieligaCoordinatorEntity, BinarySensorEntity):
@@ -49,28 +56,11 @@ class DieligaMatchTodayBinarySensor(DieligaCoordinatorEntity, BinarySensorEntity
     @property
     def is_on(self) -> bool:
         """Return true if a match is scheduled for today."""
-        data = self.coordinator.data.get("schedule")
-        if not data or not self._team_name:
+        if not self.coordinator.data or not self._team_name:
             return False
 
         today_str = datetime.now().strftime("%Y-%m-%d")
-        team_name_lower = self._team_name.lower()
-
-        for game in data.get("games", []):
-            game_team_a = game.get("team_a_name")
-            game_team_b = game.get("team_b_name")
-            if not game_team_a or not game_team_b:
-                continue
-            if (
-                team_name_lower == game_team_a.lower()
-                or team_name_lower == game_team_b.lower()
-            ):
-                game_date_str = (
-                    game["new_date"]
-                    if game["new_date"] not in ("-", "", "Unknown", "?")
-                    else game["date"]
-                )
-                if game_date_str == today_str:
-                    return True
-
-        return False
+        return self._memo(
+            ("today", today_str),
+            lambda: bool(self.coordinator.games.on(today_str, self._team_name)),
+        )
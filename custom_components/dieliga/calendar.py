@@ -1,20 +1,113 @@
 """Calendar platform for dieLiga."""
 
+import heapq
 import logging
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timedelta
+from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DOMAIN, CONF_TEAM_NAME
+from .const import CONF_CLUB, DOMAIN, SIGNAL_LEAGUE_ADDED
 from .coordinator import DieligaDataUpdateCoordinator
-from .sensor import DieligaCoordinatorEntity
+from .sensor import DieligaCoordinatorEntity, async_setup_team_entities
 
 _LOGGER = logging.getLogger(__name__)
 
+# Matches have no end time in the schedule
+MATCH_DURATION = timedelta(hours=2)
+
+NON_WORD_RE = re.compile(r"[\W_]+")
+# "e.V.", the suffix of registered clubs, after punctuation was removed
+REGISTERED_RE = re.compile(r"\be ?v\b")
+TEAM_NUMBER_RE = re.compile(r"\d+|[ivx]+")
+
+
+def club_key(name: str) -> str:
+    """Return the club of a team name, normalized to compare across leagues.
+
+    Case, accents, punctuation, "e.V." and a trailing team number ("2",
+    "II") are ignored, so "TSV Süd e.V. II" and "tsv sud 1" are one club.
+    """
+    text = unicodedata.normalize("NFKD", name.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    words = REGISTERED_RE.sub(" ", NON_WORD_RE.sub(" ", text)).split()
+    while len(words) > 1 and TEAM_NUMBER_RE.fullmatch(words[-1]):
+        words.pop()
+    return " ".join(words)
+
+
+def game_event(
+    game: dict[str, Any], location: str, league: str | None = None
+) -> CalendarEvent | None:
+    """Return the calendar event of a game, or None if it has no usable date."""
+    game_date_str = (
+        game["new_date"]
+        if game["new_date"] not in ("-", "", "Unknown", "?")
+        else game["date"]
+    )
+    game_time_str = (
+        game["time"] if game["time"] not in ("-", "", "Unknown", "?") else "00:00"
+    )
+
+    if game_date_str == "Unknown":
+        return None
+
+    try:
+        # dieLiga times are often just HH:MM
+        start_dt_naive = datetime.strptime(
+            f"{game_date_str} {game_time_str}", "%Y-%m-%d %H:%M"
+        )
+    except ValueError:
+        _LOGGER.debug(
+            "Could not parse date/time for game %s: %s %s",
+            game["game_number"],
+            game_date_str,
+            game_time_str,
+        )
+        return None
+
+    description = f"Match number: {game['game_number']}. Status: {game['state']}"
+    return CalendarEvent(
+        summary=f"{game['team_a_name']} vs {game['team_b_name']}",
+        start=dt_util.as_local(start_dt_naive),
+        end=dt_util.as_local(start_dt_naive + MATCH_DURATION),
+        description=f"{league}. {description}" if league else description,
+        location=location,
+    )
+
+
+class EventTimeline:
+    """Calendar events sorted by start, searched by bisection."""
+
+    def __init__(self, events: Iterable[CalendarEvent]) -> None:
+        """Sort the events."""
+        self.events = sorted(events, key=lambda event: event.start)
+        self._starts = [event.start for event in self.events]
+
+    def between(self, start: datetime, end: datetime) -> Iterator[CalendarEvent]:
+        """Yield the events starting between two dates, in order."""
+        low = bisect_left(self._starts, start)
+        high = bisect_right(self._starts, end)
+        return (self.events[index] for index in range(low, high))
+
+    def upcoming(self, now: datetime) -> CalendarEvent | None:
+        """Return the first event that has not ended yet."""
+        # All matches take MATCH_DURATION, so ends are sorted like starts
+        index = bisect_right(self._starts, now - MATCH_DURATION)
+        while index < len(self.events) and self.events[index].end <= now:
+            index += 1
+        return self.events[index] if index < len(self.events) else None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,101 +116,201 @@ async def async_setup_entry(
 ) -> None:
     """Set up the calendar platform."""
     coordinator: DieligaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    team_name = config_entry.data.get(CONF_TEAM_NAME)
 
-    async_add_entities([DieligaCalendarEntity(coordinator, team_name)])
+    def _create(team_name: str | None, primary: bool) -> list[Entity]:
+        return [DieligaCalendarEntity(coordinator, team_name, primary)]
+
+    await async_setup_team_entities(
+        hass, config_entry, coordinator, async_add_entities, _create
+    )
+    if club := config_entry.options.get(CONF_CLUB):
+        async_add_entities([DieligaClubCalendarEntity(coordinator, club)])
 
 
 class DieligaCalendarEntity(DieligaCoordinatorEntity, CalendarEntity):
     """Calendar entity for dieLiga matches."""
 
     def __init__(
-        self, coordinator: DieligaDataUpdateCoordinator, team_name: str | None = None
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str | None = None,
+        primary: bool = True,
     ) -> None:
         """Initialize the calendar entity."""
-        super().__init__(coordinator, team_name)
+        super().__init__(coordinator, team_name, primary)
         self._attr_name = (
             f"dieLiga Calendar {team_name}"
             if team_name
             else f"dieLiga Calendar {coordinator.liga_id}"
         )
-        self._attr_unique_id = f"dieliga_calendar_{coordinator.liga_id}"
-        self._events: list[CalendarEvent] = []
+        self._attr_unique_id = (
+            f"dieliga_calendar_{coordinator.liga_id}{self._unique_id_suffix}"
+        )
+
+    @property
+    def _timeline(self) -> EventTimeline:
+        """Return the calendar events of the current data."""
+        return self._memo("timeline", lambda: EventTimeline(self._build_events()))
 
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        now = datetime.now()
-        upcoming_events = [e for e in self._events if e.end > now]
-        if upcoming_events:
-            return sorted(upcoming_events, key=lambda x: x.start)[0]
-        return None
+        return self._timeline.upcoming(dt_util.now())
 
     async def async_get_events(
         self, hass: HomeAssistant, start_date: datetime, end_date: datetime
     ) -> list[CalendarEvent]:
         """Return calendar events between two bound dates."""
-        self._update_events()
+        return list(self._timeline.between(start_date, end_date))
+
+    def _build_events(self) -> list[CalendarEvent]:
+        """Build the calendar events of the team (or league) from the data."""
+        data = (self.coordinator.data or {}).get("schedule")
+        if not data:
+            return []
+
+        # If team_name is set, only show games for that team
+        games = (
+            self.coordinator.games.team(self._team_name)
+            if self._team_name
+            else data.get("games", [])
+        )
+        location = (
+            (self.coordinator.data or {}).get("scoreboard", {}).get("region", "Unknown")
+        )
         return [
-            e for e in self._events if e.start >= start_date and e.start <= end_date
+            event for game in games if (event := game_event(game, location)) is not None
         ]
 
-    def _update_events(self) -> None:
-        """Update the internal list of calendar events."""
-        data = self.coordinator.data.get("schedule")
-        if not data:
-            self._events = []
-            return
-
-        events = []
-        for game in data.get("games", []):
-            # If team_name is set, only show games for that team
-            if self._team_name:
-                if (
-                    self._team_name.lower() != game["team_a_name"].lower()
-                    and self._team_name.lower() != game["team_b_name"].lower()
-                ):
-                    continue
-
-            game_date_str = (
-                game["new_date"]
-                if game["new_date"] not in ("-", "", "Unknown", "?")
-                else game["date"]
-            )
-            game_time_str = (
-                game["time"]
-                if game["time"] not in ("-", "", "Unknown", "?")
-                else "00:00"
-            )
 
-            if game_date_str == "Unknown":
-                continue
+class DieligaClubCalendarEntity(DieligaCoordinatorEntity, CalendarEntity):
+    """Calendar of a club's matches in all loaded leagues.
 
-            try:
-                # dieLiga times are often just HH:MM
-                start_dt_naive = datetime.strptime(
-                    f"{game_date_str} {game_time_str}", "%Y-%m-%d %H:%M"
-                )
-                start_dt = dt_util.as_local(start_dt_naive)
-                # Assume 2 hours duration for a match
-                end_dt = dt_util.as_local(start_dt_naive + timedelta(hours=2))
-
-                event = CalendarEvent(
-                    summary=f"{game['team_a_name']} vs {game['team_b_name']}",
-                    start=start_dt,
-                    end=end_dt,
-                    description=f"Match number: {game['game_number']}. Status: {game['state']}",
-                    location=self.coordinator.data.get("scoreboard", {}).get(
-                        "region", "Unknown"
-                    ),
+    Each league keeps a timeline of the club's events, sorted by start and
+    rebuilt only when the league's data version changes. A query bisects
+    every timeline and merges the k slices with a heap, so it costs
+    O(k log m) plus the events returned instead of rebuilding the calendar.
+    """
+
+    _attr_icon = "mdi:calendar-multiple"
+
+    def __init__(self, coordinator: DieligaDataUpdateCoordinator, club: str) -> None:
+        """Initialize the club calendar."""
+        super().__init__(coordinator)
+        self._club = club_key(club)
+        self._attr_name = f"dieLiga Club {club}"
+        self._attr_unique_id = (
+            f"dieliga_club_calendar_{coordinator.liga_id}_{slugify(club)}"
+        )
+        # entry ID -> (data version, timeline of the club's events)
+        self._timelines: dict[str, tuple[int, EventTimeline]] = {}
+        # entry ID -> (coordinator of another league, its listener's removal)
+        self._followed: dict[
+            str, tuple[DieligaDataUpdateCoordinator, CALLBACK_TYPE]
+        ] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the updates of every league, including leagues loaded later."""
+        await super().async_added_to_hass()
+        self._async_follow_leagues()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LEAGUE_ADDED, self._async_league_added
+            )
+        )
+        self.async_on_remove(self._async_unfollow_leagues)
+
+    @callback
+    def _async_follow_leagues(self) -> None:
+        """Write the state whenever the data of another loaded league changes."""
+        self._async_prune_leagues()
+        for entry_id, coordinator in self.hass.data.get(DOMAIN, {}).items():
+            if coordinator is not self.coordinator and entry_id not in self._followed:
+                self._followed[entry_id] = (
+                    coordinator,
+                    coordinator.async_add_listener(self._handle_coordinator_update),
                 )
-                events.append(event)
-            except ValueError:
-                _LOGGER.debug(
-                    "Could not parse date/time for game %s: %s %s",
-                    game["game_number"],
-                    game_date_str,
-                    game_time_str,
+
+    @callback
+    def _async_prune_leagues(self) -> None:
+        """Drop the listeners and timelines of unloaded or reloaded leagues."""
+        loaded: dict[str, DieligaDataUpdateCoordinator] = self.hass.data.get(DOMAIN, {})
+        for entry_id, (coordinator, unsubscribe) in list(self._followed.items()):
+            if loaded.get(entry_id) is not coordinator:
+                unsubscribe()
+                del self._followed[entry_id]
+        for entry_id in [
+            entry_id for entry_id in self._timelines if entry_id not in loaded
+        ]:
+            del self._timelines[entry_id]
+
+    @callback
+    def _async_unfollow_leagues(self) -> None:
+        """Stop following the other leagues."""
+        for _coordinator, unsubscribe in self._followed.values():
+            unsubscribe()
+        self._followed.clear()
+
+    @callback
+    def _async_league_added(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Follow a league loaded after the calendar and update the next event."""
+        self._async_follow_leagues()
+        self.async_write_ha_state()
+
+    def _league_timelines(self) -> list[EventTimeline]:
+        """Return the club's timelines of the loaded leagues."""
+        self._async_prune_leagues()
+        loaded: dict[str, DieligaDataUpdateCoordinator] = self.hass.data.get(DOMAIN, {})
+        timelines = []
+        for entry_id, coordinator in loaded.items():
+            cached = self._timelines.get(entry_id)
+            if cached is None or cached[0] != coordinator.data_version:
+                cached = self._timelines[entry_id] = (
+                    coordinator.data_version,
+                    EventTimeline(self._club_events(coordinator)),
                 )
+            timelines.append(cached[1])
+        return timelines
+
+    def _club_events(
+        self, coordinator: DieligaDataUpdateCoordinator
+    ) -> Iterator[CalendarEvent]:
+        """Yield the events of the club's games in a league."""
+        data = coordinator.data or {}
+        scoreboard = data.get("scoreboard") or {}
+        location = scoreboard.get("region", "Unknown")
+        league = scoreboard.get("league")
+        clubs: dict[str, bool] = {}
+        for game in (data.get("schedule") or {}).get("games", []):
+            for name in (game["team_a_name"], game["team_b_name"]):
+                if name not in clubs:
+                    clubs[name] = club_key(name) == self._club
+            if (clubs[game["team_a_name"]] or clubs[game["team_b_name"]]) and (
+                event := game_event(game, location, league)
+            ) is not None:
+                yield event
 
-        self._events = events
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the club's next upcoming event in any league."""
+        now = dt_util.now()
+        upcoming = [
+            event
+            for timeline in self._league_timelines()
+            if (event := timeline.upcoming(now)) is not None
+        ]
+        return min(upcoming, key=lambda event: event.start, default=None)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the club's events between two dates, merged from all leagues."""
+        return list(
+            heapq.merge(
+                *(
+                    timeline.between(start_date, end_date)
+                    for timeline in self._league_timelines()
+                ),
+                key=lambda event: event.start,
+            )
+        )
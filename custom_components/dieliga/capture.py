@@ -0,0 +1,183 @@
+"""Record dieLiga HTTP responses and replay them without the network."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Iterable
+from time import monotonic
+from typing import Any, NamedTuple
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+CAPTURE_FORMAT = 1
+
+
+class CapturedResponse(NamedTuple):
+    """One recorded response."""
+
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    # Seconds since the capture started, and from request to the full body
+    started: float
+    elapsed: float
+
+
+class HttpCapture:
+    """Responses recorded by API clients for the selected leagues.
+
+    Clients record a response once its body is read, so the elapsed time
+    covers the whole download. The capture is written as gzip-compressed
+    JSON lines: a header line, then one line per response with the body
+    in base64.
+    """
+
+    def __init__(self, liga_ids: Iterable[str] | None = None) -> None:
+        """Initialize the capture."""
+        self.liga_ids = {str(liga_id) for liga_id in liga_ids or ()}
+        self.responses: list[CapturedResponse] = []
+        self._start = monotonic()
+
+    def wants(self, liga_id: str) -> bool:
+        """Return whether responses of a league are recorded."""
+        return not self.liga_ids or str(liga_id) in self.liga_ids
+
+    def record(
+        self,
+        url: str,
+        status: int,
+        headers: Iterable[tuple[str, str]],
+        body: bytes,
+        started: float,
+    ) -> None:
+        """Record a response whose request was sent at monotonic time started."""
+        self.responses.append(
+            CapturedResponse(
+                url,
+                status,
+                list(headers),
+                body,
+                round(started - self._start, 6),
+                round(monotonic() - started, 6),
+            )
+        )
+
+    def write(self, path: str) -> None:
+        """Write the capture to a compressed archive."""
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps({"format": CAPTURE_FORMAT}) + "\n")
+            for response in self.responses:
+                record = response._asdict()
+                record["body"] = base64.b64encode(response.body).decode("ascii")
+                file.write(json.dumps(record) + "\n")
+
+
+def load_capture(path: str) -> list[CapturedResponse]:
+    """Read the responses of a capture archive."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("format") != CAPTURE_FORMAT:
+            raise ValueError(f"Unsupported capture format {header.get('format')}")
+        responses = []
+        for line in file:
+            record = json.loads(line)
+            record["headers"] = [tuple(header) for header in record["headers"]]
+            record["body"] = base64.b64decode(record["body"])
+            responses.append(CapturedResponse(**record))
+    return responses
+
+
+class _ReplayContent:
+    """The body stream of a replayed response."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        """Yield the body in chunks of at most size bytes."""
+        for offset in range(0, len(self._body), size):
+            yield self._body[offset : offset + size]
+
+
+class ReplayResponse:
+    """A captured response with the parts of ClientResponse the client uses."""
+
+    def __init__(self, response: CapturedResponse) -> None:
+        """Initialize the response."""
+        self.url = response.url
+        self.status = response.status
+        self.headers = CIMultiDict(response.headers)
+        self.content = _ReplayContent(response.body)
+        self._body = response.body
+        content_type = self.headers.get(aiohttp.hdrs.CONTENT_TYPE, "")
+        _type, _sep, params = content_type.partition("charset=")
+        self.charset = params.split(";")[0].strip() or None
+
+    def raise_for_status(self) -> None:
+        """Raise ClientResponseError for error statuses."""
+        if self.status >= 400:
+            url = URL(self.url)
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url),
+                (),
+                status=self.status,
+                message=f"Captured status {self.status} for {self.url}",
+            )
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return self._body.decode(self.charset or "utf-8", errors="replace")
+
+
+class _ReplayRequest:
+    """Await the scaled original timing, then hand out the response."""
+
+    def __init__(self, response: CapturedResponse, time_scale: float) -> None:
+        self._response = response
+        self._time_scale = time_scale
+
+    async def __aenter__(self) -> ReplayResponse:
+        if self._time_scale:
+            await asyncio.sleep(self._response.elapsed * self._time_scale)
+        return ReplayResponse(self._response)
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class ReplaySession:
+    """Serve captured responses in place of an aiohttp ClientSession.
+
+    Responses of a URL are served in the order they were captured, and the
+    last one is repeated once they are used up. Each response takes its
+    captured time multiplied by time_scale; 0 serves them immediately.
+    """
+
+    def __init__(
+        self, responses: Iterable[CapturedResponse], time_scale: float = 1.0
+    ) -> None:
+        """Initialize the session."""
+        self.time_scale = time_scale
+        self._responses: dict[str, deque[CapturedResponse]] = defaultdict(deque)
+        for response in responses:
+            self._responses[response.url].append(response)
+
+    @property
+    def urls(self) -> list[str]:
+        """Return the captured URLs."""
+        return list(self._responses)
+
+    def get(self, url: str, **kwargs: Any) -> _ReplayRequest:
+        """Return the next captured response of a URL."""
+        queue = self._responses.get(str(url))
+        if not queue:
+            raise aiohttp.ClientConnectionError(f"No captured response for {url}")
+        response = queue.popleft() if len(queue) > 1 else queue[0]
+        return _ReplayRequest(response, self.time_scale)
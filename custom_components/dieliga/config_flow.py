@@ -1,16 +1,38 @@
+import asyncio
 import logging
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from .api import DieligaApiClient
+from .coordinator import async_store_handoff, entry_teams
+from .discovery import async_get_league_index, search_leagues
 from .const import (
     CONF_LIGA_ID,
+    CONF_QUERY,
+    DISCOVERY_MAX_RESULTS,
     CONF_TEAM_NAME,
+    CONF_TEAMS,
     CONF_URL,
     DOMAIN,
     CONF_REFRESH_TIME,
+    CONF_FULL_DIAGNOSTICS,
+    CONF_FAST_START,
+    CONF_ARCHIVE,
+    CONF_VERIFY_STANDINGS,
+    CONF_PROBE_CHANGES,
+    CONF_LARGE_ATTRIBUTES,
+    CONF_CLUB,
+    CONF_LIVE_MODE,
+    CONF_MAX_RESPONSE_SIZE,
+    DEFAULT_MAX_RESPONSE_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,37 +43,44 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 2
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._base_url: str | None = None
+        self._team_name: str | None = None
+        self._leagues: list[dict] = []
+        self._matches: list[dict] = []
+
     async def async_step_user(self, user_input=None):
         """Handle the user input for the config flow."""
         errors = {}
 
         if user_input is not None:
-            base_url = user_input[CONF_URL]
-            liga_id = str(user_input[CONF_LIGA_ID])
-
-            # Basic unique ID based on liga_id
-            await self.async_set_unique_id(liga_id)
-            self._abort_if_unique_id_configured()
-
-            # Validate connection
-            session = async_get_clientsession(self.hass)
-            client = DieligaApiClient(session, base_url)
-            try:
-                await client.async_get_scoreboard(liga_id)
-            except Exception:
-                errors["base"] = "cannot_connect"
+            if user_input.get(CONF_LIGA_ID) is None:
+                # No league ID known yet, let the user pick one from the index
+                self._base_url = user_input[CONF_URL]
+                self._team_name = user_input.get(CONF_TEAM_NAME)
+                index = await async_get_league_index(self.hass)
+                try:
+                    self._leagues = await index.async_get_leagues(self._base_url)
+                except Exception:
+                    errors["base"] = "cannot_connect"
+                else:
+                    if not self._leagues:
+                        return self.async_abort(reason="no_leagues_found")
+                    return await self.async_step_discover()
             else:
-                _LOGGER.debug("Validated dieliga integration with liga_id: %s", liga_id)
-                return self.async_create_entry(
-                    title=f"dieLiga {liga_id}", data=user_input
-                )
+                errors = await self._async_validate(user_input)
+                if not errors:
+                    return self.async_create_entry(
+                        title=f"dieLiga {user_input[CONF_LIGA_ID]}", data=user_input
+                    )
 
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_URL, default="https://www.ost.volleyball-freizeit.de"
                 ): str,
-                vol.Required(CONF_LIGA_ID, default=1234): int,
+                vol.Optional(CONF_LIGA_ID): int,
                 vol.Optional(CONF_TEAM_NAME): str,
             }
         )
@@ -60,6 +89,102 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=data_schema, errors=errors
         )
 
+    async def async_step_discover(self, user_input=None):
+        """Search the host's league index."""
+        errors = {}
+
+        if user_input is not None:
+            self._matches = search_leagues(
+                self._leagues, user_input.get(CONF_QUERY, "")
+            )
+            if self._matches:
+                return await self.async_step_league()
+            errors["base"] = "no_leagues"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema({vol.Optional(CONF_QUERY): str}),
+            errors=errors,
+            description_placeholders={"count": str(len(self._leagues))},
+        )
+
+    async def async_step_league(self, user_input=None):
+        """Pick one of the matching leagues."""
+        errors = {}
+
+        if user_input is not None:
+            data = {
+                CONF_URL: self._base_url,
+                CONF_LIGA_ID: int(user_input[CONF_LIGA_ID]),
+            }
+            if team_name := user_input.get(CONF_TEAM_NAME):
+                data[CONF_TEAM_NAME] = team_name
+            errors = await self._async_validate(data)
+            if not errors:
+                return self.async_create_entry(
+                    title=f"dieLiga {data[CONF_LIGA_ID]}", data=data
+                )
+
+        options = [
+            SelectOptionDict(
+                value=league["liga_id"],
+                label=(
+                    f"{league['league']} - {league['group']} "
+                    f"({league['region']}) [{league['liga_id']}]"
+                ),
+            )
+            for league in self._matches[:DISCOVERY_MAX_RESULTS]
+        ]
+        team_schema = (
+            vol.Optional(CONF_TEAM_NAME, default=self._team_name)
+            if self._team_name
+            else vol.Optional(CONF_TEAM_NAME)
+        )
+        return self.async_show_form(
+            step_id="league",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_LIGA_ID): SelectSelector(
+                        SelectSelectorConfig(
+                            options=options, mode=SelectSelectorMode.DROPDOWN
+                        )
+                    ),
+                    team_schema: str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def _async_validate(self, data: dict) -> dict[str, str]:
+        """Validate a league and keep the fetched data for the first refresh."""
+        base_url = data[CONF_URL]
+        liga_id = str(data[CONF_LIGA_ID])
+
+        # Basic unique ID based on liga_id
+        await self.async_set_unique_id(liga_id)
+        self._abort_if_unique_id_configured()
+
+        # Validate connection
+        session = async_get_clientsession(self.hass)
+        client = DieligaApiClient(session, base_url)
+        try:
+            scoreboard, schedule = await asyncio.gather(
+                client.async_get_scoreboard(liga_id),
+                client.async_get_schedule(liga_id),
+            )
+        except Exception:
+            return {"base": "cannot_connect"}
+
+        _LOGGER.debug("Validated dieliga integration with liga_id: %s", liga_id)
+        # Let the new entry's first refresh reuse what we just fetched
+        async_store_handoff(
+            self.hass,
+            base_url,
+            liga_id,
+            {"scoreboard": scoreboard, "schedule": schedule},
+        )
+        return {}
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -83,16 +208,66 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         options = self._config_entry.options
-        data = self._config_entry.data
+        teams = entry_teams(self._config_entry)
+        # Offer the league's teams; names can still be typed in freely
+        known_teams = list(teams)
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(
+            self._config_entry.entry_id
+        ):
+            scoreboard = (coordinator.data or {}).get("scoreboard") or {}
+            known_teams.extend(
+                team["name"]
+                for team in scoreboard.get("teams", [])
+                if team["name"] not in teams
+            )
         options_schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_TEAM_NAME,
-                    default=options.get(CONF_TEAM_NAME, data.get(CONF_TEAM_NAME, "")),
-                ): str,
+                vol.Optional(CONF_TEAMS, default=teams): SelectSelector(
+                    SelectSelectorConfig(
+                        options=known_teams,
+                        multiple=True,
+                        custom_value=True,
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                ),
                 vol.Optional(
                     CONF_REFRESH_TIME, default=options.get(CONF_REFRESH_TIME, 12)
-                ): int,
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_FULL_DIAGNOSTICS,
+                    default=options.get(CONF_FULL_DIAGNOSTICS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_FAST_START, default=options.get(CONF_FAST_START, False)
+                ): bool,
+                vol.Optional(
+                    CONF_ARCHIVE, default=options.get(CONF_ARCHIVE, False)
+                ): bool,
+                vol.Optional(
+                    CONF_VERIFY_STANDINGS,
+                    default=options.get(CONF_VERIFY_STANDINGS, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PROBE_CHANGES,
+                    default=options.get(CONF_PROBE_CHANGES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_LIVE_MODE, default=options.get(CONF_LIVE_MODE, False)
+                ): bool,
+                vol.Optional(
+                    CONF_MAX_RESPONSE_SIZE,
+                    default=options.get(
+                        CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_LARGE_ATTRIBUTES,
+                    default=options.get(CONF_LARGE_ATTRIBUTES, True),
+                ): bool,
+                vol.Optional(
+                    CONF_CLUB,
+                    description={"suggested_value": options.get(CONF_CLUB)},
+                ): str,
             }
         )
 
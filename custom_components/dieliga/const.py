@@ -2,4 +2,67 @@ DOMAIN = "dieliga"
 CONF_URL = "base_url"
 CONF_LIGA_ID = "liga_id"
 CONF_TEAM_NAME = "team_name"
+CONF_TEAMS = "teams"
 CONF_REFRESH_TIME = "refresh_time"
+CONF_FULL_DIAGNOSTICS = "full_diagnostics"
+CONF_QUERY = "query"
+CONF_FAST_START = "fast_start"
+CONF_ARCHIVE = "archive"
+CONF_VERIFY_STANDINGS = "verify_standings"
+CONF_PROBE_CHANGES = "probe_changes"
+CONF_LARGE_ATTRIBUTES = "large_attributes"
+CONF_CLUB = "club"
+CONF_LIVE_MODE = "live_mode"
+CONF_MAX_RESPONSE_SIZE = "max_response_size"
+
+SERVICE_PROFILE = "profile"
+SERVICE_GET_ARCHIVED_GAMES = "get_archived_games"
+SERVICE_GET_ARCHIVED_TABLE = "get_archived_table"
+SERVICE_GET_TEAM_STATISTICS = "get_team_statistics"
+SERVICE_GET_STANDINGS_HISTORY = "get_standings_history"
+SERVICE_GET_GAMES = "get_games"
+SERVICE_CAPTURE = "capture"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_REFRESH_COUNT = "refresh_count"
+ATTR_TRIGGER_REFRESH = "trigger_refresh"
+ATTR_LIGA_ID = "liga_id"
+ATTR_SEASON = "season"
+ATTR_TEAM = "team"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_LIMIT = "limit"
+ATTR_OPPONENT = "opponent"
+ATTR_FORM_LENGTH = "form_length"
+ATTR_STATE = "state"
+ATTR_COMPLETED = "completed"
+ATTR_VENUE = "venue"
+ATTR_ORDER = "order"
+
+HANDOFF_TTL = 300
+SNAPSHOT_SAVE_DELAY = 60
+STANDINGS_VERIFY_INTERVAL = 7 * 24 * 3600
+SCHEDULE_MAX_AGE = 2 * 24 * 3600
+
+WS_DEFAULT_PAGE_SIZE = 50
+WS_MAX_PAGE_SIZE = 500
+
+SCHEDULER_HOST_CONCURRENCY = 4
+
+LIVE_POLL_INTERVAL = 60
+LIVE_HOST_LIMIT = 2
+LIVE_TIMEOUT = 4 * 3600
+
+DISCOVERY_CONCURRENCY = 4
+DISCOVERY_TTL = 7 * 24 * 3600
+DISCOVERY_MAX_RESULTS = 100
+
+XML_MAX_BYTES = 5_000_000
+DEFAULT_MAX_RESPONSE_SIZE = XML_MAX_BYTES // 1_000_000
+XML_MAX_GAMES = 5_000
+XML_MAX_TEAMS = 500
+
+DIAGNOSTICS_SAMPLE_GAMES = 10
+DIAGNOSTICS_MAX_BYTES = 1_000_000
+
+SIGNAL_TEAMS_UPDATED = f"{DOMAIN}_teams_updated_{{}}"
+SIGNAL_LEAGUE_ADDED = f"{DOMAIN}_league_added"
@@ -1,16 +1,127 @@
 """Coordinator for dieLiga integration."""
 
+from __future__ import annotations
+
+import asyncio
 from datetime import timedelta
 import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import DieligaApiClient
-from .const import DOMAIN
+from .api import DieligaApiClient, DieligaResponseRejected
+from .archive import async_store
+from .const import (
+    CONF_TEAM_NAME,
+    CONF_TEAMS,
+    DOMAIN,
+    HANDOFF_TTL,
+    SCHEDULE_MAX_AGE,
+    SNAPSHOT_SAVE_DELAY,
+    STANDINGS_VERIFY_INTERVAL,
+)
+
+from .game_index import GameIndex
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_USER
+from .snapshot import freeze
+from .standings import LocalStandings, StandingsHistory
+from .statistics import LeagueStatistics
+
+if TYPE_CHECKING:
+    from .archive import SeasonArchive
+    from .profiler import DieligaRefreshProfiler
+    from .scheduler import RefreshScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+SNAPSHOT_STORAGE_VERSION = 1
+
+DATA_HANDOFF = f"{DOMAIN}_handoff"
+
+
+def _handoff_key(base_url: str, liga_id: str | int) -> tuple[str, str]:
+    """Return the handoff cache key of a league."""
+    return base_url.rstrip("/"), str(liga_id)
+
+
+def async_store_handoff(
+    hass: HomeAssistant, base_url: str, liga_id: str | int, data: dict[str, Any]
+) -> None:
+    """Keep data fetched by the config flow for the entry's first refresh."""
+    handoff: dict[tuple[str, str], tuple[float, dict[str, Any]]] = hass.data.setdefault(
+        DATA_HANDOFF, {}
+    )
+    now = monotonic()
+    for key, (stored, _data) in list(handoff.items()):
+        if now - stored > HANDOFF_TTL:
+            del handoff[key]
+    handoff[_handoff_key(base_url, liga_id)] = (now, data)
+
+
+def async_pop_handoff(
+    hass: HomeAssistant, base_url: str, liga_id: str | int
+) -> dict[str, Any] | None:
+    """Return and forget the handed off data of a league if it is still fresh."""
+    handoff = hass.data.get(DATA_HANDOFF, {})
+    stored = handoff.pop(_handoff_key(base_url, liga_id), None)
+    if stored is None or monotonic() - stored[0] > HANDOFF_TTL:
+        return None
+    return stored[1]
+
+
+class RefreshStats:
+    """Timing statistics of the coordinator's refreshes."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.count = 0
+        self.failures = 0
+        self.skipped_schedules = 0
+        self.rejected_responses = 0
+        self.unchanged_schedules = 0
+        self.last_duration: float | None = None
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def record(self, duration: float, success: bool) -> None:
+        """Record one refresh."""
+        self.count += 1
+        if not success:
+            self.failures += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "skipped_schedules": self.skipped_schedules,
+            "rejected_responses": self.rejected_responses,
+            "unchanged_schedules": self.unchanged_schedules,
+            "last_duration": self.last_duration,
+            "mean_duration": self.total_duration / self.count if self.count else None,
+            "max_duration": self.max_duration,
+        }
+
+
+def entry_teams(entry: ConfigEntry) -> list[str]:
+    """Return the teams tracked by an entry."""
+    if CONF_TEAMS in entry.options:
+        return list(entry.options[CONF_TEAMS])
+    team_name = entry.options.get(CONF_TEAM_NAME) or entry.data.get(CONF_TEAM_NAME)
+    return [team_name] if team_name else []
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last known data of an entry."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot")
+
 
 class DieligaDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -21,22 +132,244 @@ class DieligaDataUpdateCoordinator(DataUpdateCoordinator):
         client: DieligaApiClient,
         liga_id: str,
         update_interval=timedelta(hours=12),
+        initial_data: dict[str, Any] | None = None,
+        snapshot: Store[dict[str, Any]] | None = None,
+        scheduler: RefreshScheduler | None = None,
+        schedule_key: str | None = None,
+        archive: SeasonArchive | None = None,
+        verify_standings: bool = False,
+        probe_changes: bool = False,
+        teams: list[str] | None = None,
+        primary_team: str | None = None,
     ) -> None:
         """Initialize."""
         self.client = client
         self.liga_id = liga_id
+        self._initial_data = initial_data
+        self.snapshot = snapshot
+        self.profiler: DieligaRefreshProfiler | None = None
+        self.refresh_stats = RefreshStats()
+        self.refresh_interval: timedelta = update_interval
+        self.last_refresh: float | None = None
+        self.scheduler = scheduler
+        self.schedule_key = schedule_key or liga_id
+        self._priority = PRIORITY_USER
+        self.archive = archive
+        self.teams: list[str] = teams or []
+        # The team the entry was created with; its entities keep legacy IDs
+        self.primary_team = primary_team
+        self.options: dict[str, Any] = {}
+        # Generation of the published snapshot, bumped for every new data
+        self.data_version = 0
+        self.games = GameIndex(None)
+        self.statistics = LeagueStatistics(None)
+        self._standings: StandingsHistory | None = None
+        self.local_standings = LocalStandings(
+            STANDINGS_VERIFY_INTERVAL, verify_standings
+        )
+        self.probe_changes = probe_changes
+        # Polled every minute while a tracked team plays, see live.py
+        self.live = False
+        # last_change and time of the scoreboard that came with the schedule
+        self._schedule_last_change: str | None = None
+        self._schedule_fetched: float | None = None
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=update_interval,
+            # With a scheduler, background polls are driven by the scheduler
+            update_interval=None if scheduler is not None else update_interval,
         )
 
+    def set_refresh_interval(self, interval: timedelta) -> None:
+        """Change the interval between background polls."""
+        self.refresh_interval = interval
+        if self.scheduler is None:
+            self.update_interval = interval
+        else:
+            self.scheduler.async_schedule(self)
+
+    async def async_background_refresh(self) -> None:
+        """Refresh as a background poll, yielding to user-initiated refreshes."""
+        self._priority = PRIORITY_BACKGROUND
+        try:
+            await self._async_refresh(log_failures=True, scheduled=True)
+        finally:
+            self._priority = PRIORITY_USER
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, under the profiler if a profiling session is armed."""
+        if self.profiler is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+        await self.profiler.async_profile(self, super()._async_refresh(*args, **kwargs))
+
     async def _async_update_data(self):
         """Fetch data from API endpoint."""
+        if self._initial_data is not None:
+            # Seeded by the config flow, which just fetched the same data.
+            data, self._initial_data = self._initial_data, None
+            standings = StandingsHistory(data)
+            self._verify_standings(data["scoreboard"], data["schedule"], standings)
+            self._schedule_last_change = data["scoreboard"].get("last_change")
+            self._schedule_fetched = monotonic()
+        elif self.scheduler is not None:
+            async with self.scheduler.async_slot(self.client.base_url, self._priority):
+                data, standings = await self._async_fetch()
+        else:
+            data, standings = await self._async_fetch()
+        self.last_refresh = monotonic()
+        if data is self.data:
+            # An unchanged or rejected response; keep serving the last data
+            return data
+        # Publish a read only snapshot that executor jobs can share safely
+        data = freeze(data)
+        self._async_update_indexes(data)
+        standings.version = self.data_version
+        self._standings = standings
+        if self.snapshot is not None:
+            self.snapshot.async_delay_save(lambda: self.data, SNAPSHOT_SAVE_DELAY)
+        if self.archive is not None:
+            self.hass.async_create_background_task(
+                self._async_archive(
+                    async_store(self.hass, self.archive, self.liga_id, data)
+                ),
+                f"{DOMAIN} archive {self.liga_id}",
+            )
+        return data
+
+    def _async_update_indexes(self, data: dict[str, Any]) -> None:
+        """Precompute the indexes and team statistics of new data."""
+        self.data_version += 1
+        self.games = GameIndex(data, self.data_version)
+        self.statistics = LeagueStatistics(data, self.data_version)
+
+    @property
+    def standings(self) -> StandingsHistory:
+        """Return the matchday tables of the current data, built on first use."""
+        if self._standings is None or self._standings.version != self.data_version:
+            self._standings = StandingsHistory(self.data, self.data_version)
+        return self._standings
+
+    async def _async_archive(self, job: asyncio.Future[int]) -> None:
+        """Wait for the archive job of a snapshot, logging its errors."""
         try:
-            scoreboard = await self.client.async_get_scoreboard(self.liga_id)
-            schedule = await self.client.async_get_schedule(self.liga_id)
-            return {"scoreboard": scoreboard, "schedule": schedule}
+            await job
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error archiving league %s", self.liga_id)
+
+    async def _async_fetch(self) -> tuple[dict[str, Any], StandingsHistory]:
+        """Fetch scoreboard and schedule, skipping what is known to be current."""
+        start = monotonic()
+        try:
+            if self.live and self.data:
+                result = await self._async_fetch_live()
+            elif self.probe_changes:
+                result = await self._async_fetch_probe(start)
+            else:
+                result = await self._async_fetch_schedule(start)
+        except DieligaResponseRejected as err:
+            # Counted on its own rather than as a failed refresh
+            self.refresh_stats.rejected_responses += 1
+            if not self.data:
+                raise UpdateFailed(f"Rejected response from API: {err}") from err
+            _LOGGER.warning(
+                "Rejected response for league %s, keeping the last good data: %s",
+                self.liga_id,
+                err,
+            )
+            return self.data, self.standings
         except Exception as err:
+            self.refresh_stats.record(monotonic() - start, False)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        self.refresh_stats.record(monotonic() - start, True)
+        return result
+
+    async def _async_fetch_schedule(
+        self, now: float
+    ) -> tuple[dict[str, Any], StandingsHistory]:
+        """Fetch the schedule, and the scoreboard unless it can be derived."""
+        schedule = await self.client.async_get_schedule(self.liga_id)
+        standings = StandingsHistory({"schedule": schedule})
+        if self.local_standings.needs_scoreboard(schedule, now):
+            scoreboard = await self.client.async_get_scoreboard(self.liga_id)
+            self._verify_standings(scoreboard, schedule, standings)
+            self._schedule_last_change = scoreboard.get("last_change")
+            self._schedule_fetched = now
+        else:
+            scoreboard = self.local_standings.scoreboard(standings.current)
+        return {"scoreboard": scoreboard, "schedule": schedule}, standings
+
+    async def _async_fetch_live(self) -> tuple[dict[str, Any], StandingsHistory]:
+        """Fetch the schedule if it changed, deriving the scoreboard from it."""
+        schedule = await self.client.async_get_schedule_if_changed(self.liga_id)
+        if schedule is None:
+            self.refresh_stats.unchanged_schedules += 1
+            return self.data, self.standings
+        standings = StandingsHistory({"schedule": schedule})
+        if self.local_standings.trusted:
+            scoreboard = self.local_standings.scoreboard(standings.current)
+        else:
+            # Fetched again once the match is over
+            scoreboard = self.data["scoreboard"]
+        return {"scoreboard": scoreboard, "schedule": schedule}, standings
+
+    async def _async_fetch_probe(
+        self, now: float
+    ) -> tuple[dict[str, Any], StandingsHistory]:
+        """Fetch the small scoreboard, and the schedule only if it changed."""
+        scoreboard = await self.client.async_get_scoreboard(self.liga_id)
+        last_change = scoreboard.get("last_change")
+        if (
+            self.data
+            and self.data.get("schedule")
+            and self._schedule_fetched is not None
+            and now - self._schedule_fetched < SCHEDULE_MAX_AGE
+            and last_change not in (None, "Unknown")
+            and last_change == self._schedule_last_change
+        ):
+            self.refresh_stats.skipped_schedules += 1
+            if last_change == self.data["scoreboard"].get("last_change"):
+                # Nothing changed, so keep the snapshot and its indexes
+                return self.data, self.standings
+            return {"scoreboard": scoreboard, "schedule": self.data["schedule"]}, (
+                self.standings
+            )
+
+        schedule = await self.client.async_get_schedule(self.liga_id)
+        standings = StandingsHistory({"schedule": schedule})
+        # Both were fetched anyway, so check the derived table for free
+        self._verify_standings(scoreboard, schedule, standings)
+        self._schedule_last_change = last_change
+        self._schedule_fetched = now
+        return {"scoreboard": scoreboard, "schedule": schedule}, standings
+
+    def _verify_standings(
+        self,
+        scoreboard: dict[str, Any],
+        schedule: dict[str, Any],
+        standings: StandingsHistory,
+    ) -> None:
+        """Compare the fetched scoreboard with the table derived from the schedule."""
+        differences = self.local_standings.verify(
+            scoreboard, standings.current, schedule, monotonic()
+        )
+        if differences:
+            _LOGGER.log(
+                logging.WARNING
+                if self.local_standings.always_verify
+                else logging.DEBUG,
+                "Derived table of league %s differs from the scoreboard: %s",
+                self.liga_id,
+                "; ".join(differences),
+            )
+
+    async def async_load_snapshot(self) -> bool:
+        """Serve the last known data until the first refresh finishes."""
+        if self.snapshot is None:
+            return False
+        if (data := await self.snapshot.async_load()) is None:
+            return False
+        self.data = freeze(data)
+        self._async_update_indexes(self.data)
+        return True
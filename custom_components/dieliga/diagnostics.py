@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import json
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -14,20 +15,79 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     from homeassistant.components.diagnostics import async_redact_data
-    from .const import DOMAIN
+    from .const import (
+        CONF_FULL_DIAGNOSTICS,
+        DIAGNOSTICS_MAX_BYTES,
+        DIAGNOSTICS_SAMPLE_GAMES,
+        DOMAIN,
+    )
 
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    data = coordinator.data or {}
+    scoreboard = data.get("scoreboard") or {}
+    schedule = data.get("schedule") or {}
 
     to_redact = {
         "entry_id",
     }
 
-    diagnostics_data = {
-        "config_entry": async_redact_data(entry.as_dict(), to_redact),
-        "coordinator_data": {
-            "liga_id": coordinator.liga_id,
-            "data": coordinator.data,
+    coordinator_data: dict[str, Any] = {
+        "liga_id": coordinator.liga_id,
+        "last_update_success": coordinator.last_update_success,
+        "refresh_stats": coordinator.refresh_stats.as_dict(),
+        "scheduler": coordinator.scheduler.as_dict()
+        if coordinator.scheduler is not None
+        else None,
+        "local_standings": coordinator.local_standings.as_dict(),
+        "parser_backend": coordinator.client.parser_backend,
+        "string_pool_size": coordinator.client.string_pool_size,
+        "scoreboard": {
+            "league": scoreboard.get("league"),
+            "group": scoreboard.get("group"),
+            "region": scoreboard.get("region"),
+            "last_change": scoreboard.get("last_change"),
+            "team_count": len(scoreboard.get("teams", [])),
+        },
+        "schedule": {
+            "total_games": schedule.get("total_games"),
+            "completed_games": schedule.get("completed_games"),
+            "sample_games": schedule.get("games", [])[:DIAGNOSTICS_SAMPLE_GAMES],
         },
     }
 
-    return diagnostics_data
+    if entry.options.get(CONF_FULL_DIAGNOSTICS, False):
+        # Sizing the games of a big league is too slow for the event loop
+        coordinator_data["full_data"] = await hass.async_add_executor_job(
+            _build_full_dump, data, DIAGNOSTICS_MAX_BYTES
+        )
+
+    return {
+        "config_entry": async_redact_data(entry.as_dict(), to_redact),
+        "coordinator_data": coordinator_data,
+    }
+
+
+def _build_full_dump(data: dict[str, Any], max_bytes: int) -> dict[str, Any]:
+    """Return the coordinator data, dropping games beyond a size budget."""
+    scoreboard = data.get("scoreboard") or {}
+    schedule = dict(data.get("schedule") or {})
+    all_games = schedule.pop("games", [])
+    games: list[dict[str, Any]] = []
+    dump = {
+        "scoreboard": scoreboard,
+        "schedule": {**schedule, "games": games},
+        "truncated": False,
+    }
+    budget = max_bytes - len(json.dumps(dump, default=str))
+
+    count = 0
+    for game in all_games:
+        # Each game plus its separator
+        budget -= len(json.dumps(game, default=str)) + 2
+        if budget < 0:
+            break
+        count += 1
+
+    games.extend(all_games[:count])
+    dump["truncated"] = count < len(all_games)
+    return dump
@@ -0,0 +1,138 @@
+"""Cached index of the leagues hosted by a dieLiga instance."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .api import DieligaApiClient
+from .const import DISCOVERY_CONCURRENCY, DISCOVERY_TTL, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_LEAGUE_INDEX = f"{DOMAIN}_league_index"
+STORAGE_KEY = f"{DOMAIN}.league_index"
+STORAGE_VERSION = 1
+
+
+class LeagueIndex:
+    """Searchable index of league IDs, names, regions and teams per host.
+
+    The index is persisted with a TTL. Stale hosts are served from the store
+    while a background task crawls them again. Crawls that find no leagues
+    are not persisted, so the host is crawled again on the next request.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._crawls: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted index."""
+        if (stored := await self._store.async_load()) is not None:
+            self._hosts = stored.get("hosts", {})
+
+    async def async_get_leagues(self, base_url: str) -> list[dict[str, Any]]:
+        """Return the leagues of a host, crawling it only if it is unknown."""
+        base_url = base_url.rstrip("/")
+        host = self._hosts.get(base_url)
+        if host is None:
+            return await self._async_crawl(base_url)
+        if (
+            time.time() - host["updated"] > DISCOVERY_TTL
+            and base_url not in self._crawls
+        ):
+            self._hass.async_create_background_task(
+                self._async_recrawl(base_url), f"{DOMAIN} league index {base_url}"
+            )
+        return host["leagues"]
+
+    async def _async_recrawl(self, base_url: str) -> None:
+        """Crawl a stale host in the background, keeping its entry on errors."""
+        try:
+            await self._async_crawl(base_url)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.warning(
+                "Error refreshing the league index of %s", base_url, exc_info=True
+            )
+
+    async def _async_crawl(self, base_url: str) -> list[dict[str, Any]]:
+        """Crawl a host once, even if several callers ask concurrently."""
+        if (task := self._crawls.get(base_url)) is None:
+            task = self._hass.async_create_task(self._async_build(base_url))
+            self._crawls[base_url] = task
+            task.add_done_callback(lambda _task: self._crawls.pop(base_url, None))
+        return await asyncio.shield(task)
+
+    async def _async_build(self, base_url: str) -> list[dict[str, Any]]:
+        """Fetch the overview and every league's scoreboard."""
+        client = DieligaApiClient(async_get_clientsession(self._hass), base_url)
+        liga_ids = await client.async_get_league_ids()
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+        async def _async_fetch(liga_id: str) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    scoreboard = await client.async_get_scoreboard(liga_id)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.debug("Skipping league %s of %s", liga_id, base_url)
+                    return None
+            return {
+                "liga_id": liga_id,
+                "league": scoreboard["league"],
+                "group": scoreboard["group"],
+                "region": scoreboard["region"],
+                "teams": [team["name"] for team in scoreboard["teams"]],
+            }
+
+        results = await asyncio.gather(*(_async_fetch(liga_id) for liga_id in liga_ids))
+        leagues = [league for league in results if league is not None]
+        _LOGGER.debug("Indexed %s leagues of %s", len(leagues), base_url)
+        if not leagues:
+            # Likely a hiccup or a changed overview page; don't cache it for
+            # DISCOVERY_TTL, and keep what a previous crawl found
+            return self._hosts.get(base_url, {}).get("leagues", [])
+
+        self._hosts[base_url] = {"updated": time.time(), "leagues": leagues}
+        self._store.async_delay_save(lambda: {"hosts": self._hosts}, 10)
+        return leagues
+
+
+def search_leagues(leagues: list[dict[str, Any]], query: str) -> list[dict[str, Any]]:
+    """Return the leagues whose ID, name, group, region or teams match all words."""
+    words = query.casefold().split()
+    if not words:
+        return leagues
+
+    matches = []
+    for league in leagues:
+        haystack = " ".join(
+            [
+                league["liga_id"],
+                league["league"],
+                league["group"],
+                league["region"],
+                *league["teams"],
+            ]
+        ).casefold()
+        if all(word in haystack for word in words):
+            matches.append(league)
+    return matches
+
+
+async def async_get_league_index(hass: HomeAssistant) -> LeagueIndex:
+    """Return the shared league index, loading it on first use."""
+    if (index := hass.data.get(DATA_LEAGUE_INDEX)) is None:
+        index = LeagueIndex(hass)
+        await index.async_load()
+        hass.data[DATA_LEAGUE_INDEX] = index
+    return index
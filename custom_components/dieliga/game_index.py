@@ -0,0 +1,135 @@
+"""Per-team and per-date indexes of a dieLiga league snapshot."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Any
+
+from .archive import game_date
+from .statistics import parse_score
+
+
+def has_result(game: dict[str, Any]) -> bool:
+    """Return whether a result was entered for a game."""
+    return bool(parse_score(game["team_a_sets"]) or parse_score(game["team_b_sets"]))
+
+
+class _DatedGames:
+    """Games sorted by their effective date, searchable by date range."""
+
+    def __init__(self, games: list[tuple[str | None, dict[str, Any]]]) -> None:
+        """Sort the (date, game) pairs; games without a date go last."""
+        dated = sorted(
+            ((day, game) for day, game in games if day is not None),
+            key=lambda item: item[0],
+        )
+        self.dates = [day for day, _game in dated]
+        self.games = [game for _day, game in dated]
+        self.undated = [game for day, game in games if day is None]
+
+    def between(self, start: str | None, end: str | None) -> list[dict[str, Any]]:
+        """Return the games from start to end (YYYY-MM-DD, inclusive)."""
+        if start is None and end is None:
+            return self.games + self.undated
+        low = bisect_left(self.dates, start) if start is not None else 0
+        high = bisect_right(self.dates, end) if end is not None else len(self.dates)
+        return self.games[low:high]
+
+
+class GameIndex:
+    """Indexes over the games and table of one snapshot, built once per refresh.
+
+    Entities and queries look up a team's games, table row or the games of a
+    date range here instead of scanning the whole schedule.
+    """
+
+    def __init__(self, data: dict[str, Any] | None, version: int = 0) -> None:
+        """Build the indexes of a snapshot."""
+        self.version = version
+        data = data or {}
+        self.games: list[dict[str, Any]] = (data.get("schedule") or {}).get("games", [])
+        self._by_team: dict[str, list[dict[str, Any]]] = {}
+        self._table: dict[str, tuple[int, dict[str, Any]]] = {}
+
+        dated = []
+        team_dated: dict[str, list[tuple[str | None, dict[str, Any]]]] = {}
+        for game in self.games:
+            day = game_date(game)
+            dated.append((day, game))
+            for name in (game["team_a_name"], game["team_b_name"]):
+                self._by_team.setdefault(name.lower(), []).append(game)
+                team_dated.setdefault(name.lower(), []).append((day, game))
+        self._dated = _DatedGames(dated)
+        self._team_dated = {
+            team: _DatedGames(games) for team, games in team_dated.items()
+        }
+
+        teams = (data.get("scoreboard") or {}).get("teams", [])
+        self.teams: list[dict[str, Any]] = teams
+        for position, team in enumerate(teams, start=1):
+            self._table[team["name"].lower()] = (position, team)
+
+    def team(self, team: str) -> list[dict[str, Any]]:
+        """Return the games of a team in schedule order."""
+        return self._by_team.get(team.lower(), [])
+
+    def table_row(self, team: str) -> tuple[int, dict[str, Any]] | None:
+        """Return the position and table row of a team."""
+        return self._table.get(team.lower())
+
+    def between(
+        self, start: str | None = None, end: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Return the games played from start to end (YYYY-MM-DD, inclusive)."""
+        return self._dated.between(start, end)
+
+    def on(self, day: str, team: str | None = None) -> list[dict[str, Any]]:
+        """Return the games of a date, optionally of one team only."""
+        return self.query(team=team, start=day, end=day)
+
+    def query(
+        self,
+        team: str | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        state: str | None = None,
+        opponent: str | None = None,
+        venue: str | None = None,
+        completed: bool | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return the matching games in date order, undated games last.
+
+        The team (or opponent) and date range are looked up in the indexes;
+        the remaining filters only run over the games found there. ``venue``
+        (home or away) is relative to ``team``.
+        """
+        if (key := team or opponent) is not None:
+            dated = self._team_dated.get(key.lower())
+            if dated is None:
+                return []
+        else:
+            dated = self._dated
+        games = dated.between(start, end)
+
+        team = team.lower() if team else None
+        opponent = opponent.lower() if opponent and team else None
+        state = state.lower() if state else None
+        if venue is not None and team is None:
+            venue = None
+        if opponent is None and state is None and venue is None and completed is None:
+            return games
+
+        matches = []
+        for game in games:
+            home = game["team_a_name"].lower()
+            away = game["team_b_name"].lower()
+            if opponent is not None and opponent not in (home, away):
+                continue
+            if venue == "home" and home != team or venue == "away" and away != team:
+                continue
+            if state is not None and game["state"].lower() != state:
+                continue
+            if completed is not None and has_result(game) != completed:
+                continue
+            matches.append(game)
+        return matches
@@ -0,0 +1,144 @@
+"""Live match-day mode: poll every minute while a tracked team plays."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .archive import INVALID_DATES, game_date
+from .const import CONF_LIVE_MODE, LIVE_POLL_INTERVAL, LIVE_TIMEOUT
+from .game_index import has_result
+
+if TYPE_CHECKING:
+    from .coordinator import DieligaDataUpdateCoordinator
+    from .scheduler import RefreshScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Kickoffs further ahead are re-checked after the next refresh instead
+MAX_KICKOFF_DELAY = timedelta(days=1)
+
+
+def kickoff(game: dict[str, Any]) -> datetime | None:
+    """Return the local start of a game, or None without a date and time."""
+    day = game_date(game)
+    if day is None or game["time"] in INVALID_DATES:
+        return None
+    try:
+        start = datetime.strptime(f"{day} {game['time']}", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+    return dt_util.as_local(start)
+
+
+def live_games(games: Iterable[dict[str, Any]], now: datetime) -> Iterator[dict]:
+    """Yield the games that kicked off, have no result and did not time out."""
+    timeout = timedelta(seconds=LIVE_TIMEOUT)
+    for game in games:
+        start = kickoff(game)
+        if (
+            start is not None
+            and start <= now < start + timeout
+            and not has_result(game)
+        ):
+            yield game
+
+
+def next_kickoff(games: Iterable[dict[str, Any]], now: datetime) -> datetime | None:
+    """Return the earliest kickoff after now."""
+    starts = (kickoff(game) for game in games)
+    return min((start for start in starts if start and start > now), default=None)
+
+
+class LiveMode:
+    """Switch an entry between its normal interval and minute-level polling.
+
+    Live mode starts when a game of a tracked team kicked off according to
+    the schedule, and ends once all of them have a result or ran for
+    ``LIVE_TIMEOUT``. Live polls fetch only the schedule, conditionally, and
+    derive the table from it. The scheduler caps the live entries per host;
+    an entry that found no free slot asks again a minute later.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DieligaDataUpdateCoordinator,
+        scheduler: RefreshScheduler,
+    ) -> None:
+        """Initialize the live mode."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._scheduler = scheduler
+        self._timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_update(self) -> None:
+        """Start or stop live polling for the current data, after each refresh."""
+        self._async_cancel_timer()
+        coordinator = self._coordinator
+        if not coordinator.options.get(CONF_LIVE_MODE, False) or not coordinator.data:
+            self._async_stop_live()
+            return
+        now = dt_util.now()
+        # Both teams of a derby share their games
+        games = list(
+            {
+                id(game): game
+                for team in coordinator.teams
+                for game in coordinator.games.team(team)
+            }.values()
+        )
+        if any(live_games(games, now)):
+            if not coordinator.live:
+                if self._scheduler.async_start_live(coordinator):
+                    _LOGGER.debug("Live mode started for %s", coordinator.liga_id)
+                else:
+                    # Another league of the host is live; try again later
+                    self._async_call_later(LIVE_POLL_INTERVAL)
+            return
+        self._async_stop_live()
+        start = next_kickoff(games, now)
+        if start is not None and start - now <= MAX_KICKOFF_DELAY:
+            self._async_call_later((start - now).total_seconds())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop live polling and the kickoff timer."""
+        self._async_cancel_timer()
+        self._async_stop_live(refresh=False)
+
+    @callback
+    def _async_stop_live(self, refresh: bool = True) -> None:
+        """Return to the normal interval, refreshing once if the table is stale."""
+        coordinator = self._coordinator
+        if not coordinator.live:
+            return
+        self._scheduler.async_stop_live(coordinator)
+        _LOGGER.debug("Live mode ended for %s", coordinator.liga_id)
+        if refresh and not coordinator.local_standings.trusted:
+            # Live polls kept the last official table
+            self._hass.async_create_task(coordinator.async_request_refresh())
+
+    @callback
+    def _async_call_later(self, delay: float) -> None:
+        """Check again after delay seconds."""
+
+        @callback
+        def _async_check(_now: Any) -> None:
+            self._timer = None
+            self.async_update()
+
+        self._timer = async_call_later(self._hass, delay, _async_check)
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer()
+            self._timer = None
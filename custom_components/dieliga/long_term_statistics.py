@@ -0,0 +1,133 @@
+"""Table positions, points and set ratios as long-term statistics."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+from .coordinator import DieligaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def statistic_id(liga_id: str, team: str, kind: str) -> str:
+    """Return the external statistic ID of a team's position, points or set ratio."""
+    return f"{DOMAIN}:{liga_id}_{slugify(team)}_{kind}"
+
+
+def matchday_start(day: str) -> datetime:
+    """Return the start of a matchday's date, aligned to the hour in UTC."""
+    start = dt_util.start_of_local_day(datetime.strptime(day, "%Y-%m-%d").date())
+    return dt_util.as_utc(start).replace(minute=0)
+
+
+def row_values(row: dict[str, Any]) -> dict[str, float | None]:
+    """Return the statistic values of a table row.
+
+    The set ratio is sets won per set lost; without a lost set it is the
+    number of sets won, and None before the first set was played.
+    """
+    won, lost = row["sets_positive"], row["sets_negative"]
+    return {
+        "position": float(row["position"]),
+        "points": float(row["points_positive"]),
+        "set_ratio": round(won / lost, 3) if lost else float(won) if won else None,
+    }
+
+
+@callback
+def _async_add_statistics(
+    hass: HomeAssistant, metadata: dict[str, Any], statistics: list[dict[str, Any]]
+) -> None:
+    """Queue one batch of statistics in the recorder."""
+    # The recorder is optional and only imported once it is loaded
+    from homeassistant.components.recorder.statistics import (
+        async_add_external_statistics,
+    )
+
+    async_add_external_statistics(hass, metadata, statistics)
+
+
+class StandingsStatistics:
+    """Import the table after each matchday as long-term statistics.
+
+    The first import after setup covers every matchday of the season, which
+    backfills the statistics when the league is added. Later refreshes only
+    import the rows of matchdays whose tables changed since, one batch per
+    statistic. Without tracked teams, every team of the league is imported.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: DieligaDataUpdateCoordinator
+    ) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._version: int | None = None
+        # (team, day_of_play) -> values imported last
+        self._imported: dict[tuple[str, int], dict[str, float | None]] = {}
+
+    @callback
+    def async_update(self) -> None:
+        """Import the changed matchday tables of a new data version."""
+        if "recorder" not in self.hass.config.components:
+            return
+        if self.coordinator.data_version == self._version:
+            return
+        self._version = self.coordinator.data_version
+        for metadata, statistics in self.batches(self.coordinator.standings.matchdays):
+            _async_add_statistics(self.hass, metadata, statistics)
+
+    def batches(
+        self, matchdays: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """Return the metadata and rows of every statistic with changed rows."""
+        tracked = {team.lower() for team in self.coordinator.teams}
+        # The recorder keeps one row per hour, so of several matchdays on
+        # one date only the table after the last one is imported
+        latest: dict[tuple[str, datetime], tuple[int, dict[str, Any]]] = {}
+        for matchday in matchdays:
+            start = matchday_start(matchday["date"])
+            for row in matchday["teams"]:
+                if tracked and row["name"].lower() not in tracked:
+                    continue
+                latest[(row["name"], start)] = (matchday["day_of_play"], row)
+
+        changed: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for (team, start), (day_of_play, row) in latest.items():
+            values = row_values(row)
+            key = (team.lower(), day_of_play)
+            if self._imported.get(key) == values:
+                continue
+            self._imported[key] = values
+            for kind, value in values.items():
+                if value is None:
+                    continue
+                changed.setdefault((team, kind), []).append(
+                    {"start": start, "mean": value, "min": value, "max": value}
+                )
+
+        batches = []
+        for (team, kind), statistics in changed.items():
+            metadata = {
+                "has_mean": True,
+                "has_sum": False,
+                "name": f"{team} {kind.replace('_', ' ')}",
+                "source": DOMAIN,
+                "statistic_id": statistic_id(self.coordinator.liga_id, team, kind),
+                "unit_of_measurement": None,
+            }
+            batches.append((metadata, statistics))
+        if batches:
+            _LOGGER.debug(
+                "Importing %s statistics of league %s",
+                len(batches),
+                self.coordinator.liga_id,
+            )
+        return batches
@@ -0,0 +1,184 @@
+"""On-demand profiling of dieLiga refresh cycles."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+import tracemalloc
+from collections.abc import Awaitable, Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import DieligaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 25
+# A session without enough refreshes ends after this, with what it recorded
+MAX_SESSION_DURATION = timedelta(hours=1)
+
+
+class DieligaRefreshProfiler:
+    """Run cProfile and tracemalloc around the next refreshes of coordinators.
+
+    A refresh covers the fetch, the XML parsing, the coordinator update and
+    the state writes of all listening entities, because all of those happen
+    inside ``DataUpdateCoordinator._async_refresh``.
+
+    The session ends once each coordinator ran its refreshes, was unloaded
+    or ``MAX_SESSION_DURATION`` passed, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: Iterable[DieligaDataUpdateCoordinator],
+        refresh_count: int,
+    ) -> None:
+        """Initialize the profiler."""
+        self._hass = hass
+        self._remaining = {coordinator: refresh_count for coordinator in coordinators}
+        self._profile = cProfile.Profile()
+        self._active = 0
+        self._started_tracemalloc = False
+        self._started = dt_util.now()
+        self._timeout: CALLBACK_TYPE | None = None
+        self._finished = False
+
+    def start(self) -> None:
+        """Arm the profiler on all selected coordinators."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        for coordinator in self._remaining:
+            coordinator.profiler = self
+        self._timeout = async_call_later(
+            self._hass, MAX_SESSION_DURATION, self._async_timeout
+        )
+        _LOGGER.info(
+            "Profiling the next refreshes of dieLiga leagues: %s",
+            ", ".join(coordinator.liga_id for coordinator in self._remaining),
+        )
+
+    async def async_profile(
+        self, coordinator: DieligaDataUpdateCoordinator, refresh: Awaitable[None]
+    ) -> None:
+        """Await a refresh of the coordinator with profiling enabled."""
+        self._enable()
+        try:
+            await refresh
+        finally:
+            self._disable()
+            # A cancelled coordinator is no longer counted
+            if coordinator in self._remaining:
+                self._remaining[coordinator] -= 1
+                if self._remaining[coordinator] <= 0:
+                    await self._async_release(coordinator)
+
+    @callback
+    def async_cancel(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Stop profiling the coordinator, e.g. because its entry is unloaded."""
+        if coordinator in self._remaining:
+            self._hass.async_create_task(self._async_release(coordinator))
+
+    @callback
+    def _async_timeout(self, _now: datetime) -> None:
+        """End the session with the refreshes recorded so far."""
+        self._timeout = None
+        _LOGGER.info("dieLiga profiling session timed out")
+        for coordinator in list(self._remaining):
+            self.async_cancel(coordinator)
+
+    async def _async_release(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Disarm the coordinator and finish once no coordinator is left."""
+        self._remaining.pop(coordinator, None)
+        coordinator.profiler = None
+        if not self._remaining and not self._finished:
+            self._finished = True
+            await self._async_finish()
+
+    def _enable(self) -> None:
+        """Enable cProfile for the first concurrently running refresh."""
+        self._active += 1
+        if self._active > 1:
+            return
+        try:
+            self._profile.enable()
+        except ValueError as err:
+            # Another profiler (e.g. the profiler integration) is running.
+            _LOGGER.warning("Could not enable cProfile: %s", err)
+
+    def _disable(self) -> None:
+        """Disable cProfile once the last concurrent refresh is done."""
+        self._active -= 1
+        if self._active == 0:
+            self._profile.disable()
+
+    async def _async_finish(self) -> None:
+        """Write the results and announce them."""
+        if self._timeout is not None:
+            self._timeout()
+            self._timeout = None
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        timestamp = self._started.strftime("%Y%m%d-%H%M%S")
+        stats_path = self._hass.config.path(f"{DOMAIN}_profile.{timestamp}.pstats")
+        allocations_path = self._hass.config.path(
+            f"{DOMAIN}_allocations.{timestamp}.txt"
+        )
+        await self._hass.async_add_executor_job(
+            self._write_results, snapshot, stats_path, allocations_path
+        )
+
+        _LOGGER.info("dieLiga profile written to %s", stats_path)
+        persistent_notification.async_create(
+            self._hass,
+            (
+                f"Profiling of the dieLiga refreshes finished.\n\n"
+                f"- cProfile stats: `{stats_path}`\n"
+                f"- Top allocations: `{allocations_path}`"
+            ),
+            title="dieLiga profile",
+            notification_id=f"{DOMAIN}_profile",
+        )
+
+    def _write_results(
+        self,
+        snapshot: tracemalloc.Snapshot,
+        stats_path: str,
+        allocations_path: str,
+    ) -> None:
+        """Dump the pstats file and the top allocations summary."""
+        self._profile.dump_stats(stats_path)
+
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        statistics = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in statistics)
+        lines = [
+            f"Top {TOP_ALLOCATIONS} allocations (of {total / 1024:.1f} KiB traced)",
+            "",
+        ]
+        for index, stat in enumerate(statistics[:TOP_ALLOCATIONS], start=1):
+            frame = stat.traceback[0]
+            lines.append(
+                f"#{index}: {frame.filename}:{frame.lineno}: "
+                f"{stat.size / 1024:.1f} KiB in {stat.count} blocks"
+            )
+        with open(allocations_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
@@ -0,0 +1,223 @@
+"""Integration-wide refresh scheduler for dieLiga."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from time import monotonic, time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    LIVE_HOST_LIMIT,
+    LIVE_POLL_INTERVAL,
+    SCHEDULER_HOST_CONCURRENCY,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import DieligaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 1
+
+
+def next_poll_delay(key: str, interval: float, now: float) -> float:
+    """Return the seconds until the next poll slot of key.
+
+    The slot's offset within the interval is derived from the key, so polls
+    of different entries are spread across the interval and stay put across
+    restarts. Intervals below a second are treated as one second.
+    """
+    interval = max(interval, 1)
+    phase = zlib.crc32(key.encode()) % int(interval)
+    next_poll = phase + math.ceil((now - phase) / interval) * interval
+    if next_poll - now < 1:
+        next_poll += interval
+    return next_poll - now
+
+
+class HostQueue:
+    """Concurrency cap for the fetches of one host, served by priority."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the queue."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self.completed = {PRIORITY_USER: 0, PRIORITY_BACKGROUND: 0}
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queued(self) -> int:
+        """Return the number of fetches waiting for a slot."""
+        return sum(1 for _p, _s, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: int) -> None:
+        """Wait for a free slot; lower priorities go first."""
+        start = monotonic()
+        if self._active < self._limit and not self.queued:
+            self._active += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed to us right before the cancellation.
+                    self.release(priority, count=False)
+                raise
+        wait = monotonic() - start
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def release(self, priority: int, count: bool = True) -> None:
+        """Hand the slot to the next waiter or free it."""
+        if count:
+            self.completed[priority] += 1
+        while self._waiters:
+            _priority, _sequence, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue statistics."""
+        completed = sum(self.completed.values())
+        return {
+            "active": self._active,
+            "queued": self.queued,
+            "completed_user": self.completed[PRIORITY_USER],
+            "completed_background": self.completed[PRIORITY_BACKGROUND],
+            "mean_wait": self.total_wait / completed if completed else None,
+            "max_wait": self.max_wait,
+        }
+
+
+class RefreshScheduler:
+    """Spread the background polls of all entries and cap fetches per host.
+
+    Every entry polls in a fixed slot of its interval derived from its entry
+    ID, so a restart does not make all entries refresh at the same moment.
+    User-initiated refreshes take precedence over background polls. Entries
+    in live mode poll every minute, but only a few per host at a time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._hosts: dict[str, HostQueue] = {}
+        self._timers: dict[DieligaDataUpdateCoordinator, CALLBACK_TYPE] = {}
+        self._live: dict[str, set[DieligaDataUpdateCoordinator]] = {}
+        self.skipped_polls = 0
+
+    @asynccontextmanager
+    async def async_slot(self, host: str, priority: int) -> AsyncIterator[None]:
+        """Hold one of the host's fetch slots."""
+        queue = self._hosts.get(host)
+        if queue is None:
+            queue = self._hosts[host] = HostQueue(SCHEDULER_HOST_CONCURRENCY)
+        await queue.acquire(priority)
+        try:
+            yield
+        finally:
+            queue.release(priority)
+
+    @callback
+    def async_start_live(self, coordinator: DieligaDataUpdateCoordinator) -> bool:
+        """Poll a coordinator at the live interval if its host has room."""
+        live = self._live.setdefault(coordinator.client.base_url, set())
+        if coordinator not in live:
+            if len(live) >= LIVE_HOST_LIMIT:
+                return False
+            live.add(coordinator)
+            coordinator.live = True
+            self.async_schedule(coordinator)
+        return True
+
+    @callback
+    def async_stop_live(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Return a coordinator to its normal interval."""
+        live = self._live.get(coordinator.client.base_url, set())
+        if coordinator in live:
+            live.discard(coordinator)
+            coordinator.live = False
+            self.async_schedule(coordinator)
+
+    @staticmethod
+    def poll_interval(coordinator: DieligaDataUpdateCoordinator) -> float:
+        """Return the seconds between background polls of a coordinator."""
+        if coordinator.live:
+            return LIVE_POLL_INTERVAL
+        return coordinator.refresh_interval.total_seconds()
+
+    @callback
+    def async_schedule(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """(Re)schedule the next background poll of a coordinator."""
+        self.async_unschedule(coordinator)
+        delay = next_poll_delay(
+            coordinator.schedule_key, self.poll_interval(coordinator), time()
+        )
+        _LOGGER.debug("Next poll of %s in %.0f s", coordinator.liga_id, delay)
+
+        @callback
+        def _async_poll(_now: Any) -> None:
+            self._timers.pop(coordinator, None)
+            self.async_schedule(coordinator)
+            self._hass.async_create_background_task(
+                self._async_poll(coordinator), f"{DOMAIN} poll {coordinator.liga_id}"
+            )
+
+        self._timers[coordinator] = async_call_later(self._hass, delay, _async_poll)
+
+    @callback
+    def async_unschedule(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Stop the background polls of a coordinator."""
+        if (cancel := self._timers.pop(coordinator, None)) is not None:
+            cancel()
+
+    async def _async_poll(self, coordinator: DieligaDataUpdateCoordinator) -> None:
+        """Run a background poll unless the data is fresh anyway."""
+        entry = coordinator.config_entry
+        if entry is not None and entry.pref_disable_polling:
+            return
+        last = coordinator.last_refresh
+        interval = self.poll_interval(coordinator)
+        if last is not None and monotonic() - last < interval / 2:
+            # Refreshed by the user or at setup since the last slot.
+            self.skipped_polls += 1
+            return
+        await coordinator.async_background_refresh()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the queue statistics."""
+        return {
+            "scheduled_entries": len(self._timers),
+            "skipped_polls": self.skipped_polls,
+            "live_entries": sum(len(live) for live in self._live.values()),
+            "hosts": {host: queue.as_dict() for host, queue in self._hosts.items()},
+        }
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Return the integration-wide scheduler."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = RefreshScheduler(hass)
+    return scheduler
@@ -1,18 +1,26 @@
 import logging
+from collections.abc import Callable, Hashable
 from datetime import datetime
+from typing import Any, TypeVar
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
 
-from .const import DOMAIN, CONF_TEAM_NAME
+from .const import CONF_LARGE_ATTRIBUTES, DOMAIN, SIGNAL_TEAMS_UPDATED
 from .coordinator import DieligaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -21,13 +29,73 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coordinator: DieligaDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    team_name = config_entry.data.get(CONF_TEAM_NAME)
 
-    async_add_entities(
-        [
-            DieligaScoreboardSensor(coordinator, team_name),
-            DieligaScheduleSensor(coordinator, team_name),
+    def _create(team_name: str | None, primary: bool) -> list[Entity]:
+        entities: list[Entity] = [
+            DieligaScoreboardSensor(coordinator, team_name, primary),
+            DieligaScheduleSensor(coordinator, team_name, primary),
         ]
+        if team_name:
+            entities.extend(
+                [
+                    DieligaFormSensor(coordinator, team_name, primary),
+                    DieligaPointsPerGameSensor(coordinator, team_name, primary),
+                ]
+            )
+        return entities
+
+    await async_setup_team_entities(
+        hass, config_entry, coordinator, async_add_entities, _create
+    )
+
+
+async def async_setup_team_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    coordinator: DieligaDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    create: Callable[[str | None, bool], list[Entity]],
+) -> None:
+    """Add the entities of every tracked team and follow changes of the teams.
+
+    Without tracked teams, the entities of the whole league are added
+    (team None). The entities of the team the entry was created with keep
+    their unique IDs without a team suffix.
+    """
+    added: dict[str | None, list[Entity]] = {}
+
+    async def _async_update_teams(teams: list[str]) -> None:
+        wanted = {team.lower(): team for team in teams} if teams else {None: None}
+        registry = er.async_get(hass)
+        for key in [key for key in added if key not in wanted]:
+            removed = added.pop(key)
+            unique_ids = {entity.unique_id for entity in removed}
+            for entity in removed:
+                # Entities disabled by default were never added
+                if entity.hass is not None:
+                    await entity.async_remove(force_remove=True)
+            for registry_entry in er.async_entries_for_config_entry(
+                registry, config_entry.entry_id
+            ):
+                if registry_entry.unique_id in unique_ids:
+                    registry.async_remove(registry_entry.entity_id)
+
+        new_entities: list[Entity] = []
+        primary = (coordinator.primary_team or "").lower()
+        for key, team_name in wanted.items():
+            if key not in added:
+                added[key] = create(team_name, key is None or key == primary)
+                new_entities.extend(added[key])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    await _async_update_teams(coordinator.teams)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_TEAMS_UPDATED.format(config_entry.entry_id),
+            _async_update_teams,
+        )
     )
 
 
@@ -35,19 +103,47 @@ class DieligaCoordinatorEntity(CoordinatorEntity[DieligaDataUpdateCoordinator]):
     """Base class for Dieliga sensors."""
 
     def __init__(
-        self, coordinator: DieligaDataUpdateCoordinator, team_name: str | None = None
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str | None = None,
+        primary: bool = True,
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
         self._team_name = team_name
+        # Teams added next to the entry's own team get their own unique IDs
+        self._unique_id_suffix = (
+            "" if primary or not team_name else f"_{slugify(team_name)}"
+        )
         self._attr_attribution = f"Data provided by dieLiga (ID: {coordinator.liga_id})"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, coordinator.liga_id)},
             name=f"dieLiga {coordinator.liga_id}",
             manufacturer="dieLiga",
             model="League Monitor",
-            configuration_url=f"{coordinator.client._base_url}/schedule/overview/{coordinator.liga_id}",
+            configuration_url=f"{coordinator.client.base_url}/schedule/overview/{coordinator.liga_id}",
         )
+        self._memo_version: int | None = None
+        self._memo_values: dict[Hashable, Any] = {}
+
+    def _memo(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Return a value derived from the data, computed once per data version.
+
+        State properties are read on every state write and by the frontend;
+        the values they derive from a snapshot cannot change until the
+        coordinator publishes the next one.
+        """
+        if self._memo_version != self.coordinator.data_version:
+            self._memo_version = self.coordinator.data_version
+            self._memo_values = {}
+        if key not in self._memo_values:
+            self._memo_values[key] = compute()
+        return self._memo_values[key]
+
+    @property
+    def _large_attributes(self) -> bool:
+        """Return whether the full table and schedule go into the attributes."""
+        return self.coordinator.options.get(CONF_LARGE_ATTRIBUTES, True)
 
 
 class DieligaScoreboardSensor(DieligaCoordinatorEntity, SensorEntity):
@@ -56,40 +152,47 @@ class DieligaScoreboardSensor(DieligaCoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:podium-gold"
 
     def __init__(
-        self, coordinator: DieligaDataUpdateCoordinator, team_name: str | None = None
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str | None = None,
+        primary: bool = True,
     ) -> None:
         """Initialize the scoreboard sensor."""
-        super().__init__(coordinator, team_name)
+        super().__init__(coordinator, team_name, primary)
         self._attr_name = (
             f"dieLiga Scoreboard {team_name}"
             if team_name
             else f"dieLiga Scoreboard {coordinator.liga_id}"
         )
-        self._attr_unique_id = f"dieliga_table_{coordinator.liga_id}"
+        self._attr_unique_id = (
+            f"dieliga_table_{coordinator.liga_id}{self._unique_id_suffix}"
+        )
 
     @property
     def native_value(self) -> str | int | None:
         """Return the state of the sensor."""
-        data = self.coordinator.data.get("scoreboard")
+        data = (self.coordinator.data or {}).get("scoreboard")
         if not data:
             return None
 
-        if self._team_name:
-            for index, team in enumerate(data.get("teams", [])):
-                if team["name"].lower() == self._team_name.lower():
-                    self._attr_native_unit_of_measurement = "position"
-                    return index + 1
+        if self._team_name and (
+            row := self._memo(
+                "row", lambda: self.coordinator.games.table_row(self._team_name)
+            )
+        ):
+            self._attr_native_unit_of_measurement = "position"
+            return row[0]
 
         return data.get("league", "Unknown")
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return the state attributes."""
-        data = self.coordinator.data.get("scoreboard")
+        data = (self.coordinator.data or {}).get("scoreboard")
         if not data:
             return {}
 
-        return {
+        attributes = {
             "league": data.get("league"),
             "group": data.get("group"),
             "region": data.get("region"),
@@ -97,6 +200,10 @@ class DieligaScoreboardSensor(DieligaCoordinatorEntity, SensorEntity):
             "teams": data.get("teams"),
             "last_update_success": self.coordinator.last_update_success,
         }
+        if not self._large_attributes:
+            # Dashboards page through the table with the dieliga/table command
+            del attributes["teams"]
+        return attributes
 
 
 class DieligaScheduleSensor(DieligaCoordinatorEntity, SensorEntity):
@@ -105,86 +212,70 @@ class DieligaScheduleSensor(DieligaCoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:calendar-month-outline"
 
     def __init__(
-        self, coordinator: DieligaDataUpdateCoordinator, team_name: str | None = None
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str | None = None,
+        primary: bool = True,
     ) -> None:
         """Initialize the schedule sensor."""
-        super().__init__(coordinator, team_name)
+        super().__init__(coordinator, team_name, primary)
         self._attr_name = (
             f"dieLiga Schedule {team_name}"
             if team_name
             else f"dieLiga Schedule {coordinator.liga_id}"
         )
-        self._attr_unique_id = f"dieliga_schedule_{coordinator.liga_id}"
+        self._attr_unique_id = (
+            f"dieliga_schedule_{coordinator.liga_id}{self._unique_id_suffix}"
+        )
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        data = self.coordinator.data.get("schedule")
+        data = (self.coordinator.data or {}).get("schedule")
         if not data:
             return None
 
-        total_games = 0
-        completed_games = 0
-
-        if self._team_name:
-            for game in data.get("games", []):
-                if (
-                    self._team_name.lower() == game["team_a_name"].lower()
-                    or self._team_name.lower() == game["team_b_name"].lower()
-                ):
-                    total_games += 1
-                    # We check if game is completed based on date (simpler than XML state sometimes)
-                    # But api.py already calculates completed_games if we want.
-                    # However here we are filtering by team.
-                    game_date_str = (
-                        game["new_date"]
-                        if game["new_date"] not in ("-", "", "Unknown", "?")
-                        else game["date"]
-                    )
-                    if game_date_str not in ("-", "", "Unknown", "?"):
-                        try:
-                            game_date = datetime.strptime(game_date_str, "%Y-%m-%d")
-                            if game_date < datetime.now():
-                                completed_games += 1
-                        except ValueError:
-                            pass
-        else:
-            total_games = data.get("total_games", 0)
-            completed_games = data.get("completed_games", 0)
-
+        _games, total_games, completed_games = self._memo("progress", self._progress)
         if total_games > 0:
             return f"{(completed_games / total_games) * 100:.0f}"
 
         # If no games for this team, return league name or Unknown
-        scoreboard_data = self.coordinator.data.get("scoreboard")
+        scoreboard_data = (self.coordinator.data or {}).get("scoreboard")
         return scoreboard_data.get("league") if scoreboard_data else "Unknown"
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return the state attributes."""
-        data = self.coordinator.data.get("schedule")
+        data = (self.coordinator.data or {}).get("schedule")
         if not data:
             return {}
 
-        games = data.get("games", [])
-        if self._team_name:
-            games = [
-                g
-                for g in games
-                if self._team_name.lower() == g["team_a_name"].lower()
-                or self._team_name.lower() == g["team_b_name"].lower()
-            ]
-
-        return {
+        games, total_games, completed_games = self._memo("progress", self._progress)
+        attributes = {
             "group": data.get("group"),
             "region": data.get("region"),
             "games": games,
-            "total_games": len(games) if self._team_name else data.get("total_games"),
-            "completed_games": sum(1 for g in games if self._is_completed(g))
-            if self._team_name
-            else data.get("completed_games"),
+            "total_games": total_games,
+            "completed_games": completed_games,
             "last_update_success": self.coordinator.last_update_success,
         }
+        if not self._large_attributes:
+            # Dashboards page through the games with the dieliga/games command
+            del attributes["games"]
+        return attributes
+
+    def _progress(self) -> tuple[list[dict], int, int]:
+        """Return the games of the team (or league), their count and completed count."""
+        data = self.coordinator.data["schedule"]
+        if not self._team_name:
+            return (
+                data.get("games", []),
+                data.get("total_games", 0),
+                data.get("completed_games", 0),
+            )
+        games = self.coordinator.games.team(self._team_name)
+        completed = sum(1 for game in games if self._is_completed(game))
+        return games, len(games), completed
 
     def _is_completed(self, game: dict) -> bool:
         """Check if a game is completed."""
@@ -200,3 +291,89 @@ class DieligaScheduleSensor(DieligaCoordinatorEntity, SensorEntity):
             except ValueError:
                 pass
         return False
+
+
+class DieligaFormSensor(DieligaCoordinatorEntity, SensorEntity):
+    """Sensor showing the last results of the team."""
+
+    _attr_icon = "mdi:chart-timeline-variant"
+
+    def __init__(
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str,
+        primary: bool = True,
+    ) -> None:
+        """Initialize the form sensor."""
+        super().__init__(coordinator, team_name, primary)
+        self._attr_name = f"dieLiga Form {team_name}"
+        self._attr_unique_id = (
+            f"dieliga_form_{coordinator.liga_id}{self._unique_id_suffix}"
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the last results, oldest first (e.g. WWLWL)."""
+        return self.coordinator.statistics.form(self._team_name)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the win/draw/loss record."""
+        stats = self.coordinator.statistics.team(self._team_name)
+        if stats is None:
+            return {}
+        return {
+            "games": stats["games"],
+            "wins": stats["wins"],
+            "draws": stats["draws"],
+            "losses": stats["losses"],
+        }
+
+
+class DieligaPointsPerGameSensor(DieligaCoordinatorEntity, SensorEntity):
+    """Sensor showing the points per game of the team."""
+
+    _attr_icon = "mdi:scoreboard-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: DieligaDataUpdateCoordinator,
+        team_name: str,
+        primary: bool = True,
+    ) -> None:
+        """Initialize the points per game sensor."""
+        super().__init__(coordinator, team_name, primary)
+        self._attr_name = f"dieLiga Points per Game {team_name}"
+        self._attr_unique_id = (
+            f"dieliga_points_per_game_{coordinator.liga_id}{self._unique_id_suffix}"
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the points per game."""
+        stats = self.coordinator.statistics.team(self._team_name)
+        return stats["points_per_game"] if stats else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the home/away splits and set and ball totals."""
+        stats = self.coordinator.statistics.team(self._team_name)
+        if stats is None:
+            return {}
+        return {
+            key: stats[key]
+            for key in (
+                "points",
+                "sets_won",
+                "sets_lost",
+                "balls_won",
+                "balls_lost",
+                "home_games",
+                "home_wins",
+                "home_points_per_game",
+                "away_games",
+                "away_wins",
+                "away_points_per_game",
+            )
+        }
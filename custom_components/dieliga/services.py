@@ -0,0 +1,313 @@
+"""Services for the dieLiga integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import voluptuous as vol
+from homeassistant.components import persistent_notification
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util import dt as dt_util
+
+from .archive import DATA_ARCHIVE, SeasonArchive, game_date
+from .capture import HttpCapture
+from .const import (
+    ATTR_COMPLETED,
+    ATTR_END_DATE,
+    ATTR_ENTRY_ID,
+    ATTR_FORM_LENGTH,
+    ATTR_LIGA_ID,
+    ATTR_LIMIT,
+    ATTR_OPPONENT,
+    ATTR_ORDER,
+    ATTR_REFRESH_COUNT,
+    ATTR_SEASON,
+    ATTR_START_DATE,
+    ATTR_STATE,
+    ATTR_TEAM,
+    ATTR_TRIGGER_REFRESH,
+    ATTR_VENUE,
+    DOMAIN,
+    SERVICE_CAPTURE,
+    SERVICE_GET_ARCHIVED_GAMES,
+    SERVICE_GET_ARCHIVED_TABLE,
+    SERVICE_GET_GAMES,
+    SERVICE_GET_STANDINGS_HISTORY,
+    SERVICE_GET_TEAM_STATISTICS,
+    SERVICE_PROFILE,
+)
+from .coordinator import DieligaDataUpdateCoordinator
+from .profiler import DieligaRefreshProfiler
+from .statistics import DEFAULT_FORM_LENGTH
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_REFRESH_COUNT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10)
+        ),
+        vol.Optional(ATTR_TRIGGER_REFRESH, default=True): cv.boolean,
+    }
+)
+
+CAPTURE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+
+ARCHIVED_GAMES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_LIGA_ID): vol.Coerce(str),
+        vol.Optional(ATTR_SEASON): cv.string,
+        vol.Optional(ATTR_TEAM): cv.string,
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+ARCHIVED_TABLE_SCHEMA = vol.Schema({vol.Required(ATTR_LIGA_ID): vol.Coerce(str)})
+
+TEAM_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_TEAM): cv.string,
+        vol.Optional(ATTR_OPPONENT): cv.string,
+        vol.Optional(ATTR_FORM_LENGTH, default=DEFAULT_FORM_LENGTH): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=50)
+        ),
+    }
+)
+
+STANDINGS_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TEAM): cv.string,
+    }
+)
+
+GAMES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_TEAM): cv.string,
+        vol.Optional(ATTR_OPPONENT): cv.string,
+        vol.Optional(ATTR_VENUE): vol.In(["home", "away"]),
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_STATE): cv.string,
+        vol.Optional(ATTR_COMPLETED): cv.boolean,
+        vol.Optional(ATTR_ORDER, default="ascending"): vol.In(
+            ["ascending", "descending"]
+        ),
+        vol.Optional(ATTR_LIMIT, default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+
+def _get_coordinators(
+    hass: HomeAssistant, entry_ids: list[str] | None
+) -> list[DieligaDataUpdateCoordinator]:
+    """Return the coordinators of the selected (or all loaded) entries."""
+    loaded: dict[str, DieligaDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+    if not entry_ids:
+        entry_ids = list(loaded)
+    coordinators = []
+    for entry_id in entry_ids:
+        if entry_id not in loaded:
+            raise ServiceValidationError(f"dieLiga entry {entry_id} is not loaded")
+        coordinators.append(loaded[entry_id])
+    if not coordinators:
+        raise ServiceValidationError("No dieLiga entries are loaded")
+    return coordinators
+
+
+def _get_archive(hass: HomeAssistant) -> SeasonArchive:
+    """Return the archive of the loaded entries, never creating it."""
+    if (archive := hass.data.get(DATA_ARCHIVE)) is None:
+        raise ServiceValidationError(
+            "The dieLiga archive is not enabled for any loaded entry"
+        )
+    return archive
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the dieLiga services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next refreshes of the selected entries."""
+        coordinators = _get_coordinators(hass, call.data.get(ATTR_ENTRY_ID))
+        if any(coordinator.profiler is not None for coordinator in coordinators):
+            raise HomeAssistantError("A dieLiga profiling session is already running")
+
+        profiler = DieligaRefreshProfiler(
+            hass, coordinators, call.data[ATTR_REFRESH_COUNT]
+        )
+        profiler.start()
+
+        if call.data[ATTR_TRIGGER_REFRESH]:
+            for coordinator in coordinators:
+                hass.async_create_task(coordinator.async_refresh())
+
+    async def async_capture(call: ServiceCall) -> None:
+        """Record the responses of a refresh of the selected entries."""
+        coordinators = _get_coordinators(hass, call.data.get(ATTR_ENTRY_ID))
+        if any(coordinator.client.capture is not None for coordinator in coordinators):
+            raise HomeAssistantError("A dieLiga capture is already running")
+
+        capture = HttpCapture(coordinator.liga_id for coordinator in coordinators)
+        for coordinator in coordinators:
+            coordinator.client.capture = capture
+        try:
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+        finally:
+            for coordinator in coordinators:
+                coordinator.client.capture = None
+
+        timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+        path = hass.config.path(f"{DOMAIN}_capture.{timestamp}.jsonl.gz")
+        await hass.async_add_executor_job(capture.write, path)
+
+        _LOGGER.info("dieLiga capture written to %s", path)
+        persistent_notification.async_create(
+            hass,
+            f"Captured {len(capture.responses)} dieLiga responses to `{path}`.",
+            title="dieLiga capture",
+            notification_id=f"{DOMAIN}_capture",
+        )
+
+    async def async_get_archived_games(call: ServiceCall) -> ServiceResponse:
+        """Look up archived games without touching the network."""
+        start_date = call.data.get(ATTR_START_DATE)
+        end_date = call.data.get(ATTR_END_DATE)
+        games = await hass.async_add_executor_job(
+            _get_archive(hass).query_games,
+            call.data.get(ATTR_LIGA_ID),
+            call.data.get(ATTR_SEASON),
+            call.data.get(ATTR_TEAM),
+            start_date.isoformat() if start_date else None,
+            end_date.isoformat() if end_date else None,
+            call.data[ATTR_LIMIT],
+        )
+        return {"games": games}
+
+    async def async_get_archived_table(call: ServiceCall) -> ServiceResponse:
+        """Look up the last archived table of a league."""
+        table = await hass.async_add_executor_job(
+            _get_archive(hass).query_table, call.data[ATTR_LIGA_ID]
+        )
+        if table is None:
+            raise ServiceValidationError(
+                f"League {call.data[ATTR_LIGA_ID]} is not in the archive"
+            )
+        return table
+
+    async def async_get_team_statistics(call: ServiceCall) -> ServiceResponse:
+        """Return the precomputed statistics of a team in each of its leagues."""
+        loaded = _get_coordinators(hass, call.data.get(ATTR_ENTRY_ID))
+        leagues = {}
+        for coordinator in loaded:
+            result = coordinator.statistics.query(
+                call.data[ATTR_TEAM],
+                call.data.get(ATTR_OPPONENT),
+                call.data[ATTR_FORM_LENGTH],
+            )
+            if result is not None:
+                leagues[coordinator.liga_id] = result
+        if not leagues:
+            raise ServiceValidationError(
+                f"Team {call.data[ATTR_TEAM]} has not played in the selected leagues"
+            )
+        return {"leagues": leagues}
+
+    async def async_get_standings_history(call: ServiceCall) -> ServiceResponse:
+        """Return the table after each matchday, or a team's position history."""
+        team = call.data.get(ATTR_TEAM)
+        leagues = {}
+        for coordinator in _get_coordinators(hass, call.data.get(ATTR_ENTRY_ID)):
+            standings = coordinator.standings
+            leagues[coordinator.liga_id] = (
+                standings.positions(team) if team else standings.matchdays
+            )
+        return {"leagues": leagues}
+
+    async def async_get_games(call: ServiceCall) -> ServiceResponse:
+        """Return the games matching the filters in each of the leagues."""
+        if ATTR_VENUE in call.data and ATTR_TEAM not in call.data:
+            raise ServiceValidationError("Filtering by venue requires a team")
+        start_date = call.data.get(ATTR_START_DATE)
+        end_date = call.data.get(ATTR_END_DATE)
+        leagues = {}
+        for coordinator in _get_coordinators(hass, call.data.get(ATTR_ENTRY_ID)):
+            games = coordinator.games.query(
+                team=call.data.get(ATTR_TEAM),
+                start=start_date.isoformat() if start_date else None,
+                end=end_date.isoformat() if end_date else None,
+                state=call.data.get(ATTR_STATE),
+                opponent=call.data.get(ATTR_OPPONENT),
+                venue=call.data.get(ATTR_VENUE),
+                completed=call.data.get(ATTR_COMPLETED),
+            )
+            if call.data[ATTR_ORDER] == "descending":
+                # Newest first; games without a date stay last
+                dated = [game for game in games if game_date(game) is not None]
+                games = dated[::-1] + games[len(dated) :]
+            leagues[coordinator.liga_id] = games[: call.data[ATTR_LIMIT]]
+        return {"leagues": leagues}
+
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_CAPTURE, async_capture, schema=CAPTURE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ARCHIVED_GAMES,
+        async_get_archived_games,
+        schema=ARCHIVED_GAMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ARCHIVED_TABLE,
+        async_get_archived_table,
+        schema=ARCHIVED_TABLE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_TEAM_STATISTICS,
+        async_get_team_statistics,
+        schema=TEAM_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_STANDINGS_HISTORY,
+        async_get_standings_history,
+        schema=STANDINGS_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_GAMES,
+        async_get_games,
+        schema=GAMES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -0,0 +1,45 @@
+"""Immutable snapshots of the league data published by the coordinator."""
+
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+
+def _readonly(*args: Any, **kwargs: Any) -> NoReturn:
+    """Raise an exception when a frozen list is modified."""
+    raise RuntimeError("Cannot modify a frozen list")
+
+
+class FrozenList(list):
+    """Read only version of list that is compatible with list types."""
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+
+def freeze(value: Any) -> Any:
+    """Return a read only copy of parsed data, reusing frozen parts as they are.
+
+    Dicts become ReadOnlyDicts and lists FrozenLists, so a snapshot still
+    compares, serializes and iterates like the parsed data, but neither the
+    event loop nor an executor job can change it while others read it.
+    """
+    if isinstance(value, (ReadOnlyDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
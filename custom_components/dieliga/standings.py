@@ -0,0 +1,269 @@
+"""Replay of a dieLiga league table matchday by matchday."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .archive import INVALID_DATES, game_date
+from .statistics import parse_score
+
+# Totals kept per team, named like the scoreboard's table columns
+COLUMNS = (
+    "points_positive",
+    "points_negative",
+    "sets_positive",
+    "sets_negative",
+    "balls_positive",
+    "balls_negative",
+    "games",
+    "games_won",
+)
+
+
+def tiebreak_key(row: dict[str, Any]) -> tuple[Any, ...]:
+    """Return the sort key of a table row.
+
+    Teams are ranked by points, then fewer points conceded, set difference,
+    sets won, ball difference and balls won; the name keeps the order stable.
+    """
+    return (
+        -row["points_positive"],
+        row["points_negative"],
+        -(row["sets_positive"] - row["sets_negative"]),
+        -row["sets_positive"],
+        -(row["balls_positive"] - row["balls_negative"]),
+        -row["balls_positive"],
+        row["name"].lower(),
+    )
+
+
+def _ranked(totals: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return a copy of the totals as a ranked table."""
+    rows = sorted(totals.values(), key=tiebreak_key)
+    return [{"position": position, **row} for position, row in enumerate(rows, start=1)]
+
+
+class StandingsHistory:
+    """League tables after each matchday of one snapshot.
+
+    Completed games are replayed in date order while the cumulative totals
+    of every team are kept up to date, so building all tables costs one
+    pass over the games plus one sort of the teams per matchday. ``current``
+    also includes games rescheduled past the last completed matchday.
+    """
+
+    def __init__(self, data: dict[str, Any] | None, version: int = 0) -> None:
+        """Replay the completed games of a snapshot."""
+        self.version = version
+        self.matchdays: list[dict[str, Any]] = []
+
+        games = ((data or {}).get("schedule") or {}).get("games", [])
+        totals: dict[str, dict[str, Any]] = {}
+        # Matchday -> date of its last scheduled game. Snapshots written
+        # before day_of_play was parsed fall back to one matchday per date.
+        matchday_dates: dict[Any, str] = {}
+        played_on: dict[Any, bool] = {}
+        played = []
+        for game in games:
+            for name in (game["team_a_name"], game["team_b_name"]):
+                if name not in totals:
+                    totals[name] = {"name": name, **dict.fromkeys(COLUMNS, 0)}
+            day = game_date(game)
+            if day is None:
+                continue
+            matchday = game.get("day_of_play", game["date"])
+            nominal = game["date"] if game["date"] not in INVALID_DATES else day
+            if nominal > matchday_dates.get(matchday, ""):
+                matchday_dates[matchday] = nominal
+            sets_a = parse_score(game["team_a_sets"])
+            sets_b = parse_score(game["team_b_sets"])
+            if sets_a == 0 and sets_b == 0:
+                continue
+            played_on[matchday] = True
+            played.append((day, game, sets_a, sets_b))
+        played.sort(key=lambda item: item[0])
+
+        pending = iter(played)
+        next_game = next(pending, None)
+        ordered = sorted(matchday_dates.items(), key=lambda item: item[1])
+        for number, (matchday, day) in enumerate(ordered, start=1):
+            # Apply every game played up to the end of this matchday
+            while next_game is not None and next_game[0] <= day:
+                self._apply(totals, *next_game)
+                next_game = next(pending, None)
+            if played_on.get(matchday):
+                self.matchdays.append(
+                    {
+                        "day_of_play": matchday
+                        if isinstance(matchday, int)
+                        else number,
+                        "date": day,
+                        "teams": _ranked(totals),
+                    }
+                )
+        # Catch-up games played after the last completed matchday
+        while next_game is not None:
+            self._apply(totals, *next_game)
+            next_game = next(pending, None)
+        self.current: list[dict[str, Any]] | None = _ranked(totals) if played else None
+
+    @staticmethod
+    def _apply(
+        totals: dict[str, dict[str, Any]],
+        _day: str,
+        game: dict[str, Any],
+        sets_a: int,
+        sets_b: int,
+    ) -> None:
+        """Add one game to the cumulative totals."""
+        team_a = totals[game["team_a_name"]]
+        team_b = totals[game["team_b_name"]]
+        points_a = parse_score(game["team_a_points"])
+        points_b = parse_score(game["team_b_points"])
+        balls_a = parse_score(game["team_a_balls"])
+        balls_b = parse_score(game["team_b_balls"])
+        team_a["points_positive"] += points_a
+        team_a["points_negative"] += points_b
+        team_b["points_positive"] += points_b
+        team_b["points_negative"] += points_a
+        team_a["sets_positive"] += sets_a
+        team_a["sets_negative"] += sets_b
+        team_b["sets_positive"] += sets_b
+        team_b["sets_negative"] += sets_a
+        team_a["balls_positive"] += balls_a
+        team_a["balls_negative"] += balls_b
+        team_b["balls_positive"] += balls_b
+        team_b["balls_negative"] += balls_a
+        team_a["games"] += 1
+        team_b["games"] += 1
+        if sets_a > sets_b:
+            team_a["games_won"] += 1
+        elif sets_b > sets_a:
+            team_b["games_won"] += 1
+
+    def positions(self, team: str) -> list[dict[str, Any]]:
+        """Return the position history of a team."""
+        team = team.lower()
+        history = []
+        for matchday in self.matchdays:
+            for row in matchday["teams"]:
+                if row["name"].lower() == team:
+                    history.append(
+                        {
+                            "day_of_play": matchday["day_of_play"],
+                            "date": matchday["date"],
+                            "position": row["position"],
+                            "points": row["points_positive"],
+                        }
+                    )
+                    break
+        return history
+
+
+def scoreboard_rows(table: list[dict[str, Any]]) -> list[dict[str, str]]:
+    """Return a ranked table in the scoreboard's team format."""
+    return [
+        {"name": row["name"], **{column: str(row[column]) for column in COLUMNS}}
+        for row in table
+    ]
+
+
+def table_discrepancies(
+    official: list[dict[str, Any]], local: list[dict[str, str]]
+) -> list[str]:
+    """Describe where the official table differs from the derived one."""
+    if [team["name"] for team in official] != [team["name"] for team in local]:
+        return [
+            (
+                "order differs: official "
+                f"{[team['name'] for team in official]}, derived "
+                f"{[team['name'] for team in local]}"
+            )
+        ]
+    return [
+        f"{team['name']} {column}: official {team.get(column)}, derived {row[column]}"
+        for team, row in zip(official, local)
+        for column in COLUMNS
+        if str(team.get(column)) != row[column]
+    ]
+
+
+class LocalStandings:
+    """Decide when the table derived from the schedule replaces a scoreboard fetch.
+
+    The derived table is trusted once it matched the official scoreboard for
+    the same set of games. It is verified again after ``verify_interval``
+    seconds, and whenever the games of the league changed (e.g. a new
+    season). A mismatch, for example from tiebreak rules that differ from
+    ours, keeps the scoreboard fetched until the tables agree again.
+    """
+
+    def __init__(self, verify_interval: float, always_verify: bool = False) -> None:
+        """Initialize the verifier."""
+        self.verify_interval = verify_interval
+        self.always_verify = always_verify
+        self.trusted = False
+        self.skipped_fetches = 0
+        self.verifications = 0
+        self.discrepancies = 0
+        self._last_verified: float | None = None
+        self._fingerprint: frozenset[tuple[str, str, str]] | None = None
+        self._metadata: dict[str, Any] = {}
+
+    @staticmethod
+    def _fingerprint_of(schedule: dict[str, Any]) -> frozenset[tuple[str, str, str]]:
+        """Return the identity of the league's games."""
+        return frozenset(
+            (game["game_number"], game["team_a_name"], game["team_b_name"])
+            for game in schedule.get("games", [])
+        )
+
+    def needs_scoreboard(self, schedule: dict[str, Any], now: float) -> bool:
+        """Return whether the official scoreboard has to be fetched."""
+        return (
+            self.always_verify
+            or not self.trusted
+            or self._last_verified is None
+            or now - self._last_verified >= self.verify_interval
+            or self._fingerprint != self._fingerprint_of(schedule)
+        )
+
+    def verify(
+        self,
+        scoreboard: dict[str, Any],
+        table: list[dict[str, Any]] | None,
+        schedule: dict[str, Any],
+        now: float,
+    ) -> list[str]:
+        """Compare the official with the derived table and return the differences."""
+        self.verifications += 1
+        self._last_verified = now
+        self._fingerprint = self._fingerprint_of(schedule)
+        # last_change describes the fetched table, not a derived one
+        self._metadata = {
+            key: value
+            for key, value in scoreboard.items()
+            if key not in ("teams", "last_change")
+        }
+        differences = table_discrepancies(
+            scoreboard.get("teams", []), scoreboard_rows(table or [])
+        )
+        self.trusted = not differences
+        if differences:
+            self.discrepancies += 1
+        return differences
+
+    def scoreboard(self, table: list[dict[str, Any]] | None) -> dict[str, Any]:
+        """Return a scoreboard built from the derived table."""
+        self.skipped_fetches += 1
+        return {**self._metadata, "teams": scoreboard_rows(table or [])}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the verification statistics."""
+        return {
+            "trusted": self.trusted,
+            "always_verify": self.always_verify,
+            "skipped_fetches": self.skipped_fetches,
+            "verifications": self.verifications,
+            "discrepancies": self.discrepancies,
+        }
@@ -0,0 +1,260 @@
+"""Precomputed team statistics of a dieLiga league."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from .archive import game_date
+
+DEFAULT_FORM_LENGTH = 5
+
+WIN = "W"
+DRAW = "D"
+LOSS = "L"
+
+# Per-team aggregates, one array slot per team
+AGGREGATES = (
+    "games",
+    "wins",
+    "draws",
+    "losses",
+    "points",
+    "sets_won",
+    "sets_lost",
+    "balls_won",
+    "balls_lost",
+    "home_games",
+    "home_wins",
+    "home_points",
+    "away_games",
+    "away_wins",
+    "away_points",
+)
+
+
+def parse_score(value: Any) -> int:
+    """Return a score as int, counting missing scores as 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class LeagueStatistics:
+    """Team statistics of one league snapshot.
+
+    The played games are stored once per refresh in columnar arrays (one
+    array per field, one slot per game, in date order) from which the
+    aggregates of all teams are computed in a single pass. Queries are
+    memoized; the cache lives as long as the snapshot's data version.
+    """
+
+    def __init__(self, data: dict[str, Any] | None, version: int = 0) -> None:
+        """Build the columns and aggregates of a snapshot."""
+        self.version = version
+        self.names: list[str] = []
+        self._team_ids: dict[str, int] = {}
+        self._cache: dict[tuple[Any, ...], Any] = {}
+
+        played = []
+        for game in ((data or {}).get("schedule") or {}).get("games", []):
+            day = game_date(game)
+            sets_home = parse_score(game.get("team_a_sets"))
+            sets_away = parse_score(game.get("team_b_sets"))
+            if day is None or (sets_home == 0 and sets_away == 0):
+                continue
+            played.append((day, game, sets_home, sets_away))
+        played.sort(key=lambda item: item[0])
+
+        self.dates: list[str] = [day for day, _game, _a, _b in played]
+        self.game_numbers: list[str] = [
+            game["game_number"] for _d, game, _a, _b in played
+        ]
+        self.home = array(
+            "H", (self._team_id(g["team_a_name"]) for _d, g, _a, _b in played)
+        )
+        self.away = array(
+            "H", (self._team_id(g["team_b_name"]) for _d, g, _a, _b in played)
+        )
+        self.home_sets = array("H", (a for _d, _g, a, _b in played))
+        self.away_sets = array("H", (b for _d, _g, _a, b in played))
+        self.home_points = array(
+            "H", (parse_score(g.get("team_a_points")) for _d, g, _a, _b in played)
+        )
+        self.away_points = array(
+            "H", (parse_score(g.get("team_b_points")) for _d, g, _a, _b in played)
+        )
+        self.home_balls = array(
+            "H", (parse_score(g.get("team_a_balls")) for _d, g, _a, _b in played)
+        )
+        self.away_balls = array(
+            "H", (parse_score(g.get("team_b_balls")) for _d, g, _a, _b in played)
+        )
+
+        teams = len(self.names)
+        self.totals = {name: array("L", [0]) * teams for name in AGGREGATES}
+        self._results: list[list[str]] = [[] for _team in range(teams)]
+        self._aggregate()
+
+    def _team_id(self, name: str) -> int:
+        """Return the column index of a team, adding it on first sight."""
+        key = name.lower()
+        if (team_id := self._team_ids.get(key)) is None:
+            team_id = self._team_ids[key] = len(self.names)
+            self.names.append(name)
+        return team_id
+
+    def _aggregate(self) -> None:
+        """Compute the aggregates of all teams in one pass over the columns."""
+        t = self.totals
+        games, wins, draws, losses = t["games"], t["wins"], t["draws"], t["losses"]
+        points, sets_won, sets_lost = t["points"], t["sets_won"], t["sets_lost"]
+        balls_won, balls_lost = t["balls_won"], t["balls_lost"]
+        home_games, home_wins, home_points = (
+            t["home_games"],
+            t["home_wins"],
+            t["home_points"],
+        )
+        away_games, away_wins, away_points = (
+            t["away_games"],
+            t["away_wins"],
+            t["away_points"],
+        )
+        results = self._results
+
+        for home, away, sets_h, sets_a, points_h, points_a, balls_h, balls_a in zip(
+            self.home,
+            self.away,
+            self.home_sets,
+            self.away_sets,
+            self.home_points,
+            self.away_points,
+            self.home_balls,
+            self.away_balls,
+        ):
+            games[home] += 1
+            games[away] += 1
+            home_games[home] += 1
+            away_games[away] += 1
+            points[home] += points_h
+            points[away] += points_a
+            home_points[home] += points_h
+            away_points[away] += points_a
+            sets_won[home] += sets_h
+            sets_lost[home] += sets_a
+            sets_won[away] += sets_a
+            sets_lost[away] += sets_h
+            balls_won[home] += balls_h
+            balls_lost[home] += balls_a
+            balls_won[away] += balls_a
+            balls_lost[away] += balls_h
+            if sets_h > sets_a:
+                wins[home] += 1
+                home_wins[home] += 1
+                losses[away] += 1
+                results[home].append(WIN)
+                results[away].append(LOSS)
+            elif sets_h < sets_a:
+                wins[away] += 1
+                away_wins[away] += 1
+                losses[home] += 1
+                results[home].append(LOSS)
+                results[away].append(WIN)
+            else:
+                draws[home] += 1
+                draws[away] += 1
+                results[home].append(DRAW)
+                results[away].append(DRAW)
+
+    def _lookup(self, team: str) -> int | None:
+        """Return the column index of a team, ignoring case."""
+        return self._team_ids.get(team.lower())
+
+    def _memoize(self, key: tuple[Any, ...], compute: Any) -> Any:
+        """Return a cached query result, computing it on first use."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def team(self, team: str) -> dict[str, Any] | None:
+        """Return the aggregates of a team."""
+        return self._memoize(("team", team.lower()), lambda: self._team(team))
+
+    def _team(self, team: str) -> dict[str, Any] | None:
+        if (team_id := self._lookup(team)) is None:
+            return None
+        stats: dict[str, Any] = {
+            name: values[team_id] for name, values in self.totals.items()
+        }
+        games = stats["games"]
+        stats["name"] = self.names[team_id]
+        stats["points_per_game"] = round(stats["points"] / games, 2) if games else None
+        stats["home_points_per_game"] = (
+            round(stats["home_points"] / stats["home_games"], 2)
+            if stats["home_games"]
+            else None
+        )
+        stats["away_points_per_game"] = (
+            round(stats["away_points"] / stats["away_games"], 2)
+            if stats["away_games"]
+            else None
+        )
+        return stats
+
+    def form(self, team: str, length: int = DEFAULT_FORM_LENGTH) -> str | None:
+        """Return the last results of a team, oldest first (e.g. WWLDW)."""
+        if (team_id := self._lookup(team)) is None:
+            return None
+        return "".join(self._results[team_id][-length:]) if length else ""
+
+    def head_to_head(self, team: str, opponent: str) -> dict[str, Any] | None:
+        """Return the direct comparison of two teams."""
+        return self._memoize(
+            ("h2h", team.lower(), opponent.lower()),
+            lambda: self._head_to_head(team, opponent),
+        )
+
+    def _head_to_head(self, team: str, opponent: str) -> dict[str, Any] | None:
+        team_id = self._lookup(team)
+        opponent_id = self._lookup(opponent)
+        if team_id is None or opponent_id is None:
+            return None
+        result: dict[str, Any] = {"games": [], "wins": 0, "draws": 0, "losses": 0}
+        sets_won = sets_lost = 0
+        for index, (home, away) in enumerate(zip(self.home, self.away)):
+            if home == team_id and away == opponent_id:
+                own, other = self.home_sets[index], self.away_sets[index]
+            elif home == opponent_id and away == team_id:
+                own, other = self.away_sets[index], self.home_sets[index]
+            else:
+                continue
+            sets_won += own
+            sets_lost += other
+            key = "wins" if own > other else "losses" if own < other else "draws"
+            result[key] += 1
+            result["games"].append(
+                {
+                    "game_number": self.game_numbers[index],
+                    "date": self.dates[index],
+                    "home": self.names[home],
+                    "sets": f"{own}:{other}",
+                }
+            )
+        result["sets_won"] = sets_won
+        result["sets_lost"] = sets_lost
+        return result
+
+    def query(
+        self,
+        team: str,
+        opponent: str | None = None,
+        form_length: int = DEFAULT_FORM_LENGTH,
+    ) -> dict[str, Any] | None:
+        """Return the statistics of a team as served by the query service."""
+        if (stats := self.team(team)) is None:
+            return None
+        result = {**stats, "form": self.form(team, form_length)}
+        if opponent is not None:
+            result["head_to_head"] = self.head_to_head(team, opponent)
+        return result
@@ -0,0 +1,215 @@
+"""Websocket commands for paginated dieLiga league data."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_COMPLETED,
+    ATTR_END_DATE,
+    ATTR_ENTRY_ID,
+    ATTR_OPPONENT,
+    ATTR_START_DATE,
+    ATTR_STATE,
+    ATTR_TEAM,
+    ATTR_VENUE,
+    DOMAIN,
+    WS_DEFAULT_PAGE_SIZE,
+    WS_MAX_PAGE_SIZE,
+)
+from .coordinator import DieligaDataUpdateCoordinator
+
+GAME_FILTERS = {
+    vol.Required(ATTR_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_TEAM): cv.string,
+    vol.Optional(ATTR_OPPONENT): cv.string,
+    vol.Optional(ATTR_VENUE): vol.In(["home", "away"]),
+    vol.Optional(ATTR_START_DATE): cv.date,
+    vol.Optional(ATTR_END_DATE): cv.date,
+    vol.Optional(ATTR_STATE): cv.string,
+    vol.Optional(ATTR_COMPLETED): cv.boolean,
+}
+
+PAGING = {
+    vol.Optional("page", default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional("page_size", default=WS_DEFAULT_PAGE_SIZE): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=WS_MAX_PAGE_SIZE)
+    ),
+}
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the dieLiga websocket commands."""
+    websocket_api.async_register_command(hass, websocket_games)
+    websocket_api.async_register_command(hass, websocket_table)
+    websocket_api.async_register_command(hass, websocket_subscribe_games)
+    websocket_api.async_register_command(hass, websocket_subscribe_table)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> DieligaDataUpdateCoordinator | None:
+    """Return the coordinator of the requested entry or send an error."""
+    coordinator = hass.data.get(DOMAIN, {}).get(msg[ATTR_ENTRY_ID])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"dieLiga entry {msg[ATTR_ENTRY_ID]} is not loaded",
+        )
+    return coordinator
+
+
+def _games(coordinator: DieligaDataUpdateCoordinator, msg: dict) -> list[dict]:
+    """Return the games matching the filters of a message."""
+    start = msg.get(ATTR_START_DATE)
+    end = msg.get(ATTR_END_DATE)
+    return coordinator.games.query(
+        team=msg.get(ATTR_TEAM),
+        start=start.isoformat() if start else None,
+        end=end.isoformat() if end else None,
+        state=msg.get(ATTR_STATE),
+        opponent=msg.get(ATTR_OPPONENT),
+        venue=msg.get(ATTR_VENUE),
+        completed=msg.get(ATTR_COMPLETED),
+    )
+
+
+def _table(coordinator: DieligaDataUpdateCoordinator, msg: dict) -> list[dict]:
+    """Return the table rows, optionally of one team only."""
+    rows = [
+        {"position": position, **row}
+        for position, row in enumerate(coordinator.games.teams, start=1)
+    ]
+    if team := msg.get(ATTR_TEAM):
+        rows = [row for row in rows if row["name"].lower() == team.lower()]
+    return rows
+
+
+def _page(items: list[dict], msg: dict) -> dict[str, Any]:
+    """Return one page of items with the paging metadata."""
+    page, page_size = msg["page"], msg["page_size"]
+    start = (page - 1) * page_size
+    return {
+        "items": items[start : start + page_size],
+        "page": page,
+        "page_size": page_size,
+        "total": len(items),
+        "pages": -(-len(items) // page_size),
+    }
+
+
+def _diff(
+    old: dict[str, dict], new: dict[str, dict]
+) -> dict[str, list[dict] | list[str]]:
+    """Return the items added, changed and removed between two keyed sets."""
+    return {
+        "added": [item for key, item in new.items() if key not in old],
+        "changed": [
+            item for key, item in new.items() if key in old and old[key] != item
+        ],
+        "removed": [key for key in old if key not in new],
+    }
+
+
+@callback
+def _async_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+    select: Any,
+    key: str,
+) -> None:
+    """Push the selected items once and then only their differences."""
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+    current: dict[str, dict] = {}
+    version: int | None = None
+
+    @callback
+    def _async_push() -> None:
+        nonlocal current, version
+        if coordinator.data_version == version:
+            return
+        initial = version is None
+        version = coordinator.data_version
+        items = {item[key]: item for item in select(coordinator, msg)}
+        diff = _diff(current, items)
+        current = items
+        if initial or any(diff.values()):
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"version": version, **diff})
+            )
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(_async_push)
+    connection.send_result(msg["id"])
+    _async_push()
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): f"{DOMAIN}/games", **GAME_FILTERS, **PAGING}
+)
+@callback
+def websocket_games(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return one page of the games matching the filters, in date order."""
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+    connection.send_result(
+        msg["id"],
+        {"version": coordinator.data_version, **_page(_games(coordinator, msg), msg)},
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/table",
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TEAM): cv.string,
+        **PAGING,
+    }
+)
+@callback
+def websocket_table(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return one page of the league table."""
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+    connection.send_result(
+        msg["id"],
+        {"version": coordinator.data_version, **_page(_table(coordinator, msg), msg)},
+    )
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): f"{DOMAIN}/subscribe_games", **GAME_FILTERS}
+)
+@callback
+def websocket_subscribe_games(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Subscribe to the games matching the filters, keyed by game number."""
+    _async_subscribe(hass, connection, msg, _games, "game_number")
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_table",
+        vol.Required(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TEAM): cv.string,
+    }
+)
+@callback
+def websocket_subscribe_table(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Subscribe to the league table, keyed by team name."""
+    _async_subscribe(hass, connection, msg, _table, "name")
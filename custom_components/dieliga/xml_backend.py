@@ -0,0 +1,123 @@
+"""XML parser backends for the dieLiga API client."""
+
+from __future__ import annotations
+
+import logging
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - depends on the environment
+    lxml_etree = None
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKEND_AUTO = "auto"
+BACKEND_ELEMENTTREE = "elementtree"
+BACKEND_LXML = "lxml"
+
+
+class XmlBackend(ABC):
+    """Turn an XML document into an ElementTree-compatible element.
+
+    The parsers in ``api.py`` only use ``find``, ``findall``, ``findtext``
+    and ``get``, which ElementTree and lxml elements both provide, so every
+    backend produces identical parse results.
+    """
+
+    name: str
+
+    @abstractmethod
+    def fromstring(self, xml_data: str) -> Any:
+        """Parse the document and return its root element."""
+
+
+class ElementTreeBackend(XmlBackend):
+    """Backend based on the standard library's ElementTree."""
+
+    name = BACKEND_ELEMENTTREE
+
+    def fromstring(self, xml_data: str) -> Any:
+        """Parse the document and return its root element."""
+        return ET.fromstring(xml_data)
+
+
+class LxmlBackend(XmlBackend):
+    """Backend based on lxml, which recovers from malformed XML."""
+
+    name = BACKEND_LXML
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        if lxml_etree is None:
+            raise RuntimeError("lxml is not installed")
+        self._parser = lxml_etree.XMLParser(
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+
+    def fromstring(self, xml_data: str) -> Any:
+        """Parse the document and return its root element."""
+        # lxml refuses str input that carries an encoding declaration.
+        root = lxml_etree.fromstring(xml_data.encode("utf-8"), self._parser)
+        if root is None:
+            raise ValueError("Document could not be recovered")
+        if self._parser.error_log:
+            _LOGGER.debug(
+                "Recovered from malformed XML: %s", self._parser.error_log.last_error
+            )
+        return root
+
+
+class AutoBackend(XmlBackend):
+    """Parse with ElementTree and let lxml recover documents it rejects.
+
+    With the element-by-element access in ``api.py``, ElementTree's C
+    accelerator beats lxml's proxy objects on dieLiga documents (see
+    ``benchmarks/parse_speed.py``), so lxml is only used when it is needed.
+    """
+
+    name = BACKEND_AUTO
+
+    def __init__(self) -> None:
+        """Initialize the backend."""
+        self._fast = ElementTreeBackend()
+        self._recovering = LxmlBackend() if lxml_etree is not None else None
+
+    def fromstring(self, xml_data: str) -> Any:
+        """Parse the document and return its root element."""
+        try:
+            return self._fast.fromstring(xml_data)
+        except ET.ParseError:
+            if self._recovering is None:
+                raise
+            _LOGGER.debug("ElementTree rejected the document, retrying with lxml")
+            return self._recovering.fromstring(xml_data)
+
+
+BACKENDS: dict[str, type[XmlBackend]] = {
+    BACKEND_AUTO: AutoBackend,
+    BACKEND_ELEMENTTREE: ElementTreeBackend,
+    BACKEND_LXML: LxmlBackend,
+}
+
+
+def available_backends() -> list[str]:
+    """Return the names of the backends usable in this environment."""
+    if lxml_etree is None:
+        return [BACKEND_AUTO, BACKEND_ELEMENTTREE]
+    return [BACKEND_AUTO, BACKEND_ELEMENTTREE, BACKEND_LXML]
+
+
+def get_backend(name: str | None = None) -> XmlBackend:
+    """Return the named backend, or the default one."""
+    if name is None:
+        name = BACKEND_AUTO
+    if name not in available_backends():
+        raise ValueError(f"XML backend {name} is not available")
+    return BACKENDS[name]()
@@ -2,6 +2,9 @@
 """Generates a structured, deduplicated, user-friendly changelog from git commit history."""
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
@@ -104,22 +107,241 @@ MAX_PER_SECTION = 15
 NEVER_COLLAPSE = ["breaking", "security"]
 
 
-def get_norm_key(msg: str) -> str:
-    n = msg.lower()
+NORM_STEPS = [
     # Strip conventional commit prefixes
-    n = re.sub(
-        r"^(feat|fix|docs|style|refactor|perf|test|chore|ci|security|build|ui|ux|revert)(\([^)]*\))?(!)?:\s*",
+    (
+        re.compile(
+            r"^(feat|fix|docs|style|refactor|perf|test|chore|ci|security|build|ui|ux|revert)(\([^)]*\))?(!)?:\s*"
+        ),
         "",
-        n,
-    )
-    n = re.sub(r"[\.\!\?\,\;\:\"\'`]", "", n)
+    ),
+    (re.compile(r"[\.\!\?\,\;\:\"\'`]"), ""),
     # Strip common prepositions
-    n = re.sub(r"\b(the|a|an|for|of|in|to|with|from|on|at|by)\b", "", n)
+    (re.compile(r"\b(the|a|an|for|of|in|to|with|from|on|at|by)\b"), ""),
     # Normalize whitespaces
-    n = re.sub(r"\s+", " ", n)
+    (re.compile(r"\s+"), " "),
+]
+
+# All noise patterns in one pass; every alternative keeps its own anchors
+NOISE_RE = re.compile("|".join(f"(?:{p})" for p in NOISE_PATTERNS))
+CONV_RE = re.compile(r"^([A-Za-z][A-Za-z0-9_-]*)(\([^)]*\))?(!)?:\s*(.+)$")
+
+FIX_WORDS = ["general fix", "small fix", "bug fix", "fixes", "fixed"]
+CI_WORDS = [
+    "ci",
+    "linter",
+    "lint fix",
+    "pipeline",
+    "workflow",
+    "github action",
+    "generate_changelog",
+    "changelog",
+]
+CHORE_WORDS = [
+    "update depend",
+    "bump depend",
+    "renovate",
+    "dependency update",
+    "upgrade dep",
+]
+FEAT_WORDS = [
+    "add feature",
+    "added feature",
+    "adds feature",
+    "new feature",
+    "add support",
+]
+SECURITY_WORDS = ["security", "vulnerability", "cve", "auth"]
+PERF_WORDS = ["perf", "speed", "faster", "optim"]
+REFACTOR_WORDS = ["refactor", "cleanup", "clean up", "improve"]
+DOCS_WORDS = ["doc", "readme", "wiki", "guide"]
+TEST_WORDS = ["test", "spec", "unit test"]
+UI_WORDS = ["ui", "ux", "layout", "style", "theme", "translation", "strings", "lang"]
+
+# Classifications cached on disk are only reused with the same rules
+RULES_VERSION = hashlib.sha1(
+    repr(
+        (
+            NOISE_PATTERNS,
+            TYPE_MAP,
+            SCOPE_MAP,
+            [(step.pattern, repl) for step, repl in NORM_STEPS],
+            CONV_RE.pattern,
+            FIX_WORDS,
+            CI_WORDS,
+            CHORE_WORDS,
+            FEAT_WORDS,
+            SECURITY_WORDS,
+            PERF_WORDS,
+            REFACTOR_WORDS,
+            DOCS_WORDS,
+            TEST_WORDS,
+            UI_WORDS,
+        )
+    ).encode()
+).hexdigest()
+
+DEFAULT_CACHE = os.path.join(".cache", "changelog.jsonl")
+
+# Fields of one git log record, separated by the ASCII unit separator
+LOG_FORMAT = "--pretty=format:%H%x1f%h%x1f%an%x1f%s"
+
+
+def get_norm_key(msg: str) -> str:
+    n = msg.lower()
+    for pattern, repl in NORM_STEPS:
+        n = pattern.sub(repl, n)
     return n.strip()
 
 
+def classify(msg: str):
+    """Return (bucket, display, is_break, norm_key) of a subject, None for noise."""
+    if not msg or NOISE_RE.search(msg):
+        return None
+
+    bucket = "other"
+    is_break = False
+
+    conv_match = CONV_RE.match(msg)
+    if conv_match:
+        raw_type = conv_match.group(1).lower()
+        raw_scope = conv_match.group(2)
+        raw_scope = (
+            raw_scope.replace("(", "").replace(")", "").lower().strip()
+            if raw_scope
+            else ""
+        )
+        is_break = bool(conv_match.group(3))
+        desc = conv_match.group(4).strip()
+
+        if raw_scope and raw_scope in SCOPE_MAP:
+            bucket = SCOPE_MAP[raw_scope]
+        elif raw_type in TYPE_MAP:
+            bucket = TYPE_MAP[raw_type]
+
+        desc_cap = desc[0].upper() + desc[1:] if desc else desc
+        display = f"**{raw_scope}:** {desc_cap}" if raw_scope else desc_cap
+    else:
+        display = msg[0].upper() + msg[1:]
+        msg_lower = msg.lower()
+        for words, word_bucket in (
+            (FIX_WORDS, "fix"),
+            (CI_WORDS, "ci"),
+            (CHORE_WORDS, "chore"),
+            (FEAT_WORDS, "feat"),
+            (SECURITY_WORDS, "security"),
+            (PERF_WORDS, "perf"),
+            (REFACTOR_WORDS, "refactor"),
+            (DOCS_WORDS, "docs"),
+            (TEST_WORDS, "test"),
+            (UI_WORDS, "ui"),
+        ):
+            if any(w in msg_lower for w in words):
+                bucket = word_bucket
+                break
+
+    return bucket, display, is_break, get_norm_key(display)
+
+
+def iter_commits(from_tag: str = "", max_count: int = 0, cwd: str | None = None):
+    """Stream (full hash, short hash, author, subject) records from git log.
+
+    The records are NUL-terminated (``-z``), so the output is parsed while
+    git is still walking the history instead of being split in memory.
+    """
+    git_args = ["git", "log", "-z", LOG_FORMAT]
+    if from_tag:
+        git_args.append(f"{from_tag}..HEAD")
+    if max_count:
+        git_args.append(f"--max-count={max_count}")
+
+    try:
+        proc = subprocess.Popen(
+            git_args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd
+        )
+    except OSError:
+        return
+    pending = b""
+    with proc:
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            records = (pending + chunk).split(b"\0")
+            pending = records.pop()
+            for record in records:
+                yield _parse_record(record)
+        if pending:
+            yield _parse_record(pending)
+
+
+def _parse_record(record: bytes):
+    fields = record.decode("utf-8", errors="ignore").split("\x1f", 3)
+    fields += [""] * (4 - len(fields))
+    full_hash, short_hash, author, subject = fields
+    return full_hash.strip(), short_hash, author.strip(), subject.strip()
+
+
+class ClassificationCache:
+    """Classified commits on disk, keyed by full commit hash.
+
+    The file holds JSON lines: a header with the rules version, then one
+    ``[hash, classification]`` line per commit. New commits are appended,
+    so a run only writes the commits it classified itself.
+    """
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self.entries = {}
+        self.new_entries = {}
+        self.valid = False
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("rules") != RULES_VERSION:
+                    return
+                for line in f:
+                    try:
+                        commit, entry = json.loads(line)
+                    except ValueError:
+                        # A run interrupted while appending
+                        continue
+                    self.entries[commit] = entry
+        except (OSError, ValueError, AttributeError):
+            return
+        self.valid = True
+
+    def classify(self, full_hash: str, msg: str):
+        if full_hash and full_hash in self.entries:
+            entry = self.entries[full_hash]
+            return tuple(entry) if entry is not None else None
+        result = classify(msg)
+        if full_hash:
+            entry = list(result) if result is not None else None
+            self.entries[full_hash] = self.new_entries[full_hash] = entry
+        return result
+
+    def save(self):
+        if not self.path or (self.valid and not self.new_entries):
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.valid:
+            mode, entries = "a", self.new_entries
+        else:
+            # Missing, unreadable or written with other rules: start over
+            mode, entries = "w", self.entries
+        with open(self.path, mode, encoding="utf-8") as f:
+            if mode == "w":
+                f.write(json.dumps({"rules": RULES_VERSION}) + "\n")
+            f.writelines(
+                json.dumps([commit, entry], separators=(",", ":")) + "\n"
+                for commit, entry in entries.items()
+            )
+        self.valid = True
+        self.new_entries = {}
+
+
 def get_formatted_item(
     display: str, hashes: list, repo: str, commit_authors: dict
 ) -> str:
@@ -153,193 +375,62 @@ def get_formatted_item(
     return display
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate structured git changelog.")
-    parser.add_argument("--from-tag", default="", help="Git ref to diff against")
-    parser.add_argument("--total-commits", default="", help="Total commit count input")
-    parser.add_argument("--repo", default="", help="Repository identifier (owner/name)")
-    args = parser.parse_args()
+def _add_item(bucket: list, seen_items: dict, key: str, display: str, commit_hash):
+    """Add a commit to the item of its key, creating the item in its bucket."""
+    if key in seen_items:
+        item, hashes = seen_items[key]
+        # A set keeps the duplicate check constant for often repeated subjects
+        if commit_hash and commit_hash not in hashes:
+            hashes.add(commit_hash)
+            item["hashes"].append(commit_hash)
+        return
+    item = {"display": display, "hashes": [commit_hash] if commit_hash else []}
+    seen_items[key] = (item, set(item["hashes"]))
+    bucket.append(item)
 
-    from_tag = args.from_tag
-    total_commits = args.total_commits
-    repo = args.repo
 
-    if from_tag:
-        git_args = ["git", "log", f"{from_tag}..HEAD", "--pretty=format:%h %an || %s"]
-    else:
-        git_args = ["git", "log", "--pretty=format:%h %an || %s", "--max-count=2000"]
-
-    try:
-        raw_output = subprocess.check_output(
-            git_args, stderr=subprocess.DEVNULL
-        ).decode("utf-8", errors="ignore")
-    except subprocess.CalledProcessError:
-        raw_output = ""
-
-    commit_lines = [line.strip() for line in raw_output.splitlines() if line.strip()]
+def collect(records, cache: ClassificationCache):
+    """Classify and deduplicate commit records into the changelog buckets."""
     commit_authors = {}
-
-    try:
-        total_raw = int(total_commits) if total_commits else len(commit_lines)
-    except ValueError:
-        total_raw = len(commit_lines)
-
     buckets = {k: [] for k in CATEGORY_ORDER}
     seen_items = {}
+    count = 0
 
-    for line in commit_lines:
-        author = ""
-        if " || " in line:
-            parts = line.split(" || ", 1)
-            meta, msg = parts[0], parts[1].strip()
-            meta_parts = meta.split(" ", 1)
-            commit_hash = meta_parts[0]
-            if len(meta_parts) > 1:
-                author = meta_parts[1].strip()
-        else:
-            match = re.match(r"^([0-9a-fA-F]+)\s+(.*)$", line)
-            if match:
-                commit_hash = match.group(1)
-                msg = match.group(2).strip()
-            else:
-                commit_hash = ""
-                msg = line.strip()
-
+    for full_hash, commit_hash, author, msg in records:
+        count += 1
         if commit_hash and author:
             commit_authors[commit_hash] = author
 
-        if not msg:
-            continue
-
-        # Skip noise commits
-        if any(re.search(p, msg) for p in NOISE_PATTERNS):
+        classified = cache.classify(full_hash, msg)
+        if classified is None:
             continue
+        bucket, display, is_break, norm_key = classified
 
-        bucket = "other"
-        display = msg
-        is_break = False
-
-        conv_match = re.match(
-            r"^([A-Za-z][A-Za-z0-9_-]*)(\([^)]*\))?(!)?:\s*(.+)$", msg
-        )
-        if conv_match:
-            raw_type = conv_match.group(1).lower()
-            raw_scope = conv_match.group(2)
-            raw_scope = (
-                re.sub(r"[()]", "", raw_scope).lower().strip() if raw_scope else ""
+        if is_break:
+            _add_item(
+                buckets["breaking"],
+                seen_items,
+                f"breaking:{norm_key}",
+                f"**{display}**",
+                commit_hash,
             )
-            is_break = bool(conv_match.group(3))
-            desc = conv_match.group(4).strip()
+        _add_item(buckets[bucket], seen_items, norm_key, display, commit_hash)
 
-            if raw_scope and raw_scope in SCOPE_MAP:
-                bucket = SCOPE_MAP[raw_scope]
-            elif raw_type in TYPE_MAP:
-                bucket = TYPE_MAP[raw_type]
+    return buckets, commit_authors, count
 
-            desc_cap = desc[0].upper() + desc[1:] if desc else desc
-            display = f"**{raw_scope}:** {desc_cap}" if raw_scope else desc_cap
-        else:
-            display = msg[0].upper() + msg[1:] if msg else msg
-            msg_lower = msg.lower()
-            if any(
-                w in msg_lower
-                for w in ["general fix", "small fix", "bug fix", "fixes", "fixed"]
-            ):
-                bucket = "fix"
-            elif any(
-                w in msg_lower
-                for w in [
-                    "ci",
-                    "linter",
-                    "lint fix",
-                    "pipeline",
-                    "workflow",
-                    "github action",
-                    "generate_changelog",
-                    "changelog",
-                ]
-            ):
-                bucket = "ci"
-            elif any(
-                w in msg_lower
-                for w in [
-                    "update depend",
-                    "bump depend",
-                    "renovate",
-                    "dependency update",
-                    "upgrade dep",
-                ]
-            ):
-                bucket = "chore"
-            elif any(
-                w in msg_lower
-                for w in [
-                    "add feature",
-                    "added feature",
-                    "adds feature",
-                    "new feature",
-                    "add support",
-                ]
-            ):
-                bucket = "feat"
-            elif any(
-                w in msg_lower for w in ["security", "vulnerability", "cve", "auth"]
-            ):
-                bucket = "security"
-            elif any(w in msg_lower for w in ["perf", "speed", "faster", "optim"]):
-                bucket = "perf"
-            elif (
-                "refactor" in msg_lower
-                or "cleanup" in msg_lower
-                or "clean up" in msg_lower
-                or "improve" in msg_lower
-            ):
-                bucket = "refactor"
-            elif any(w in msg_lower for w in ["doc", "readme", "wiki", "guide"]):
-                bucket = "docs"
-            elif any(w in msg_lower for w in ["test", "spec", "unit test"]):
-                bucket = "test"
-            elif any(
-                w in msg_lower
-                for w in [
-                    "ui",
-                    "ux",
-                    "layout",
-                    "style",
-                    "theme",
-                    "translation",
-                    "strings",
-                    "lang",
-                ]
-            ):
-                bucket = "ui"
-
-        norm_key = get_norm_key(display)
 
-        if is_break:
-            break_display = f"**{display}**"
-            break_key = f"breaking:{norm_key}"
-            if break_key in seen_items:
-                existing_break = seen_items[break_key]
-                if commit_hash and commit_hash not in existing_break["hashes"]:
-                    existing_break["hashes"].append(commit_hash)
-            else:
-                break_item = {
-                    "display": break_display,
-                    "hashes": [commit_hash] if commit_hash else [],
-                }
-                seen_items[break_key] = break_item
-                buckets["breaking"].append(break_item)
-
-        if norm_key in seen_items:
-            existing_item = seen_items[norm_key]
-            if commit_hash and commit_hash not in existing_item["hashes"]:
-                existing_item["hashes"].append(commit_hash)
-            continue
-
-        item = {"display": display, "hashes": [commit_hash] if commit_hash else []}
-        seen_items[norm_key] = item
-        buckets[bucket].append(item)
+def generate_changelog(
+    records,
+    from_tag: str = "",
+    total_commits=None,
+    repo: str = "",
+    cache: ClassificationCache | None = None,
+) -> str:
+    """Return the changelog markdown of commit records (newest first)."""
+    cache = cache or ClassificationCache(None)
+    buckets, commit_authors, count = collect(records, cache)
+    cache.save()
+    total_raw = total_commits if total_commits is not None else count
 
     out = []
     has_any = False
@@ -415,8 +506,43 @@ def main():
     else:
         out.append(f"*Changelog generated from `{range_str}`.*")
 
+    return "\n".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate structured git changelog.")
+    parser.add_argument("--from-tag", default="", help="Git ref to diff against")
+    parser.add_argument("--total-commits", default="", help="Total commit count input")
+    parser.add_argument("--repo", default="", help="Repository identifier (owner/name)")
+    parser.add_argument(
+        "--max-count",
+        type=int,
+        default=2000,
+        help="Commits to read without --from-tag (0 for all)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=os.environ.get("CHANGELOG_CACHE", DEFAULT_CACHE),
+        help="File of classified commits reused across runs ('' to disable)",
+    )
+    args = parser.parse_args()
+
+    try:
+        total_commits = int(args.total_commits) if args.total_commits else None
+    except ValueError:
+        total_commits = None
+
+    records = iter_commits(args.from_tag, 0 if args.from_tag else args.max_count)
+    changelog = generate_changelog(
+        records,
+        args.from_tag,
+        total_commits,
+        args.repo,
+        ClassificationCache(args.cache or None),
+    )
+
     sys.stdout.reconfigure(encoding="utf-8")
-    print("\n".join(out))
+    print(changelog)
 
 
 if __name__ == "__main__":
@@ -7,3 +7,10 @@ import pytest
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations."""
     yield
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass, tmp_path):
+    """Write files meant for the config directory to a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+    yield tmp_path
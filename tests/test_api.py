@@ -2,7 +2,11 @@
 
 import pytest
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.api import (
+    DieligaApiClient,
+    DieligaResponseRejected,
+    XmlLimits,
+)
 
 SCOREBOARD_XML = """
 <results>
@@ -72,3 +76,97 @@ async def test_get_schedule(hass, aioclient_mock):
     assert len(data["games"]) == 1
     assert data["games"][0]["team_a_name"] == "Team 1"
     assert data["total_games"] == 1
+
+
+def test_parsed_strings_are_shared():
+    """Test that repeated strings share one object across parses."""
+    client = DieligaApiClient(None, "https://pool.example")
+    first = client._parse_schedule_xml(SCHEDULE_XML)["games"][0]
+    second = client._parse_schedule_xml(SCHEDULE_XML)["games"][0]
+
+    assert first["team_a_name"] == "Team 1"
+    assert first["team_a_name"] is second["team_a_name"]
+    assert first["state"] is second["state"]
+
+    other_client = DieligaApiClient(None, "https://pool.example/")
+    third = other_client._parse_schedule_xml(SCHEDULE_XML)["games"][0]
+    assert third["team_b_name"] is first["team_b_name"]
+
+
+ENTITY_XML = """<?xml version="1.0"?>
+<!DOCTYPE results [<!ENTITY a "aaaaaaaaaa"><!ENTITY b "&a;&a;&a;&a;&a;">]>
+<results><group>&b;</group></results>
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "limits", "message"),
+    [
+        (SCHEDULE_XML, XmlLimits(max_bytes=100), "bytes"),
+        (
+            SCHEDULE_XML.replace("<game>", "<game>" * 3),
+            XmlLimits(max_games=2),
+            "2 games",
+        ),
+        (SCOREBOARD_XML, XmlLimits(max_teams=0), "0 teams"),
+        (ENTITY_XML, XmlLimits(), "DTD"),
+    ],
+)
+async def test_response_limits(hass, aioclient_mock, payload, limits, message):
+    """Test that responses breaking a limit are rejected while they are read."""
+    aioclient_mock.get(
+        "https://example.com/schedule/schedule/1234?output=xml", text=payload
+    )
+
+    client = DieligaApiClient(
+        async_get_clientsession(hass), "https://example.com", limits=limits
+    )
+    with pytest.raises(DieligaResponseRejected, match=message):
+        await client.async_get_schedule("1234")
+
+
+@pytest.mark.asyncio
+async def test_declared_length_rejected(hass, aioclient_mock):
+    """Test that a too large Content-Length is rejected before reading."""
+    aioclient_mock.get(
+        "https://example.com/schedule/summary/1234?output=xml",
+        text=SCOREBOARD_XML,
+        headers={"Content-Length": "10000000"},
+    )
+
+    client = DieligaApiClient(async_get_clientsession(hass), "https://example.com")
+    with pytest.raises(DieligaResponseRejected, match="10000000 bytes"):
+        await client.async_get_scoreboard("1234")
+
+
+@pytest.mark.asyncio
+async def test_overview_size_limit(hass, aioclient_mock):
+    """Test that the league overview is read within the byte limit."""
+    overview = '<!DOCTYPE html><a href="/schedule/overview/1234">League</a>'
+    aioclient_mock.get("https://example.com/schedule/overview", text=overview)
+
+    client = DieligaApiClient(async_get_clientsession(hass), "https://example.com")
+    assert await client.async_get_league_ids() == ["1234"]
+
+    client = DieligaApiClient(
+        async_get_clientsession(hass),
+        "https://example.com",
+        limits=XmlLimits(max_bytes=20),
+    )
+    with pytest.raises(DieligaResponseRejected, match="bytes"):
+        await client.async_get_league_ids()
+
+
+@pytest.mark.asyncio
+async def test_schedule_if_changed(hass, aioclient_mock):
+    """Test that only the conditional fetch sends the validators."""
+    url = "https://example.com/schedule/schedule/1234?output=xml"
+    aioclient_mock.get(url, text=SCHEDULE_XML, headers={"ETag": '"1"'})
+    client = DieligaApiClient(async_get_clientsession(hass), "https://example.com")
+    assert (await client.async_get_schedule("1234"))["total_games"] == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=304)
+    assert await client.async_get_schedule_if_changed("1234") is None
+    assert aioclient_mock.mock_calls[0][3] == {"If-None-Match": '"1"'}
@@ -0,0 +1,150 @@
+"""Tests for the dieLiga season archive."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.dieliga.archive import (
+    SeasonArchive,
+    async_close_archive,
+    async_get_archive,
+    async_store,
+    season_of,
+)
+from custom_components.dieliga.services import async_setup_services
+
+
+def _game(number: int, day: str, team_a: str, team_b: str, sets: str) -> dict:
+    """Return a schedule game."""
+    sets_a, sets_b = sets.split(":")
+    return {
+        "game_number": str(number),
+        "date": day,
+        "new_date": "-",
+        "time": "19:00",
+        "team_a_name": team_a,
+        "team_b_name": team_b,
+        "team_a_points": "2" if sets_a > sets_b else "0",
+        "team_b_points": "0" if sets_a > sets_b else "2",
+        "team_a_sets": sets_a,
+        "team_b_sets": sets_b,
+        "team_a_balls": "0",
+        "team_b_balls": "0",
+        "state": "Completed",
+    }
+
+
+DATA = {
+    "scoreboard": {
+        "league": "Test League",
+        "group": "A",
+        "region": "Ost",
+        "last_change": "2025-10-20",
+        "teams": [{"name": "Team A", "games": "2"}, {"name": "Team B", "games": "1"}],
+    },
+    "schedule": {
+        "games": [
+            _game(1, "2025-10-01", "Team A", "Team B", "3:1"),
+            _game(2, "2025-10-08", "Team C", "Team A", "0:3"),
+            # Not played yet
+            _game(3, "2025-11-05", "Team B", "Team C", "0:0"),
+        ]
+    },
+}
+
+
+def test_season_of():
+    """Test that seasons start in July."""
+    assert season_of("2025-10-01") == "2025/2026"
+    assert season_of("2026-03-01") == "2025/2026"
+    assert season_of("2026-07-01") == "2026/2027"
+
+
+def test_store_and_query(tmp_path: Path):
+    """Test that finished games and the table are archived once."""
+    archive = SeasonArchive(str(tmp_path / "archive.db"))
+    assert archive.store("1234", DATA, date(2025, 10, 20)) == 2
+    assert archive.store("1234", DATA, date(2025, 10, 20)) == 0
+
+    games = archive.query_games(team="Team A")
+    assert [game["game_number"] for game in games] == ["2", "1"]
+    assert games[0]["season"] == "2025/2026"
+    assert archive.query_games(team="Team B", end_date="2025-10-05")[0]["date"] == (
+        "2025-10-01"
+    )
+    assert archive.query_games(season="2024/2025") == []
+
+    table = archive.query_table("1234")
+    assert table["group"] == "A"
+    assert [team["name"] for team in table["teams"]] == ["Team A", "Team B"]
+    assert archive.query_table("999") is None
+    archive.close()
+
+    # A new instance finds the games already archived on disk
+    archive = SeasonArchive(str(tmp_path / "archive.db"))
+    assert archive.store("1234", DATA, date(2025, 10, 20)) == 0
+    archive.close()
+
+
+@pytest.mark.asyncio
+async def test_archive_services(hass: HomeAssistant):
+    """Test that the archive services answer from the database."""
+    async_setup_services(hass)
+    archive = async_get_archive(hass)
+    await hass.async_add_executor_job(archive.store, "1234", DATA, date(2025, 10, 20))
+
+    response = await hass.services.async_call(
+        "dieliga",
+        "get_archived_games",
+        {"team": "Team C", "start_date": "2025-10-01"},
+        blocking=True,
+        return_response=True,
+    )
+    assert [game["game_number"] for game in response["games"]] == ["2"]
+
+    response = await hass.services.async_call(
+        "dieliga",
+        "get_archived_table",
+        {"liga_id": 1234},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["league"] == "Test League"
+    await hass.async_add_executor_job(archive.close)
+
+
+@pytest.mark.asyncio
+async def test_archive_services_without_archive(hass: HomeAssistant, tmp_path: Path):
+    """Test that the archive services don't create the database."""
+    hass.config.config_dir = str(tmp_path)
+    async_setup_services(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            "dieliga",
+            "get_archived_table",
+            {"liga_id": 1234},
+            blocking=True,
+            return_response=True,
+        )
+    assert not (tmp_path / "dieliga_archive.db").exists()
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_pending_stores(hass: HomeAssistant, tmp_path: Path):
+    """Test that closing writes pending stores first and ignores later ones."""
+    hass.config.config_dir = str(tmp_path)
+    archive = async_get_archive(hass)
+    store = async_store(hass, archive, "1234", DATA)
+
+    await async_close_archive(hass)
+
+    assert await store == 2
+    assert not archive.pending
+    assert archive.store("1234", DATA, date(2025, 10, 20)) == 0
+    reopened = SeasonArchive(str(tmp_path / "dieliga_archive.db"))
+    assert len(reopened.query_games(liga_id="1234")) == 2
+    reopened.close()
@@ -6,6 +6,7 @@ from datetime import datetime
 from homeassistant.core import HomeAssistant
 import pytest
 from custom_components.dieliga.binary_sensor import DieligaMatchTodayBinarySensor
+from custom_components.dieliga.game_index import GameIndex
 
 
 @pytest.mark.asyncio
@@ -31,6 +32,8 @@ async def test_match_today_binary_sensor_is_on(hass: HomeAssistant):
         }
     }
 
+    coordinator.games = GameIndex(coordinator.data)
+
     sensor = DieligaMatchTodayBinarySensor(coordinator, team_name="Team 1")
     assert sensor.is_on is True
 
@@ -64,5 +67,7 @@ async def test_match_today_binary_sensor_new_date(hass: HomeAssistant):
         }
     }
 
+    coordinator.games = GameIndex(coordinator.data)
+
     sensor = DieligaMatchTodayBinarySensor(coordinator, team_name="Team 1")
     assert sensor.is_on is True
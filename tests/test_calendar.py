@@ -6,7 +6,16 @@ from datetime import datetime, timedelta
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 import pytest
-from custom_components.dieliga.calendar import DieligaCalendarEntity
+from custom_components.dieliga.calendar import (
+    DieligaCalendarEntity,
+    DieligaClubCalendarEntity,
+    club_key,
+)
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.game_index import GameIndex
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+from .test_init import SCHEDULE_URL, SCOREBOARD_URL, _mock_entry
 
 
 @pytest.mark.asyncio
@@ -46,6 +55,8 @@ async def test_calendar_events(hass: HomeAssistant):
         },
     }
 
+    coordinator.games = GameIndex(coordinator.data)
+
     calendar = DieligaCalendarEntity(coordinator, team_name="Team 1")
 
     # Get events
@@ -64,3 +75,141 @@ async def test_calendar_events(hass: HomeAssistant):
 
     assert calendar.name == "dieLiga Calendar Team 1"
     assert calendar.unique_id == "dieliga_calendar_1234"
+
+
+def test_club_key():
+    """Test that the teams of a club are detected across spellings."""
+    assert club_key("TSV Süd e.V. II") == "tsv sud"
+    assert club_key("tsv sud 1") == "tsv sud"
+    assert club_key("TSV-Süd eV 3") == "tsv sud"
+    assert club_key("VC Nord") == "vc nord"
+    assert club_key("7") == "7"
+
+
+def _league(liga_id, league, games):
+    """Return a coordinator of a league with games (day, time, home, away)."""
+    coordinator = MagicMock()
+    coordinator.liga_id = liga_id
+    coordinator.data_version = 1
+    coordinator.data = {
+        "scoreboard": {"league": league, "region": "Region"},
+        "schedule": {
+            "games": [
+                {
+                    "team_a_name": home,
+                    "team_b_name": away,
+                    "date": day,
+                    "new_date": "-",
+                    "time": time,
+                    "game_number": f"{liga_id}-{number}",
+                    "state": "Scheduled",
+                }
+                for number, (day, time, home, away) in enumerate(games)
+            ]
+        },
+    }
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_club_calendar_merges_leagues(hass: HomeAssistant):
+    """Test that the club calendar merges the club's games of all leagues."""
+    first = _league(
+        "1",
+        "Landesliga",
+        [
+            ("2026-01-03", "10:00", "TSV Süd", "VC Nord"),
+            ("2026-01-10", "10:00", "VC Nord", "SV West"),
+            ("2026-01-17", "10:00", "SV West", "TSV Süd"),
+        ],
+    )
+    second = _league(
+        "2",
+        "Bezirksliga",
+        [
+            ("2026-01-04", "18:00", "tsv sud 2", "SV Ost"),
+            ("2026-01-17", "09:00", "SV Ost", "TSV Süd e.V. II"),
+        ],
+    )
+    hass.data[DOMAIN] = {"a": first, "b": second}
+    calendar = DieligaClubCalendarEntity(first, "TSV Süd")
+    calendar.hass = hass
+
+    events = await calendar.async_get_events(
+        hass,
+        dt_util.as_local(datetime(2026, 1, 1)),
+        dt_util.as_local(datetime(2026, 1, 31)),
+    )
+    assert [event.description.split(".")[0] for event in events] == [
+        "Landesliga",
+        "Bezirksliga",
+        "Bezirksliga",
+        "Landesliga",
+    ]
+    assert events[2].summary == "SV Ost vs TSV Süd e.V. II"
+
+    events = await calendar.async_get_events(
+        hass,
+        dt_util.as_local(datetime(2026, 1, 4)),
+        dt_util.as_local(datetime(2026, 1, 16)),
+    )
+    assert [event.summary for event in events] == ["tsv sud 2 vs SV Ost"]
+
+    # Timelines are only rebuilt for leagues with a new data version
+    timelines = dict(calendar._timelines)
+    second.data_version = 2
+    calendar._league_timelines()
+    assert calendar._timelines["a"] is timelines["a"]
+    assert calendar._timelines["b"] is not timelines["b"]
+
+
+@pytest.mark.asyncio
+async def test_club_calendar_drops_unloaded_leagues(hass: HomeAssistant):
+    """Test that the listeners of unloaded and reloaded leagues are removed."""
+    first = _league("1", "Landesliga", [])
+    second = _league("2", "Bezirksliga", [])
+    hass.data[DOMAIN] = {"a": first, "b": second}
+    calendar = DieligaClubCalendarEntity(first, "TSV Süd")
+    calendar.hass = hass
+
+    calendar._async_follow_leagues()
+    first.async_add_listener.assert_not_called()
+    second.async_add_listener.assert_called_once()
+
+    # A reload of the other entry replaces its coordinator
+    reloaded = _league("2", "Bezirksliga", [])
+    hass.data[DOMAIN]["b"] = reloaded
+    calendar._async_follow_leagues()
+    second.async_add_listener.return_value.assert_called_once()
+    reloaded.async_add_listener.assert_called_once()
+
+    del hass.data[DOMAIN]["b"]
+    assert calendar.event is None
+    reloaded.async_add_listener.return_value.assert_called_once()
+    assert calendar._followed == {}
+
+
+@pytest.mark.asyncio
+async def test_club_calendar_option(hass: HomeAssistant, aioclient_mock):
+    """Test that the club option adds the club calendar to the entry."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass, club="Team")
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("calendar.dieliga_club_team") is not None
+    response = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {
+            "entity_id": "calendar.dieliga_club_team",
+            "start_date_time": "2026-01-01T00:00:00+00:00",
+            "end_date_time": "2026-01-02T00:00:00+00:00",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    (event,) = response["calendar.dieliga_club_team"]["events"]
+    assert event["summary"] == "Team 1 vs Team 2"
+    assert event["description"].startswith("Test League. Match number: 101")
@@ -0,0 +1,83 @@
+"""Tests for recording and replaying dieLiga responses."""
+
+from pathlib import Path
+from time import monotonic
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.capture import (
+    CapturedResponse,
+    HttpCapture,
+    ReplaySession,
+    load_capture,
+)
+from custom_components.dieliga.const import DOMAIN
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+from .test_init import SCHEDULE_URL, SCOREBOARD_URL, _mock_entry
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(hass: HomeAssistant, aioclient_mock, tmp_path: Path):
+    """Test that a capture replays to the same parsed data."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    aioclient_mock.get(
+        "https://example.com/schedule/schedule/9999?output=xml", text=SCHEDULE_XML
+    )
+    capture = HttpCapture(["1234"])
+    client = DieligaApiClient(
+        async_get_clientsession(hass), "https://example.com", capture=capture
+    )
+    scoreboard = await client.async_get_scoreboard("1234")
+    schedule = await client.async_get_schedule("1234")
+    await client.async_get_schedule("9999")
+
+    path = str(tmp_path / "capture.jsonl.gz")
+    capture.write(path)
+    responses = load_capture(path)
+    assert [response.url for response in responses] == [SCOREBOARD_URL, SCHEDULE_URL]
+    assert responses[1].body == SCHEDULE_XML.encode()
+
+    replay = DieligaApiClient(ReplaySession(responses, 0), "https://example.com")
+    assert await replay.async_get_scoreboard("1234") == scoreboard
+    assert await replay.async_get_schedule("1234") == schedule
+    with pytest.raises(Exception, match="No captured response"):
+        await replay.async_get_schedule("9999")
+
+
+@pytest.mark.asyncio
+async def test_replay_timing_and_status():
+    """Test that replays take the scaled time and keep error statuses."""
+    url = "https://example.com/schedule/schedule/1234?output=xml"
+    responses = [
+        CapturedResponse(url, 200, [], SCHEDULE_XML.encode(), 0.0, 0.2),
+        CapturedResponse(url, 503, [], b"", 1.0, 0.0),
+    ]
+    client = DieligaApiClient(ReplaySession(responses, 0.5), "https://example.com")
+
+    start = monotonic()
+    assert (await client.async_get_schedule("1234"))["total_games"] == 1
+    assert monotonic() - start >= 0.1
+    with pytest.raises(Exception, match="503"):
+        await client.async_get_schedule("1234")
+
+
+@pytest.mark.asyncio
+async def test_capture_service(hass: HomeAssistant, aioclient_mock):
+    """Test that the service refreshes the entries and writes their capture."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(DOMAIN, "capture", {}, blocking=True)
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.client.capture is None
+    (path,) = Path(hass.config.config_dir).glob("dieliga_capture.*.jsonl.gz")
+    assert SCHEDULE_URL in [response.url for response in load_capture(str(path))]
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 from homeassistant import config_entries, data_entry_flow
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.dieliga.const import DOMAIN
 
 import pytest
@@ -22,6 +23,8 @@ async def test_flow_user_success(hass, aioclient_mock):
     """Test successful flow."""
     url = "https://www.ost.volleyball-freizeit.de/schedule/summary/1234?output=xml"
     aioclient_mock.get(url, text="<results><league>Test</league></results>")
+    url = "https://www.ost.volleyball-freizeit.de/schedule/schedule/1234?output=xml"
+    aioclient_mock.get(url, text="<results><group>Test</group></results>")
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
@@ -66,3 +69,114 @@ async def test_flow_user_cannot_connect(hass, aioclient_mock):
 
     assert result2["type"] == data_entry_flow.FlowResultType.FORM
     assert result2["errors"] == {"base": "cannot_connect"}
+
+
+@pytest.mark.asyncio
+async def test_flow_seeds_first_refresh(hass, aioclient_mock):
+    """Test that setting up the new entry reuses the validation fetch."""
+    url = "https://www.ost.volleyball-freizeit.de/schedule/summary/1234?output=xml"
+    aioclient_mock.get(url, text="<results><league>Test</league></results>")
+    url = "https://www.ost.volleyball-freizeit.de/schedule/schedule/1234?output=xml"
+    aioclient_mock.get(url, text="<results><group>Test</group></results>")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            "base_url": "https://www.ost.volleyball-freizeit.de",
+            "liga_id": 1234,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result2["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    coordinator = hass.data[DOMAIN][result2["result"].entry_id]
+    assert coordinator.data["scoreboard"]["league"] == "Test"
+    assert coordinator.data["schedule"]["group"] == "Test"
+    assert aioclient_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_flow_discover_league(hass, aioclient_mock):
+    """Test picking a league from the discovery index."""
+    base_url = "https://www.ost.volleyball-freizeit.de"
+    aioclient_mock.get(
+        f"{base_url}/schedule/overview",
+        text='<a href="/schedule/overview/1234">Test</a>',
+    )
+    aioclient_mock.get(
+        f"{base_url}/schedule/summary/1234?output=xml",
+        text="<results><league>Test</league><region>Ost</region></results>",
+    )
+    aioclient_mock.get(
+        f"{base_url}/schedule/schedule/1234?output=xml",
+        text="<results><group>Test</group></results>",
+    )
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"base_url": base_url}
+    )
+    assert result["type"] == data_entry_flow.FlowResultType.FORM
+    assert result["step_id"] == "discover"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"query": "hamburg"}
+    )
+    assert result["errors"] == {"base": "no_leagues"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"query": "ost"}
+    )
+    assert result["step_id"] == "league"
+
+    with patch("custom_components.dieliga.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"liga_id": "1234", "team_name": "Team 1"}
+        )
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result["data"] == {
+        "base_url": base_url,
+        "liga_id": 1234,
+        "team_name": "Team 1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_flow_discover_without_leagues(hass, aioclient_mock):
+    """Test that the flow aborts when the host lists no leagues."""
+    base_url = "https://www.ost.volleyball-freizeit.de"
+    aioclient_mock.get(f"{base_url}/schedule/overview", text="<html></html>")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"base_url": base_url}
+    )
+
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result["reason"] == "no_leagues_found"
+
+
+@pytest.mark.asyncio
+async def test_options_reject_zero_refresh_time(hass):
+    """Test that the refresh interval must be at least one hour."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={"base_url": "https://example.com", "liga_id": 1234},
+    )
+    entry.add_to_hass(hass)
+    hass.data[DOMAIN] = {}
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    with pytest.raises(data_entry_flow.InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {"refresh_time": 0}
+        )
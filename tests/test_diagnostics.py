@@ -0,0 +1,84 @@
+"""Tests for dieLiga diagnostics."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.coordinator import RefreshStats
+from custom_components.dieliga.diagnostics import (
+    _build_full_dump,
+    async_get_config_entry_diagnostics,
+)
+
+GAMES = [
+    {
+        "game_number": str(number),
+        "team_a_name": "Team 1",
+        "team_b_name": "Team 2",
+        "date": "2026-01-01",
+        "state": "Completed",
+    }
+    for number in range(50)
+]
+
+
+def _mock_coordinator() -> MagicMock:
+    """Return a coordinator holding a league with 50 games."""
+    coordinator = MagicMock()
+    coordinator.liga_id = "1234"
+    coordinator.last_update_success = True
+    coordinator.refresh_stats = RefreshStats()
+    coordinator.refresh_stats.record(0.5, True)
+    coordinator.client.string_pool_size = 42
+    coordinator.data = {
+        "scoreboard": {"league": "Test League", "teams": [{"name": "Team 1"}]},
+        "schedule": {"total_games": 50, "completed_games": 50, "games": GAMES},
+    }
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_summary(hass: HomeAssistant):
+    """Test that diagnostics only contain summaries by default."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"liga_id": 1234})
+    hass.data[DOMAIN] = {entry.entry_id: _mock_coordinator()}
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    data = result["coordinator_data"]
+    assert data["scoreboard"]["team_count"] == 1
+    assert data["schedule"]["total_games"] == 50
+    assert len(data["schedule"]["sample_games"]) == 10
+    assert data["refresh_stats"]["count"] == 1
+    assert data["string_pool_size"] == 42
+    assert "full_data" not in data
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_full_dump(hass: HomeAssistant):
+    """Test that the optional full dump is included."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={"liga_id": 1234}, options={"full_diagnostics": True}
+    )
+    hass.data[DOMAIN] = {entry.entry_id: _mock_coordinator()}
+
+    result = await async_get_config_entry_diagnostics(hass, entry)
+
+    full_data = result["coordinator_data"]["full_data"]
+    assert full_data["scoreboard"]["league"] == "Test League"
+    assert full_data["schedule"]["total_games"] == 50
+    assert len(full_data["schedule"]["games"]) == 50
+    assert full_data["truncated"] is False
+
+
+def test_full_dump_is_capped():
+    """Test that the full dump drops games beyond the size budget."""
+    dump = _build_full_dump(_mock_coordinator().data, 2000)
+
+    assert 0 < len(dump["schedule"]["games"]) < 50
+    assert len(json.dumps(dump)) <= 2000
+    assert dump["truncated"] is True
@@ -0,0 +1,150 @@
+"""Tests for the dieLiga league discovery index."""
+
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.dieliga.discovery import (
+    LeagueIndex,
+    async_get_league_index,
+    search_leagues,
+)
+
+from .test_api import SCOREBOARD_XML
+
+OVERVIEW_HTML = """
+<html><body>
+    <a href="/schedule/overview/1234">Test League</a>
+    <a href="/schedule/summary/1234">Table</a>
+    <a href="/schedule/overview/5678">Broken League</a>
+</body></html>
+"""
+
+
+def _mock_host(aioclient_mock) -> None:
+    """Register the overview and league responses of example.com."""
+    aioclient_mock.get("https://example.com/schedule/overview", text=OVERVIEW_HTML)
+    aioclient_mock.get(
+        "https://example.com/schedule/summary/1234?output=xml", text=SCOREBOARD_XML
+    )
+    aioclient_mock.get(
+        "https://example.com/schedule/summary/5678?output=xml", status=500
+    )
+
+
+@pytest.mark.asyncio
+async def test_index_crawls_host_once(hass: HomeAssistant, aioclient_mock):
+    """Test that a host is crawled once and served from the index afterwards."""
+    _mock_host(aioclient_mock)
+    index = await async_get_league_index(hass)
+
+    leagues = await index.async_get_leagues("https://example.com/")
+
+    assert leagues == [
+        {
+            "liga_id": "1234",
+            "league": "Test League",
+            "group": "Group A",
+            "region": "Region 1",
+            "teams": ["Team 1"],
+        }
+    ]
+    assert aioclient_mock.call_count == 3
+
+    assert await index.async_get_leagues("https://example.com") == leagues
+    assert aioclient_mock.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_index_refreshes_stale_host(
+    hass: HomeAssistant, aioclient_mock, hass_storage
+):
+    """Test that a stale host is served immediately and re-crawled in background."""
+    _mock_host(aioclient_mock)
+    hass_storage["dieliga.league_index"] = {
+        "version": 1,
+        "key": "dieliga.league_index",
+        "data": {
+            "hosts": {
+                "https://example.com": {
+                    "updated": time.time() - 30 * 24 * 3600,
+                    "leagues": [],
+                }
+            }
+        },
+    }
+    index = LeagueIndex(hass)
+    await index.async_load()
+
+    assert await index.async_get_leagues("https://example.com") == []
+    await hass.async_block_till_done()
+
+    assert len(await index.async_get_leagues("https://example.com")) == 1
+
+
+@pytest.mark.asyncio
+async def test_index_logs_failed_refresh(
+    hass: HomeAssistant, aioclient_mock, hass_storage, caplog
+):
+    """Test that a failing background crawl is logged and keeps the stale entry."""
+    aioclient_mock.get("https://example.com/schedule/overview", status=500)
+    hass_storage["dieliga.league_index"] = {
+        "version": 1,
+        "key": "dieliga.league_index",
+        "data": {
+            "hosts": {
+                "https://example.com": {
+                    "updated": time.time() - 30 * 24 * 3600,
+                    "leagues": [],
+                }
+            }
+        },
+    }
+    index = LeagueIndex(hass)
+    await index.async_load()
+
+    assert await index.async_get_leagues("https://example.com") == []
+    await hass.async_block_till_done()
+
+    assert "Error refreshing the league index of https://example.com" in caplog.text
+    assert await index.async_get_leagues("https://example.com") == []
+
+
+def test_search_leagues():
+    """Test searching by league, region and team name."""
+    leagues = [
+        {
+            "liga_id": "1",
+            "league": "Kreisliga",
+            "group": "A",
+            "region": "Leipzig",
+            "teams": ["Blau-Weiss"],
+        },
+        {
+            "liga_id": "2",
+            "league": "Bezirksliga",
+            "group": "B",
+            "region": "Dresden",
+            "teams": ["Rot-Gelb"],
+        },
+    ]
+
+    assert search_leagues(leagues, "") == leagues
+    assert search_leagues(leagues, "dresden") == [leagues[1]]
+    assert search_leagues(leagues, "liga blau") == [leagues[0]]
+    assert search_leagues(leagues, "hamburg") == []
+
+
+@pytest.mark.asyncio
+async def test_index_does_not_cache_empty_crawl(hass: HomeAssistant, aioclient_mock):
+    """Test that a crawl without leagues is repeated on the next request."""
+    aioclient_mock.get("https://example.com/schedule/overview", text="<html></html>")
+    index = LeagueIndex(hass)
+
+    assert await index.async_get_leagues("https://example.com") == []
+    assert aioclient_mock.call_count == 1
+
+    aioclient_mock.clear_requests()
+    _mock_host(aioclient_mock)
+    assert len(await index.async_get_leagues("https://example.com")) == 1
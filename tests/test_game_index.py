@@ -0,0 +1,98 @@
+"""Tests for the dieLiga game indexes and the games query service."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.game_index import GameIndex
+from custom_components.dieliga.services import async_setup_services
+
+
+def _game(number, day, team_a, team_b, sets_a=0, sets_b=0, new_date="-"):
+    """Return a schedule game."""
+    return {
+        "game_number": str(number),
+        "date": day,
+        "new_date": new_date,
+        "team_a_name": team_a,
+        "team_b_name": team_b,
+        "team_a_sets": str(sets_a),
+        "team_b_sets": str(sets_b),
+        "state": "Completed" if sets_a or sets_b else "Scheduled",
+    }
+
+
+DATA = {
+    "schedule": {
+        "games": [
+            _game(1, "2026-01-01", "Team A", "Team B", 3, 1),
+            # Rescheduled behind game 3
+            _game(2, "2026-01-08", "Team C", "Team A", 3, 2, new_date="2026-01-20"),
+            _game(3, "2026-01-15", "Team B", "Team C", 0, 3),
+            _game(4, "2026-01-22", "Team B", "Team A"),
+            _game(5, "-", "Team A", "Team C"),
+        ]
+    }
+}
+
+
+def _numbers(games):
+    return [game["game_number"] for game in games]
+
+
+def test_query():
+    """Test that the filters are answered from the indexes in date order."""
+    index = GameIndex(DATA)
+    assert _numbers(index.query()) == ["1", "3", "2", "4", "5"]
+    assert _numbers(index.query(team="team a")) == ["1", "2", "4", "5"]
+    assert _numbers(index.query(team="Team A", start="2026-01-10")) == ["2", "4"]
+    assert _numbers(index.query(team="Team A", venue="away")) == ["2", "4"]
+    assert _numbers(index.query(team="Team A", opponent="Team B")) == ["1", "4"]
+    assert _numbers(index.query(opponent="Team C", completed=True)) == ["3", "2"]
+    assert _numbers(index.query(team="Team A", completed=False)) == ["4", "5"]
+    assert _numbers(index.query(state="scheduled", end="2026-01-31")) == ["4"]
+    assert index.query(team="Team D") == []
+
+
+@pytest.mark.asyncio
+async def test_get_games_service(hass: HomeAssistant):
+    """Test that the service answers from every loaded league at once."""
+    coordinators = {}
+    for liga_id, data in (("1234", DATA), ("5678", {"schedule": {"games": []}})):
+        coordinator = MagicMock()
+        coordinator.liga_id = liga_id
+        coordinator.games = GameIndex(data)
+        coordinators[liga_id] = coordinator
+    hass.data[DOMAIN] = coordinators
+    async_setup_services(hass)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_games",
+        {"team": "Team A", "completed": True, "order": "descending", "limit": 1},
+        blocking=True,
+        return_response=True,
+    )
+    assert _numbers(response["leagues"]["1234"]) == ["2"]
+    assert response["leagues"]["5678"] == []
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_games",
+        {"team": "Team A", "order": "descending"},
+        blocking=True,
+        return_response=True,
+    )
+    assert _numbers(response["leagues"]["1234"]) == ["4", "2", "1", "5"]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "get_games",
+            {"venue": "home"},
+            blocking=True,
+            return_response=True,
+        )
@@ -0,0 +1,239 @@
+"""Tests for setting up dieLiga config entries."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.const import DOMAIN
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+
+SCOREBOARD_URL = "https://example.com/schedule/summary/1234?output=xml"
+SCHEDULE_URL = "https://example.com/schedule/schedule/1234?output=xml"
+
+
+def _mock_entry(hass: HomeAssistant, **options) -> MockConfigEntry:
+    """Add a dieLiga entry for league 1234 of example.com."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={"base_url": "https://example.com", "liga_id": 1234},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_setup_unreachable_host(hass: HomeAssistant, aioclient_mock):
+    """Test that an unreachable host delays setup by default."""
+    aioclient_mock.get(SCOREBOARD_URL, status=500)
+    entry = _mock_entry(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+@pytest.mark.asyncio
+async def test_fast_start_unreachable_host(hass: HomeAssistant, aioclient_mock):
+    """Test that fast start sets up a loading entry for an unreachable host."""
+    aioclient_mock.get(SCOREBOARD_URL, status=500)
+    entry = _mock_entry(hass, fast_start=True)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][entry.entry_id].data is None
+
+
+@pytest.mark.asyncio
+async def test_fast_start_serves_snapshot(
+    hass: HomeAssistant, aioclient_mock, hass_storage
+):
+    """Test that fast start serves the snapshot until the first refresh is done."""
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass, fast_start=True)
+    snapshot = {
+        "scoreboard": {"league": "Cached League", "teams": []},
+        "schedule": {"games": []},
+    }
+    hass_storage[f"dieliga.{entry.entry_id}.snapshot"] = {
+        "version": 1,
+        "key": f"dieliga.{entry.entry_id}.snapshot",
+        "data": snapshot,
+    }
+    released = asyncio.Event()
+
+    async def _async_get_scoreboard(self, liga_id):
+        await released.wait()
+        return {"league": "Test League", "teams": []}
+
+    with patch.object(DieligaApiClient, "async_get_scoreboard", _async_get_scoreboard):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        assert entry.state is ConfigEntryState.LOADED
+        assert coordinator.data == snapshot
+
+        released.set()
+        await hass.async_block_till_done()
+
+    assert coordinator.data["scoreboard"]["league"] == "Test League"
+    assert coordinator.data["schedule"]["group"] == "Group A"
+
+
+def _requests(aioclient_mock, url: str) -> int:
+    """Return the number of requests made to a URL."""
+    return sum(1 for call in aioclient_mock.mock_calls if str(call[1]) == url)
+
+
+@pytest.mark.asyncio
+async def test_probe_skips_unchanged_schedule(hass: HomeAssistant, aioclient_mock):
+    """Test that the schedule is only downloaded when last_change moved."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass, probe_changes=True)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data, version = coordinator.data, coordinator.data_version
+
+    for _refresh in range(3):
+        await coordinator.async_refresh()
+    assert coordinator.data is data
+    assert coordinator.data_version == version
+    assert _requests(aioclient_mock, SCOREBOARD_URL) == 4
+    assert _requests(aioclient_mock, SCHEDULE_URL) == 1
+    assert coordinator.refresh_stats.skipped_schedules == 3
+    assert coordinator.data["schedule"]["games"][0]["game_number"] == "101"
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(
+        SCOREBOARD_URL,
+        text=SCOREBOARD_XML.replace("2026-01-31", "2026-02-07"),
+    )
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    await coordinator.async_refresh()
+    assert _requests(aioclient_mock, SCHEDULE_URL) == 1
+    assert coordinator.data["scoreboard"]["last_change"] == "2026-02-07"
+
+    # The schedule is refreshed after the staleness ceiling anyway
+    with patch(
+        "custom_components.dieliga.coordinator.monotonic",
+        return_value=coordinator._schedule_fetched + 3 * 24 * 3600,
+    ):
+        await coordinator.async_refresh()
+    assert _requests(aioclient_mock, SCHEDULE_URL) == 2
+
+
+@pytest.mark.asyncio
+async def test_teams_changed_without_refetch(hass: HomeAssistant, aioclient_mock):
+    """Test that tracked teams are added and removed from the data at hand."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={
+            "base_url": "https://example.com",
+            "liga_id": 1234,
+            "team_name": "Team 1",
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    requests = aioclient_mock.call_count
+    registry = er.async_get(hass)
+
+    def _entity_id(unique_id: str) -> str | None:
+        return registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+
+    assert _entity_id("dieliga_table_1234") is not None
+    assert hass.states.get(_entity_id("dieliga_table_1234")).state == "1"
+
+    hass.config_entries.async_update_entry(entry, options={"teams": ["Team 2"]})
+    await hass.async_block_till_done()
+
+    assert _entity_id("dieliga_table_1234") is None
+    team_2 = _entity_id("dieliga_table_1234_team_2")
+    assert team_2 is not None
+    schedule = hass.states.get(_entity_id("dieliga_schedule_1234_team_2"))
+    assert schedule.attributes["total_games"] == 1
+    assert aioclient_mock.call_count == requests
+
+    hass.config_entries.async_update_entry(
+        entry, options={"teams": ["Team 1", "Team 2"]}
+    )
+    await hass.async_block_till_done()
+    assert _entity_id("dieliga_table_1234") is not None
+    assert _entity_id("dieliga_table_1234_team_2") == team_2
+    assert aioclient_mock.call_count == requests
+
+
+@pytest.mark.asyncio
+async def test_rejected_response_keeps_data(hass: HomeAssistant, aioclient_mock):
+    """Test that a rejected response keeps the last good data available."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    data, version = coordinator.data, coordinator.data_version
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text='<!DOCTYPE x [<!ENTITY a "a">]><x/>')
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data is data
+    assert coordinator.data_version == version
+    assert coordinator.refresh_stats.rejected_responses == 1
+    assert coordinator.refresh_stats.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_max_response_size_option(hass: HomeAssistant, aioclient_mock):
+    """Test that the response size limit follows the entry's option."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML + " " * 1_000_000)
+    entry = _mock_entry(hass, max_response_size=1)
+    await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+    hass.config_entries.async_update_entry(entry, options={"max_response_size": 2})
+    await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.data[DOMAIN][entry.entry_id].client.limits.max_bytes == 2_000_000
+
+
+@pytest.mark.asyncio
+async def test_refresh_publishes_frozen_snapshot(hass: HomeAssistant, aioclient_mock):
+    """Test that each refresh publishes a read only snapshot of a new version."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=SCHEDULE_XML)
+    entry = _mock_entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    version = coordinator.data_version
+
+    games = coordinator.data["schedule"]["games"]
+    with pytest.raises(RuntimeError):
+        games.append({})
+    with pytest.raises(RuntimeError):
+        games[0]["state"] = "Cancelled"
+
+    await coordinator.async_refresh()
+    assert coordinator.data_version == version + 1
+    assert coordinator.data["schedule"]["games"] == games
@@ -0,0 +1,129 @@
+"""Tests for the live match-day mode."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.live import kickoff, live_games, next_kickoff
+
+from .test_api import SCOREBOARD_XML
+from .test_init import SCHEDULE_URL, SCOREBOARD_URL, _mock_entry, _requests
+
+LIVE_SCHEDULE_XML = """
+<results>
+    <day_of_play>
+        <game>
+            <gamenr>101</gamenr>
+            <date>{date}</date>
+            <new_date>-</new_date>
+            <time>{time}</time>
+            <team_a name="Team 1" points="0" sets="{sets_a}" balls="0" />
+            <team_b name="Team 2" points="0" sets="{sets_b}" balls="0" />
+            <state>Open</state>
+        </game>
+    </day_of_play>
+</results>
+"""
+
+
+def _schedule(start: datetime, sets_a: str = "0", sets_b: str = "0") -> str:
+    """Return a schedule with one game of Team 1 starting at start."""
+    return LIVE_SCHEDULE_XML.format(
+        date=start.strftime("%Y-%m-%d"),
+        time=start.strftime("%H:%M"),
+        sets_a=sets_a,
+        sets_b=sets_b,
+    )
+
+
+def _game(date: str, time: str, sets: str = "0") -> dict:
+    return {
+        "date": date,
+        "new_date": "-",
+        "time": time,
+        "team_a_sets": sets,
+        "team_b_sets": "0",
+    }
+
+
+def test_live_games_window():
+    """Test that games are live from kickoff until a result or the timeout."""
+    now = dt_util.as_local(datetime(2026, 3, 7, 15, 0))
+    running = _game("2026-03-07", "14:00")
+    finished = _game("2026-03-07", "14:00", sets="3")
+    timed_out = _game("2026-03-07", "10:00")
+    later = _game("2026-03-07", "18:00")
+    unknown = _game("2026-03-07", "-")
+
+    assert kickoff(unknown) is None
+    games = [running, finished, timed_out, later, unknown]
+    assert list(live_games(games, now)) == [running]
+    assert next_kickoff(games, now) == kickoff(later)
+
+
+@pytest.mark.asyncio
+async def test_live_mode_polls_schedule_until_result(
+    hass: HomeAssistant, aioclient_mock
+):
+    """Test that a running match polls the schedule conditionally until a result."""
+    start = dt_util.now().replace(second=0, microsecond=0) - timedelta(minutes=30)
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=_schedule(start), headers={"ETag": '"1"'})
+    entry = _mock_entry(hass, teams=["Team 1"], live_mode=True)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.live
+    assert coordinator.scheduler.as_dict()["live_entries"] == 1
+
+    # Unchanged: a 304 keeps the data without fetching the scoreboard
+    data, version = coordinator.data, coordinator.data_version
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, status=304)
+    await coordinator.async_background_refresh()
+    assert aioclient_mock.mock_calls[0][3] == {"If-None-Match": '"1"'}
+    assert _requests(aioclient_mock, SCOREBOARD_URL) == 0
+    assert coordinator.data is data
+    assert coordinator.data_version == version
+    assert coordinator.refresh_stats.unchanged_schedules == 1
+    assert coordinator.live
+
+    # A result ends live mode and refreshes the official table once
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=_schedule(start, "3", "1"))
+    await coordinator.async_background_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.data["schedule"]["games"][0]["team_a_sets"] == "3"
+    assert not coordinator.live
+    assert coordinator.scheduler.as_dict()["live_entries"] == 0
+    assert _requests(aioclient_mock, SCOREBOARD_URL) == 1
+
+
+@pytest.mark.asyncio
+async def test_live_mode_starts_at_kickoff(
+    hass: HomeAssistant, aioclient_mock, freezer: FrozenDateTimeFactory
+):
+    """Test that live mode starts at kickoff without waiting for a refresh."""
+    start = dt_util.now().replace(second=0, microsecond=0) + timedelta(hours=1)
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=_schedule(start))
+    entry = _mock_entry(hass, teams=["Team 1"], live_mode=True)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert not coordinator.live
+
+    freezer.move_to(start + timedelta(seconds=1))
+    async_fire_time_changed(hass, start + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert coordinator.live
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not coordinator.live
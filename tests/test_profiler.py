@@ -0,0 +1,132 @@
+"""Tests for the dieLiga refresh profiler."""
+
+import tracemalloc
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.coordinator import DieligaDataUpdateCoordinator
+from custom_components.dieliga.profiler import (
+    MAX_SESSION_DURATION,
+    DieligaRefreshProfiler,
+)
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+
+
+@pytest.mark.asyncio
+async def test_profiler_writes_results(hass: HomeAssistant, tmp_path: Path):
+    """Test that the profiler covers the next refreshes and writes its results."""
+    client = MagicMock()
+    client.async_get_scoreboard = AsyncMock(return_value={"teams": []})
+    client.async_get_schedule = AsyncMock(return_value={"games": []})
+    coordinator = DieligaDataUpdateCoordinator(hass, client, "1234")
+
+    profiler = DieligaRefreshProfiler(hass, [coordinator], 2)
+    profiler.start()
+    assert coordinator.profiler is profiler
+
+    await coordinator.async_refresh()
+    assert coordinator.profiler is profiler
+    assert not list(tmp_path.glob("*.pstats"))
+
+    await coordinator.async_refresh()
+    assert coordinator.profiler is None
+    assert len(list(tmp_path.glob("dieliga_profile.*.pstats"))) == 1
+    allocations = list(tmp_path.glob("dieliga_allocations.*.txt"))
+    assert len(allocations) == 1
+    assert allocations[0].read_text().startswith("Top ")
+
+
+@pytest.mark.asyncio
+async def test_profile_service(hass: HomeAssistant, aioclient_mock, tmp_path: Path):
+    """Test that the profile service triggers and profiles a refresh."""
+    aioclient_mock.get(
+        "https://example.com/schedule/summary/1234?output=xml", text=SCOREBOARD_XML
+    )
+    aioclient_mock.get(
+        "https://example.com/schedule/schedule/1234?output=xml", text=SCHEDULE_XML
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={"base_url": "https://example.com", "liga_id": 1234},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, "profile", {"entry_id": entry.entry_id}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert len(list(tmp_path.glob("dieliga_profile.*.pstats"))) == 1
+    assert hass.data[DOMAIN][entry.entry_id].profiler is None
+
+
+@pytest.mark.asyncio
+async def test_profile_ends_on_unload(
+    hass: HomeAssistant, aioclient_mock, tmp_path: Path
+):
+    """Test that unloading the entry ends a session that is still waiting."""
+    aioclient_mock.get(
+        "https://example.com/schedule/summary/1234?output=xml", text=SCOREBOARD_XML
+    )
+    aioclient_mock.get(
+        "https://example.com/schedule/schedule/1234?output=xml", text=SCHEDULE_XML
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={"base_url": "https://example.com", "liga_id": 1234},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    await hass.services.async_call(
+        DOMAIN,
+        "profile",
+        {"entry_id": entry.entry_id, "trigger_refresh": False},
+        blocking=True,
+    )
+    assert coordinator.profiler is not None
+    assert tracemalloc.is_tracing()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert not tracemalloc.is_tracing()
+    assert coordinator.profiler is None
+    assert len(list(tmp_path.glob("dieliga_profile.*.pstats"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_profiler_times_out(
+    hass: HomeAssistant, tmp_path: Path, freezer: FrozenDateTimeFactory
+):
+    """Test that a session without refreshes ends after the maximum duration."""
+    client = MagicMock()
+    coordinator = DieligaDataUpdateCoordinator(hass, client, "1234")
+
+    profiler = DieligaRefreshProfiler(hass, [coordinator], 1)
+    profiler.start()
+    assert tracemalloc.is_tracing()
+
+    freezer.tick(MAX_SESSION_DURATION)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert not tracemalloc.is_tracing()
+    assert coordinator.profiler is None
+    assert len(list(tmp_path.glob("dieliga_profile.*.pstats"))) == 1
@@ -0,0 +1,173 @@
+"""Tests for the dieLiga refresh scheduler."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.dieliga.coordinator import DieligaDataUpdateCoordinator
+from custom_components.dieliga.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    HostQueue,
+    RefreshScheduler,
+    next_poll_delay,
+)
+
+
+def test_poll_slots_are_spread_and_stable():
+    """Test that entries get distinct slots that survive a restart."""
+    interval = 12 * 3600
+    now = 1_800_000_000.0
+
+    delays = {next_poll_delay(f"entry{i}", interval, now) for i in range(20)}
+    assert len(delays) > 15
+    assert max(delays) - min(delays) > interval / 2
+    assert all(0 < delay <= interval for delay in delays)
+
+    # Same slot in wall-clock time when computed later
+    first = now + next_poll_delay("entry1", interval, now)
+    later = now + 3600
+    assert later + next_poll_delay("entry1", interval, later) in (
+        first,
+        first + interval,
+    )
+
+
+def test_poll_delay_of_zero_interval():
+    """Test that a zero interval polls once per second instead of failing."""
+    assert 0 < next_poll_delay("entry1", 0, 1_800_000_000.0) <= 1
+
+
+@pytest.mark.asyncio
+async def test_host_queue_serves_user_first():
+    """Test that waiting user refreshes go before background polls."""
+    queue = HostQueue(1)
+    order = []
+
+    async def _fetch(name, priority):
+        await queue.acquire(priority)
+        order.append(name)
+        queue.release(priority)
+
+    await queue.acquire(PRIORITY_BACKGROUND)
+    background = asyncio.create_task(_fetch("background", PRIORITY_BACKGROUND))
+    user = asyncio.create_task(_fetch("user", PRIORITY_USER))
+    await asyncio.sleep(0)
+    assert queue.queued == 2
+
+    queue.release(PRIORITY_BACKGROUND)
+    await asyncio.gather(background, user)
+
+    assert order == ["user", "background"]
+    assert queue.as_dict()["completed_user"] == 1
+    assert queue.as_dict()["completed_background"] == 2
+
+
+@pytest.mark.asyncio
+async def test_host_queue_cancelled_waiter():
+    """Test that a cancelled waiter does not leak the slot."""
+    queue = HostQueue(1)
+    await queue.acquire(PRIORITY_USER)
+    waiter = asyncio.create_task(queue.acquire(PRIORITY_BACKGROUND))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    queue.release(PRIORITY_USER)
+    await asyncio.wait_for(queue.acquire(PRIORITY_USER), 1)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_fetches_per_host(hass: HomeAssistant):
+    """Test that coordinators fetch through the host slots."""
+    scheduler = RefreshScheduler(hass)
+    running = 0
+    peak = 0
+
+    async def _async_get(liga_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    coordinators = []
+    for liga_id in range(10):
+        client = MagicMock()
+        client.base_url = "https://example.com"
+        client.async_get_scoreboard = AsyncMock(side_effect=_async_get)
+        client.async_get_schedule = AsyncMock(side_effect=_async_get)
+        coordinators.append(
+            DieligaDataUpdateCoordinator(
+                hass,
+                client,
+                str(liga_id),
+                update_interval=timedelta(hours=1),
+                scheduler=scheduler,
+            )
+        )
+
+    await asyncio.gather(*(c.async_background_refresh() for c in coordinators))
+
+    assert peak == 4
+    assert all(c.update_interval is None for c in coordinators)
+    stats = scheduler.as_dict()["hosts"]["https://example.com"]
+    assert stats["completed_background"] == 10
+
+
+@pytest.mark.asyncio
+async def test_scheduler_skips_fresh_poll(hass: HomeAssistant):
+    """Test that a poll right after a user refresh is skipped."""
+    scheduler = RefreshScheduler(hass)
+    client = MagicMock()
+    client.base_url = "https://example.com"
+    client.async_get_scoreboard = AsyncMock(return_value={})
+    client.async_get_schedule = AsyncMock(return_value={})
+    coordinator = DieligaDataUpdateCoordinator(
+        hass, client, "1234", scheduler=scheduler
+    )
+
+    await coordinator.async_refresh()
+    await scheduler._async_poll(coordinator)
+
+    assert client.async_get_scoreboard.call_count == 1
+    assert scheduler.as_dict()["skipped_polls"] == 1
+
+    scheduler.async_schedule(coordinator)
+    assert scheduler.as_dict()["scheduled_entries"] == 1
+    scheduler.async_unschedule(coordinator)
+    assert scheduler.as_dict()["scheduled_entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_live_entries_per_host(hass: HomeAssistant):
+    """Test that only a few entries of a host poll at the live interval."""
+    scheduler = RefreshScheduler(hass)
+    coordinators = []
+    for liga_id in range(3):
+        client = MagicMock()
+        client.base_url = "https://example.com"
+        coordinators.append(
+            DieligaDataUpdateCoordinator(
+                hass, client, str(liga_id), scheduler=scheduler
+            )
+        )
+    first, second, third = coordinators
+
+    assert scheduler.async_start_live(first)
+    assert scheduler.async_start_live(second)
+    assert not scheduler.async_start_live(third)
+    assert not third.live
+    assert scheduler.poll_interval(first) == 60
+    assert scheduler.poll_interval(third) == 12 * 3600
+    assert scheduler.as_dict()["live_entries"] == 2
+
+    scheduler.async_stop_live(first)
+    assert not first.live
+    assert scheduler.async_start_live(third)
+    for coordinator in coordinators:
+        scheduler.async_unschedule(coordinator)
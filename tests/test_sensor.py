@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 from homeassistant.core import HomeAssistant
 
 import pytest
+from custom_components.dieliga.game_index import GameIndex
 from custom_components.dieliga.sensor import (
     DieligaScoreboardSensor,
     DieligaScheduleSensor,
@@ -63,6 +64,8 @@ async def test_schedule_sensor_attributes(hass: HomeAssistant):
     coordinator.last_update_success = True
     coordinator.liga_id = "1234"
 
+    coordinator.games = GameIndex(coordinator.data)
+
     sensor = DieligaScheduleSensor(coordinator, team_name="Team 1")
 
     # Check attributes
@@ -70,3 +73,30 @@ async def test_schedule_sensor_attributes(hass: HomeAssistant):
     assert attrs["group"] == "Group A"
     assert attrs["total_games"] == 1  # Filtered by team
     assert attrs["last_update_success"] is True
+
+
+@pytest.mark.asyncio
+async def test_derived_values_memoized_per_version(hass: HomeAssistant):
+    """Test that derived values are computed once per data version."""
+    game = {
+        "team_a_name": "Team 1",
+        "team_b_name": "Team 2",
+        "date": "2026-01-01",
+        "new_date": "-",
+        "game_number": "1",
+    }
+    coordinator = MagicMock()
+    coordinator.data = {"schedule": {"games": [game]}}
+    coordinator.data_version = 1
+    coordinator.liga_id = "1234"
+    coordinator.games.team = MagicMock(return_value=[game])
+
+    sensor = DieligaScheduleSensor(coordinator, team_name="Team 1")
+    assert sensor.native_value == "100"
+    assert sensor.extra_state_attributes["total_games"] == 1
+    assert coordinator.games.team.call_count == 1
+
+    coordinator.data_version = 2
+    coordinator.games.team.return_value = [game, {**game, "date": "2099-01-01"}]
+    assert sensor.native_value == "50"
+    assert coordinator.games.team.call_count == 2
@@ -0,0 +1,197 @@
+"""Tests for the dieLiga standings replay."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.coordinator import DieligaDataUpdateCoordinator
+from custom_components.dieliga.long_term_statistics import (
+    StandingsStatistics,
+    matchday_start,
+)
+from custom_components.dieliga.standings import StandingsHistory, scoreboard_rows
+
+
+def _game(number, day_of_play, day, team_a, team_b, sets_a, sets_b, new_date="-"):
+    """Return a schedule game; the winner gets two points."""
+    return {
+        "game_number": str(number),
+        "day_of_play": day_of_play,
+        "date": day,
+        "new_date": new_date,
+        "team_a_name": team_a,
+        "team_b_name": team_b,
+        "team_a_sets": str(sets_a),
+        "team_b_sets": str(sets_b),
+        "team_a_points": "2" if sets_a > sets_b else "0",
+        "team_b_points": "2" if sets_b > sets_a else "0",
+        "team_a_balls": str(25 * sets_a),
+        "team_b_balls": str(25 * sets_b),
+    }
+
+
+DATA = {
+    "schedule": {
+        "games": [
+            _game(1, 1, "2026-01-01", "Team A", "Team B", 3, 0),
+            _game(2, 1, "2026-01-01", "Team C", "Team D", 3, 1),
+            _game(3, 2, "2026-01-08", "Team B", "Team C", 3, 2),
+            # Postponed until after matchday 3
+            _game(4, 2, "2026-01-08", "Team D", "Team A", 3, 0, "2026-01-20"),
+            _game(5, 3, "2026-01-15", "Team A", "Team C", 3, 0),
+            _game(6, 3, "2026-01-15", "Team B", "Team D", 0, 0),
+        ]
+    }
+}
+
+
+def test_replay_matchdays():
+    """Test the tables after each matchday and the tiebreakers."""
+    history = StandingsHistory(DATA)
+    assert [day["day_of_play"] for day in history.matchdays] == [1, 2, 3]
+
+    first = history.matchdays[0]["teams"]
+    # Equal points; Team A wins on the better set difference (3:0 vs 3:1)
+    assert [row["name"] for row in first] == ["Team A", "Team C", "Team D", "Team B"]
+
+    second = history.matchdays[1]["teams"]
+    assert second[0]["name"] == "Team A"
+    assert second[0]["games"] == 1
+    assert {row["name"]: row["games"] for row in second}["Team D"] == 1
+
+    # The postponed game is only in the current table
+    third = {row["name"]: row for row in history.matchdays[2]["teams"]}
+    assert third["Team A"]["points_positive"] == 4
+    current = {row["name"]: row for row in history.current}
+    assert current["Team D"]["points_positive"] == 2
+    assert current["Team A"]["games"] == 3
+
+    assert [entry["position"] for entry in history.positions("team a")] == [1, 1, 1]
+
+
+def test_day_of_play_parsed():
+    """Test that the schedule parser numbers the days of play."""
+    client = DieligaApiClient(None, "https://example.com")
+    xml = (
+        "<results><day_of_play><game><gamenr>1</gamenr></game></day_of_play>"
+        "<day_of_play><game><gamenr>2</gamenr></game></day_of_play></results>"
+    )
+    games = client._parse_schedule_xml(xml)["games"]
+    assert [game["day_of_play"] for game in games] == [1, 2]
+
+
+def _official(data: dict) -> dict:
+    """Return a scoreboard that matches the games of a snapshot."""
+    return {
+        "league": "Test League",
+        "last_change": "2026-01-20",
+        "teams": scoreboard_rows(StandingsHistory(data).current),
+    }
+
+
+@pytest.mark.asyncio
+async def test_scoreboard_derived_once_verified(hass: HomeAssistant, caplog):
+    """Test that a verified derived table replaces the scoreboard fetch."""
+    client = MagicMock()
+    client.async_get_schedule = AsyncMock(return_value=DATA["schedule"])
+    client.async_get_scoreboard = AsyncMock(return_value=_official(DATA))
+    coordinator = DieligaDataUpdateCoordinator(hass, client, "1234")
+
+    await coordinator.async_refresh()
+    assert client.async_get_scoreboard.call_count == 1
+    assert coordinator.local_standings.trusted
+
+    await coordinator.async_refresh()
+    assert client.async_get_scoreboard.call_count == 1
+    assert coordinator.local_standings.skipped_fetches == 1
+    scoreboard = coordinator.data["scoreboard"]
+    assert scoreboard["league"] == "Test League"
+    assert "last_change" not in scoreboard
+    assert scoreboard["teams"] == _official(DATA)["teams"]
+
+    # A different set of games (e.g. a new season) is verified again
+    client.async_get_schedule.return_value = {"games": DATA["schedule"]["games"][:2]}
+    await coordinator.async_refresh()
+    assert client.async_get_scoreboard.call_count == 2
+    assert not coordinator.local_standings.trusted
+    assert coordinator.data["scoreboard"]["teams"][0]["name"] == "Team A"
+
+    # The official table disagrees, so it keeps being fetched and logged
+    coordinator.local_standings.always_verify = True
+    await coordinator.async_refresh()
+    assert client.async_get_scoreboard.call_count == 3
+    assert coordinator.local_standings.discrepancies == 2
+    assert "differs from the scoreboard" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_long_term_statistics(hass: HomeAssistant):
+    """Test the backfill and that later imports only hold changed matchdays."""
+    hass.config.components.add("recorder")
+    coordinator = MagicMock()
+    coordinator.liga_id = "1234"
+    coordinator.teams = []
+    coordinator.data_version = 1
+    coordinator.standings = StandingsHistory(DATA)
+    importer = StandingsStatistics(hass, coordinator)
+
+    with patch(
+        "custom_components.dieliga.long_term_statistics._async_add_statistics"
+    ) as add:
+        importer.async_update()
+        batches = {
+            call.args[1]["statistic_id"]: call.args[2] for call in add.mock_calls
+        }
+        # Four teams with a position, points and set ratio each
+        assert len(batches) == 12
+        assert [row["mean"] for row in batches["dieliga:1234_team_a_position"]] == [
+            1.0,
+            1.0,
+            1.0,
+        ]
+        assert batches["dieliga:1234_team_a_set_ratio"][0]["mean"] == 3.0
+        assert batches["dieliga:1234_team_a_points"][0]["start"] == matchday_start(
+            "2026-01-01"
+        )
+
+        # An unchanged table is not imported again
+        add.reset_mock()
+        coordinator.data_version = 2
+        importer.async_update()
+        assert not add.mock_calls
+
+        games = [dict(game) for game in DATA["schedule"]["games"]]
+        games[5]["team_a_sets"], games[5]["team_a_points"] = "3", "2"
+        coordinator.data_version = 3
+        coordinator.standings = StandingsHistory({"schedule": {"games": games}})
+        importer.async_update()
+        rows = [row for call in add.mock_calls for row in call.args[2]]
+        assert rows
+        assert {row["start"] for row in rows} == {matchday_start("2026-01-15")}
+
+
+def test_long_term_statistics_one_row_per_date(hass: HomeAssistant):
+    """Test that of two matchdays on one date only the last table is imported."""
+    coordinator = MagicMock()
+    coordinator.liga_id = "1234"
+    coordinator.teams = ["Team A"]
+    importer = StandingsStatistics(hass, coordinator)
+    games = [
+        _game(1, 1, "2026-01-01", "Team A", "Team B", 3, 0),
+        _game(2, 2, "2026-01-01", "Team B", "Team A", 3, 0),
+    ]
+    matchdays = StandingsHistory({"schedule": {"games": games}}).matchdays
+    assert [day["date"] for day in matchdays] == ["2026-01-01", "2026-01-01"]
+
+    batches = {
+        metadata["statistic_id"]: statistics
+        for metadata, statistics in importer.batches(matchdays)
+    }
+    # 3:0 after the first matchday, 3:3 after the second
+    set_ratio = batches["dieliga:1234_team_a_set_ratio"]
+    assert [(row["start"], row["mean"]) for row in set_ratio] == [
+        (matchday_start("2026-01-01"), 1.0)
+    ]
+    assert importer.batches(matchdays) == []
@@ -0,0 +1,102 @@
+"""Tests for the dieLiga team statistics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.sensor import (
+    DieligaFormSensor,
+    DieligaPointsPerGameSensor,
+)
+from custom_components.dieliga.services import async_setup_services
+from custom_components.dieliga.statistics import LeagueStatistics
+
+
+def _game(number, day, team_a, team_b, sets_a, sets_b, points_a, points_b):
+    """Return a schedule game."""
+    return {
+        "game_number": str(number),
+        "date": day,
+        "new_date": "-",
+        "team_a_name": team_a,
+        "team_b_name": team_b,
+        "team_a_sets": str(sets_a),
+        "team_b_sets": str(sets_b),
+        "team_a_points": str(points_a),
+        "team_b_points": str(points_b),
+        "team_a_balls": "50",
+        "team_b_balls": "40",
+    }
+
+
+DATA = {
+    "schedule": {
+        "games": [
+            # Listed out of order on purpose; form follows the dates
+            _game(3, "2026-01-15", "Team A", "Team C", 1, 1, 1, 1),
+            _game(1, "2026-01-01", "Team A", "Team B", 2, 0, 2, 0),
+            _game(2, "2026-01-08", "Team B", "Team A", 2, 1, 2, 0),
+            _game(4, "2026-01-22", "Team C", "Team B", 0, 0, 0, 0),
+        ]
+    }
+}
+
+
+def test_aggregates():
+    """Test that all teams are aggregated from the played games."""
+    stats = LeagueStatistics(DATA, 1)
+    team_a = stats.team("team a")
+    assert team_a["name"] == "Team A"
+    assert team_a["games"] == 3
+    assert (team_a["wins"], team_a["draws"], team_a["losses"]) == (1, 1, 1)
+    assert team_a["points"] == 3
+    assert team_a["points_per_game"] == 1.0
+    assert team_a["sets_won"] == 4
+    assert team_a["sets_lost"] == 3
+    assert team_a["home_games"] == 2
+    assert team_a["home_points_per_game"] == 1.5
+    assert team_a["away_points_per_game"] == 0.0
+    assert stats.form("Team A") == "WLD"
+    assert stats.form("Team A", 2) == "LD"
+    # The unplayed game does not count
+    assert stats.team("Team C")["games"] == 1
+    assert stats.team("Team D") is None
+
+
+def test_head_to_head_memoized():
+    """Test the head-to-head record and that queries are cached."""
+    stats = LeagueStatistics(DATA, 1)
+    record = stats.head_to_head("Team A", "Team B")
+    assert (record["wins"], record["losses"]) == (1, 1)
+    assert (record["sets_won"], record["sets_lost"]) == (3, 2)
+    assert [game["game_number"] for game in record["games"]] == ["1", "2"]
+    assert stats.head_to_head("team a", "team b") is record
+    assert stats.head_to_head("Team A", "Team D") is None
+
+
+@pytest.mark.asyncio
+async def test_sensors_and_service(hass: HomeAssistant):
+    """Test the statistics sensors and the query service."""
+    coordinator = MagicMock()
+    coordinator.liga_id = "1234"
+    coordinator.statistics = LeagueStatistics(DATA, 1)
+
+    assert DieligaFormSensor(coordinator, "Team B").native_value == "LW"
+    ppg = DieligaPointsPerGameSensor(coordinator, "Team A")
+    assert ppg.native_value == 1.0
+    assert ppg.extra_state_attributes["home_games"] == 2
+
+    hass.data[DOMAIN] = {"entry": coordinator}
+    async_setup_services(hass)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "get_team_statistics",
+        {"team": "Team A", "opponent": "Team C"},
+        blocking=True,
+        return_response=True,
+    )
+    result = response["leagues"]["1234"]
+    assert result["form"] == "WLD"
+    assert result["head_to_head"]["draws"] == 1
@@ -0,0 +1,126 @@
+"""Tests for the upstream version lookups of the template update script."""
+
+import importlib.util
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / ".github" / "scripts" / "update_templates.py"
+spec = importlib.util.spec_from_file_location("update_templates", SCRIPT)
+update_templates = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(update_templates)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve a version as JSON, honour If-None-Match and answer /slow late."""
+
+    requests: ClassVar[list[tuple[str, str | None]]] = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("If-None-Match")))
+        if self.path == "/slow":
+            time.sleep(1)
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        body = json.dumps({"info": {"version": "2026.7.0"}}).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    """Stand-in server whose close waits for the slow handler to answer."""
+
+    daemon_threads = False
+
+
+@pytest.fixture
+def server(socket_enabled):
+    """Run a local stand-in for the upstream version APIs."""
+    _Handler.requests = []
+    before = set(threading.enumerate())
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    # Lookups that missed the deadline time out on their own right after it
+    lookups = [
+        running
+        for running in set(threading.enumerate()) - before
+        if running.name.startswith("lookup ")
+    ]
+    for lookup in lookups:
+        lookup.join(0.4)
+        assert not lookup.is_alive()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _source(url, fallback="1.0.0"):
+    return update_templates.VersionSource(
+        "Test", url, lambda data: data["info"]["version"], fallback
+    )
+
+
+def test_fetch_concurrently_within_deadline(server):
+    """Test that sources are fetched in parallel and late ones fall back."""
+    sources = {
+        "fast": _source(f"{server}/fast"),
+        "other": _source(f"{server}/other"),
+        "slow": _source(f"{server}/slow", fallback="0.9.0"),
+    }
+    start = time.monotonic()
+    versions = update_templates.fetch_versions(sources, deadline=0.5)
+    assert time.monotonic() - start < 0.9
+    assert versions == {"fast": "2026.7.0", "other": "2026.7.0", "slow": "0.9.0"}
+
+
+def test_cache_ttl_and_conditional_requests(server, tmp_path):
+    """Test that fresh answers skip the network and stale ones revalidate."""
+    path = str(tmp_path / "versions.json")
+    sources = {"ha": _source(f"{server}/ha")}
+
+    cache = update_templates.VersionCache(path)
+    assert update_templates.fetch_versions(sources, cache=cache) == {"ha": "2026.7.0"}
+    assert _Handler.requests == [("/ha", None)]
+
+    # Fresh from disk: no request at all
+    cache = update_templates.VersionCache(path)
+    assert update_templates.fetch_versions(sources, cache=cache) == {"ha": "2026.7.0"}
+    assert len(_Handler.requests) == 1
+
+    # Stale: a conditional request, answered with 304
+    cache = update_templates.VersionCache(path)
+    assert update_templates.fetch_versions(sources, cache=cache, ttl=0) == {
+        "ha": "2026.7.0"
+    }
+    assert _Handler.requests[1] == ("/ha", '"v1"')
+
+
+def test_failures_use_cached_answer(tmp_path):
+    """Test that a failing fetch reuses the stale cached answer."""
+
+    def fetch(url, headers, timeout):
+        raise OSError("offline")
+
+    cache = update_templates.VersionCache(str(tmp_path / "versions.json"))
+    cache.entries["https://example.com"] = {"value": "2026.5.0", "fetched": 0}
+    sources = {
+        "cached": _source("https://example.com"),
+        "new": _source("https://example.org", fallback="0.1.0"),
+    }
+    versions = update_templates.fetch_versions(sources, fetch=fetch, cache=cache)
+    assert versions == {"cached": "2026.5.0", "new": "0.1.0"}
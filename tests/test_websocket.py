@@ -0,0 +1,149 @@
+"""Tests for the dieLiga websocket commands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.dieliga.const import DOMAIN
+from custom_components.dieliga.websocket_api import (
+    websocket_games,
+    websocket_subscribe_games,
+    websocket_table,
+)
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+from .test_init import SCHEDULE_URL, SCOREBOARD_URL, _mock_entry
+
+SECOND_GAME = """
+        <game>
+            <gamenr>102</gamenr>
+            <date>2026-01-08</date>
+            <new_date>-</new_date>
+            <time>10:00</time>
+            <team_a name="Team 2" points="0" sets="0" balls="0" />
+            <team_b name="Team 3" points="0" sets="0" balls="0" />
+            <state>Scheduled</state>
+        </game>
+"""
+
+
+def _schedule(*games: str) -> str:
+    """Return the test schedule with additional games on its matchday."""
+    return SCHEDULE_XML.replace("</day_of_play>", "".join(games) + "</day_of_play>")
+
+
+def _connection() -> MagicMock:
+    """Return a websocket connection recording the messages sent to it."""
+    connection = MagicMock()
+    connection.subscriptions = {}
+    return connection
+
+
+def _call(handler, hass: HomeAssistant, connection: MagicMock, msg: dict) -> None:
+    """Validate a message against the command's schema and handle it."""
+    handler(hass, connection, handler._ws_schema({"id": 1, **msg}))
+
+
+async def _async_setup(hass: HomeAssistant, aioclient_mock, schedule: str):
+    """Set up a dieLiga entry serving the given schedule."""
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=schedule)
+    entry = _mock_entry(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.asyncio
+async def test_games_paginated(hass: HomeAssistant, aioclient_mock):
+    """Test that games are filtered by the indexes and served page by page."""
+    entry = await _async_setup(hass, aioclient_mock, _schedule(SECOND_GAME))
+    connection = _connection()
+
+    _call(
+        websocket_games,
+        hass,
+        connection,
+        {"type": "dieliga/games", "entry_id": entry.entry_id, "page_size": 1},
+    )
+    result = connection.send_result.call_args.args[1]
+    assert result["total"] == 2
+    assert result["pages"] == 2
+    assert [game["game_number"] for game in result["items"]] == ["101"]
+
+    _call(
+        websocket_games,
+        hass,
+        connection,
+        {
+            "type": "dieliga/games",
+            "entry_id": entry.entry_id,
+            "team": "team 3",
+            "start_date": "2026-01-02",
+            "state": "scheduled",
+        },
+    )
+    result = connection.send_result.call_args.args[1]
+    assert [game["game_number"] for game in result["items"]] == ["102"]
+
+    _call(
+        websocket_table,
+        hass,
+        connection,
+        {"type": "dieliga/table", "entry_id": entry.entry_id, "team": "team 1"},
+    )
+    result = connection.send_result.call_args.args[1]
+    assert [(row["position"], row["name"]) for row in result["items"]] == [
+        (1, "Team 1")
+    ]
+
+    _call(websocket_games, hass, connection, {"type": "dieliga/games", "entry_id": "x"})
+    assert connection.send_error.call_args.args[1] == "not_found"
+
+
+@pytest.mark.asyncio
+async def test_subscribe_games_pushes_diffs(hass: HomeAssistant, aioclient_mock):
+    """Test that a subscription sends all games once and then only changes."""
+    entry = await _async_setup(hass, aioclient_mock, SCHEDULE_XML)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    connection = _connection()
+    listeners = len(coordinator._listeners)
+
+    _call(
+        websocket_subscribe_games,
+        hass,
+        connection,
+        {"type": "dieliga/subscribe_games", "entry_id": entry.entry_id},
+    )
+    connection.send_result.assert_called_once_with(1)
+    event = connection.send_message.call_args.args[0]["event"]
+    assert [game["game_number"] for game in event["added"]] == ["101"]
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(SCOREBOARD_URL, text=SCOREBOARD_XML)
+    aioclient_mock.get(SCHEDULE_URL, text=_schedule(SECOND_GAME))
+    await coordinator.async_refresh()
+
+    event = connection.send_message.call_args.args[0]["event"]
+    assert [game["game_number"] for game in event["added"]] == ["102"]
+    assert event["changed"] == []
+    assert event["removed"] == []
+
+    # A refresh without changes sends nothing
+    await coordinator.async_refresh()
+    assert connection.send_message.call_count == 2
+
+    connection.subscriptions[1]()
+    assert len(coordinator._listeners) == listeners
+
+
+@pytest.mark.asyncio
+async def test_large_attributes_disabled(hass: HomeAssistant, aioclient_mock):
+    """Test that the table and schedule can be left out of the attributes."""
+    entry = await _async_setup(hass, aioclient_mock, SCHEDULE_XML)
+    hass.config_entries.async_update_entry(entry, options={"large_attributes": False})
+    await hass.async_block_till_done()
+
+    assert "games" not in hass.states.get("sensor.dieliga_schedule_1234").attributes
+    assert "teams" not in hass.states.get("sensor.dieliga_scoreboard_1234").attributes
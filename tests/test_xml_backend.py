@@ -0,0 +1,77 @@
+"""Tests for the dieLiga XML parser backends."""
+
+import pytest
+
+from custom_components.dieliga.api import DieligaApiClient
+from custom_components.dieliga.xml_backend import (
+    BACKEND_AUTO,
+    BACKEND_ELEMENTTREE,
+    BACKEND_LXML,
+    available_backends,
+    get_backend,
+)
+
+from .test_api import SCHEDULE_XML, SCOREBOARD_XML
+
+EDGE_CASE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<results>
+    <!-- generated -->
+    <group>Gruppe Süd</group>
+    <day_of_play>
+        <game>
+            <gamenr>7</gamenr>
+            <date>2026-02-01</date>
+            <new_date></new_date>
+            <team_a name="Müller &amp; Söhne" />
+            <team_b />
+        </game>
+        <game />
+    </day_of_play>
+</results>
+"""
+
+BROKEN_XML = """
+<results>
+    <group>Group A</group>
+    <day_of_play>
+        <game><gamenr>1</gamenr><date>2026-01-01</date></game>
+"""
+
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("payload", [SCHEDULE_XML, EDGE_CASE_XML])
+def test_schedule_parity(backend, payload):
+    """Test that every backend parses schedules like ElementTree."""
+    expected = DieligaApiClient(None, "https://example.com", BACKEND_ELEMENTTREE)
+    client = DieligaApiClient(None, "https://example.com", backend)
+
+    assert client._parse_schedule_xml(payload) == expected._parse_schedule_xml(payload)
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_scoreboard_parity(backend):
+    """Test that every backend parses scoreboards like ElementTree."""
+    expected = DieligaApiClient(None, "https://example.com", BACKEND_ELEMENTTREE)
+    client = DieligaApiClient(None, "https://example.com", backend)
+
+    assert client._parse_scoreboard_xml(
+        SCOREBOARD_XML
+    ) == expected._parse_scoreboard_xml(SCOREBOARD_XML)
+
+
+@pytest.mark.parametrize("backend", [BACKEND_AUTO, BACKEND_LXML])
+def test_lxml_recovers_broken_xml(backend):
+    """Test that lxml recovers truncated documents."""
+    pytest.importorskip("lxml")
+    client = DieligaApiClient(None, "https://example.com", backend)
+
+    data = client._parse_schedule_xml(BROKEN_XML)
+
+    assert data["group"] == "Group A"
+    assert data["games"][0]["game_number"] == "1"
+
+
+def test_unknown_backend():
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        get_backend("sax")